@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import collections
+import concurrent.futures
+import contextlib
 import functools
+import itertools
 import logging
+import multiprocessing
 import random
 import secrets
 import warnings
@@ -69,6 +73,16 @@ class PlandoItemBlock:
     count: dict[str, int] = dataclasses.field(default_factory=dict)
 
 
+class SphereAnalysis(NamedTuple):
+    """Result of a single sweep through all filled locations of a MultiWorld, starting from a fresh CollectionState."""
+    steps: List[Set[Location]]
+    """Locations in the order they were collected. Each step was reachable with the items of all previous steps."""
+    sendable_spheres: List[Set[Location]]
+    """The spheres yielded by MultiWorld.get_sendable_spheres."""
+    state: CollectionState
+    """The state after collecting the items of all reachable locations."""
+
+
 class MultiWorld():
     debug_types = False
     player_name: Dict[int, str]
@@ -99,6 +113,17 @@ class MultiWorld():
 
     game: Dict[int, str]
 
+    compact_collection_state: bool = False
+    """Whether CollectionStates of this multiworld use CompactItemCounter to store their item counts."""
+    shared_state_copies: bool = False
+    """
+    Whether copies of CollectionStates of this multiworld share their per player containers until either modifies
+    them, see CollectionState.make_items_exclusive.
+    """
+    location_dependency_index: LocationDependencyIndex
+    playthrough_processes: int = 1
+    """Number of processes to cull the spoiler playthrough in, only used on Linux where they can be forked."""
+
     random: random.Random
     per_slot_randoms: Utils.DeprecateDict[int, random.Random]
     """Deprecated. Please use `self.random` instead."""
@@ -169,6 +194,7 @@ class MultiWorld():
         self.indirect_connections = {}
         self.start_inventory_from_pool: Dict[int, Options.StartInventoryPool] = {}
         self.plando_item_blocks = {}
+        self.location_dependency_index = LocationDependencyIndex(self)
 
         for player in range(1, players + 1):
             def set_player_attr(attr: str, val) -> None:
@@ -592,11 +618,12 @@ class MultiWorld():
         """
         state = CollectionState(self)
         locations = set(self.get_filled_locations())
+        tracker = LocationDependencyTracker(state, locations)
 
         while locations:
             sphere: Set[Location] = set()
 
-            for location in locations:
+            for location in tracker.get_locations_to_check(locations):
                 if location.can_reach(state):
                     sphere.add(location)
             yield sphere
@@ -606,9 +633,22 @@ class MultiWorld():
                 break
 
             for location in sphere:
-                state.collect(location.item, True, location)
+                if state.collect(location.item, True, location):
+                    tracker.collected(location.item)
             locations -= sphere
 
+    sphere_analysis: Optional[SphereAnalysis] = None
+    """Set by analyze_spheres, only valid as long as items and rules don't change."""
+
+    def analyze_spheres(self) -> SphereAnalysis:
+        """
+        Sweeps through all filled locations once and stores the result as sphere_analysis.
+        While set, get_sendable_spheres, fulfills_accessibility without a state and the spoiler playthrough use it
+        instead of sweeping again. Has to be reset to None if items are moved or rules are changed afterwards.
+        """
+        self.sphere_analysis = self._analyze_spheres()
+        return self.sphere_analysis
+
     def get_sendable_spheres(self) -> Iterator[Set[Location]]:
         """
         yields a set of multiserver sendable locations (location.item.code: int) for each logical sphere
@@ -616,6 +656,9 @@ class MultiWorld():
         If there are unreachable locations, the last sphere of reachable locations is followed by an empty set,
         and then a set of all of the unreachable locations.
         """
+        yield from (self.sphere_analysis or self._analyze_spheres()).sendable_spheres
+
+    def _analyze_spheres(self) -> SphereAnalysis:
         state = CollectionState(self)
         locations: Set[Location] = set()
         events: Set[Location] = set()
@@ -624,36 +667,53 @@ class MultiWorld():
                 locations.add(location)
             else:
                 events.add(location)
+        # events and locations are checked at different times, so each gets its own view of the changes
+        event_tracker = LocationDependencyTracker(state, events)
+        tracker = LocationDependencyTracker(state, locations)
+        steps: List[Set[Location]] = []
+        sendable_spheres: List[Set[Location]] = []
 
-        while locations:
-            sphere: Set[Location] = set()
-
-            # cull events out
+        def cull_events() -> None:
             done_events: Set[Union[Location, None]] = {None}
             while done_events:
-                done_events = set()
-                for event in events:
-                    if event.can_reach(state):
-                        state.collect(event.item, True, event)
-                        done_events.add(event)
-                events -= done_events
+                done_events = {event for event in event_tracker.get_locations_to_check(events)
+                               if event.can_reach(state)}
+                # collected after checking, so events of a step never depend on each other
+                for event in done_events:
+                    if state.collect(event.item, True, event):
+                        event_tracker.collected(event.item)
+                        tracker.collected(event.item)
+                events.difference_update(done_events)
+                if done_events:
+                    steps.append(done_events)
 
-            for location in locations:
+        while locations:
+            sphere: Set[Location] = set()
+
+            cull_events()
+            for location in tracker.get_locations_to_check(locations):
                 if location.can_reach(state):
                     sphere.add(location)
 
-            yield sphere
+            sendable_spheres.append(sphere)
             if not sphere:
                 if locations:
-                    yield locations  # unreachable locations
+                    sendable_spheres.append(locations)  # unreachable locations
                 break
 
+            steps.append(sphere)
             for location in sphere:
-                state.collect(location.item, True, location)
+                if state.collect(location.item, True, location):
+                    event_tracker.collected(location.item)
+                    tracker.collected(location.item)
             locations -= sphere
+        # events that only become reachable after the last sendable sphere
+        cull_events()
+        return SphereAnalysis(steps, sendable_spheres, state)
 
     def fulfills_accessibility(self, state: Optional[CollectionState] = None):
         """Check if accessibility rules are fulfilled with current or supplied state."""
+        sphere_analysis = None if state else self.sphere_analysis
         if not state:
             state = CollectionState(self)
         players: Dict[str, Set[int]] = {
@@ -685,6 +745,26 @@ class MultiWorld():
 
         locations = [location for location in self.get_locations() if location_relevant(location)]
 
+        if sphere_analysis:
+            # the analysis already swept everything reachable, only unfilled locations still have to be checked
+            state = sphere_analysis.state
+            reached = {location for step in sphere_analysis.steps for location in step}
+            locations = [location for location in locations if location not in reached
+                         and (location.item or not location.can_reach(state))]
+            beatable_fulfilled = self.has_beaten_game(state)
+            if all_done():
+                return True
+            if locations:
+                if __debug__:
+                    from Fill import FillError
+                    raise FillError(
+                        f"Could not access required locations for accessibility check. Missing: {locations}",
+                        multiworld=self,
+                    )
+                logging.warning(f"Could not access required locations for accessibility check."
+                                f" Missing: {locations}")
+            return False
+
         while locations:
             sphere: List[Location] = []
             for n in range(len(locations) - 1, -1, -1):
@@ -719,6 +799,295 @@ class MultiWorld():
 PathValue = Tuple[str, Optional["PathValue"]]
 
 
+class CompactItemCounter(Dict[str, int]):
+    """
+    Counter compatible item counts of a single player, that are cheaper to copy than a Counter.
+
+    The counts are stored in the dict itself without any Python level lookup, so has() and count() are plain dict
+    lookups for items that are present. Copying clones the dict directly, instead of going through Counter.__init__.
+    Arithmetic operators return regular Counters, as their results don't belong to a CollectionState.
+    """
+    __slots__ = ()
+
+    def __missing__(self, item: str) -> int:
+        return 0
+
+    def __delitem__(self, item: str) -> None:
+        # like Counter, does not raise KeyError for missing items
+        if item in self:
+            super().__delitem__(item)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        # like Counter, missing items are equal to items with a count of 0
+        return ({item: count for item, count in self.items() if count} ==
+                {item: count for item, count in other.items() if count})
+
+    def __ne__(self, other: object) -> bool:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict(self)})"
+
+    def copy(self) -> CompactItemCounter:
+        return self.__class__(self)
+
+    __copy__ = copy
+
+    def _to_counter(self) -> Counter[str]:
+        return Counter(dict(self))
+
+    def update(self, other: Union[Mapping[str, int], Iterable[str], None] = None, /, **kwargs: int) -> None:
+        """Like Counter.update, adds counts instead of replacing them."""
+        if other is not None:
+            if isinstance(other, Mapping):
+                for item, count in other.items():
+                    self[item] += count
+            else:
+                for item in other:
+                    self[item] += 1
+        for item, count in kwargs.items():
+            self[item] += count
+
+    def subtract(self, other: Union[Mapping[str, int], Iterable[str], None] = None, /, **kwargs: int) -> None:
+        """Like Counter.subtract, subtracts counts, which can result in negative counts."""
+        if other is not None:
+            if isinstance(other, Mapping):
+                for item, count in other.items():
+                    self[item] -= count
+            else:
+                for item in other:
+                    self[item] -= 1
+        for item, count in kwargs.items():
+            self[item] -= count
+
+    def total(self) -> int:
+        return sum(self.values())
+
+    def most_common(self, n: Optional[int] = None) -> List[Tuple[str, int]]:
+        return self._to_counter().most_common(n)
+
+    def elements(self) -> Iterator[str]:
+        return self._to_counter().elements()
+
+    def _replace(self, counter: Counter[str]) -> CompactItemCounter:
+        self.clear()
+        dict.update(self, counter)
+        return self
+
+    def __add__(self, other: Counter[str]) -> Counter[str]:
+        return self._to_counter() + Counter(other)
+
+    def __sub__(self, other: Counter[str]) -> Counter[str]:
+        return self._to_counter() - Counter(other)
+
+    def __or__(self, other: Counter[str]) -> Counter[str]:  # type: ignore[override]
+        return self._to_counter() | Counter(other)
+
+    def __and__(self, other: Counter[str]) -> Counter[str]:
+        return self._to_counter() & Counter(other)
+
+    def __radd__(self, other: Counter[str]) -> Counter[str]:
+        return Counter(other) + self._to_counter()
+
+    def __rsub__(self, other: Counter[str]) -> Counter[str]:
+        return Counter(other) - self._to_counter()
+
+    def __ror__(self, other: Counter[str]) -> Counter[str]:  # type: ignore[override]
+        return Counter(other) | self._to_counter()
+
+    def __rand__(self, other: Counter[str]) -> Counter[str]:
+        return Counter(other) & self._to_counter()
+
+    def __pos__(self) -> Counter[str]:
+        return +self._to_counter()
+
+    def __neg__(self) -> Counter[str]:
+        return -self._to_counter()
+
+    def __iadd__(self, other: Counter[str]) -> CompactItemCounter:
+        return self._replace(self + other)
+
+    def __isub__(self, other: Counter[str]) -> CompactItemCounter:
+        return self._replace(self - other)
+
+    def __ior__(self, other: Counter[str]) -> CompactItemCounter:  # type: ignore[override]
+        return self._replace(self | other)
+
+    def __iand__(self, other: Counter[str]) -> CompactItemCounter:
+        return self._replace(self & other)
+
+
+class LocationDependencyIndex:
+    """
+    Generation-wide reverse index from item names and regions to the locations whose reachability depends on them.
+
+    Locations using the default access rule only depend on their parent region. Rule builder rules are analyzed through
+    their item and region dependencies, as long as the world only collects items under their own name or
+    `item_mapping`. Locations with any other access rule, or whose Location or Region class overrides `can_reach`,
+    can't be analyzed and always have to be re-checked.
+    """
+    multiworld: MultiWorld
+    always_checked: Set[Location]
+    """Locations that have to be re-checked whenever anything changes."""
+
+    _indexed: Dict[Location, Tuple[CollectionRule, Optional[Region]]]
+    _memberships: Dict[Location, List[Set[Location]]]
+    _item_dependents: Dict[int, Dict[str, Set[Location]]]
+    _region_dependents: Dict[Region, Set[Location]]
+    _item_mappings: Dict[int, Optional[Mapping[str, str]]]
+
+    def __init__(self, multiworld: MultiWorld) -> None:
+        self.multiworld = multiworld
+        self.always_checked = set()
+        self._indexed = {}
+        self._memberships = {}
+        self._item_dependents = defaultdict(lambda: defaultdict(set))
+        self._region_dependents = defaultdict(set)
+        self._item_mappings = {}
+
+    def _get_item_mapping(self, player: int) -> Optional[Mapping[str, str]]:
+        """Returns the mapping of item name to the name it is collected under, or None if it can't be known."""
+        if player not in self._item_mappings:
+            from worlds.AutoWorld import World
+            world = self.multiworld.worlds[player]
+            world_type = type(world)
+            if getattr(world, "rule_caching_enabled", False):
+                # rule caching already relies on collected items only changing their own or their mapped name
+                self._item_mappings[player] = getattr(world, "item_mapping", {})
+            elif world_type.collect is World.collect and world_type.collect_item is World.collect_item:
+                self._item_mappings[player] = {}
+            else:
+                self._item_mappings[player] = None
+        return self._item_mappings[player]
+
+    def _get_dependencies(self, location: Location) -> Optional[Tuple[Set[str], Set[Region]]]:
+        from rule_builder.rules import Rule
+        if type(location).can_reach is not Location.can_reach or \
+                type(location.parent_region).can_reach is not Region.can_reach:
+            # reachability isn't only decided by the access rule and reachable regions of the state
+            return None
+        rule = location.access_rule
+        if rule is DEFAULT_COLLECTION_RULE.__func__:  # type: ignore[attr-defined]
+            return set(), set()
+        if not isinstance(rule, Rule.Resolved) or rule.force_recalculate or rule.player != location.player:
+            return None
+        if rule.location_dependencies() or rule.entrance_dependencies():
+            return None
+        item_names = set(rule.item_dependencies())
+        if item_names and self._get_item_mapping(location.player) is None:
+            return None
+        try:
+            regions = {self.multiworld.get_region(region_name, location.player)
+                       for region_name in rule.region_dependencies()}
+        except KeyError:
+            return None
+        return item_names, regions
+
+    def _index(self, location: Location) -> None:
+        memberships: List[Set[Location]] = []
+        self._indexed[location] = (location.access_rule, location.parent_region)
+        self._memberships[location] = memberships
+        dependencies = self._get_dependencies(location) if location.parent_region else None
+        if dependencies is None:
+            memberships.append(self.always_checked)
+        else:
+            item_names, regions = dependencies
+            item_dependents = self._item_dependents[location.player]
+            memberships.extend(item_dependents[item_name] for item_name in item_names)
+            memberships.extend(self._region_dependents[region] for region in regions | {location.parent_region})
+        for dependents in memberships:
+            dependents.add(location)
+
+    def refresh(self, locations: Iterable[Location]) -> None:
+        """Indexes `locations`, re-indexing those whose access rule or parent region changed since they were indexed."""
+        for location in locations:
+            indexed = self._indexed.get(location)
+            if indexed is not None:
+                if indexed[0] is location.access_rule and indexed[1] is location.parent_region:
+                    continue
+                for dependents in self._memberships[location]:
+                    dependents.discard(location)
+            self._index(location)
+
+    def get_item_names(self, item: Item) -> Tuple[str, ...]:
+        """Returns the item names that may change in state when collecting `item`."""
+        mapping = self._get_item_mapping(item.player)
+        if mapping and item.name in mapping:
+            return item.name, mapping[item.name]
+        return item.name,
+
+    def get_dependents(self, player: int, item_names: Iterable[str], regions: Iterable[Region]) -> Set[Location]:
+        """Returns the indexed locations of `player` depending on any of `item_names` or `regions`."""
+        dependents: Set[Location] = set()
+        item_dependents = self._item_dependents[player]
+        for item_name in item_names:
+            if item_name in item_dependents:
+                dependents |= item_dependents[item_name]
+        for region in regions:
+            if region in self._region_dependents:
+                dependents |= self._region_dependents[region]
+        return dependents
+
+
+class LocationDependencyTracker:
+    """Keeps track of the changes to a CollectionState, to know which locations have to be re-checked after them."""
+    index: LocationDependencyIndex
+    state: CollectionState
+    _collected_names: Dict[int, Set[str]]
+    _known_regions: Dict[int, Set[Region]]
+
+    def __init__(self, state: CollectionState, locations: Iterable[Location]) -> None:
+        self.index = state.multiworld.location_dependency_index
+        self.index.refresh(locations)
+        self.state = state
+        self._collected_names = defaultdict(set)
+        self._known_regions = {}
+
+    def collected(self, item: Item) -> None:
+        """Records that `item` was collected into the state."""
+        self._collected_names[item.player].update(self.index.get_item_names(item))
+
+    def get_changed(self, player: int) -> Optional[Set[Location]]:
+        """
+        Returns the indexed locations of `player` that have to be re-checked since the last call for this player, or
+        None on the first call, when all of them have to be checked.
+        Locations in `index.always_checked` have to be re-checked regardless.
+        """
+        state = self.state
+        if state.stale[player]:
+            state.update_reachable_regions(player)
+        reachable_regions = state.reachable_regions[player]
+        known_regions = self._known_regions.get(player)
+        item_names = self._collected_names.pop(player, ())
+        if known_regions is None:
+            self._known_regions[player] = set(reachable_regions)
+            return None
+        new_regions: List[Region] = []
+        if len(reachable_regions) != len(known_regions):
+            new_regions = [region for region in reachable_regions if region not in known_regions]
+            known_regions.update(new_regions)
+        if not item_names and not new_regions:
+            return set()
+        return self.index.get_dependents(player, item_names, new_regions)
+
+    def get_locations_to_check(self, locations: Set[Location]) -> Set[Location]:
+        """Returns the locations out of `locations`, of any player, that have to be re-checked."""
+        to_check = locations & self.index.always_checked
+        unknown_players: Set[int] = set()
+        for player in {location.player for location in locations}:
+            changed = self.get_changed(player)
+            if changed is None:
+                unknown_players.add(player)
+            elif changed:
+                to_check |= locations & changed
+        if unknown_players:
+            to_check |= {location for location in locations if location.player in unknown_players}
+        return to_check
+
+
 class CollectionState():
     prog_items: Dict[int, Counter[str]]
     multiworld: MultiWorld
@@ -730,13 +1099,20 @@ class CollectionState():
     """Internal cache for Advancement Locations already checked by this CollectionState. Not for use in logic."""
     stale: Dict[int, bool]
     allow_partial_entrances: bool
+    exclusive_items: Set[int]
+    """Players whose prog_items container isn't shared with a copy of this state and may be modified in place."""
+    exclusive_regions: Set[int]
+    """Players whose reachable_regions and blocked_connections containers aren't shared with a copy of this state."""
     additional_init_functions: List[Callable[[CollectionState, MultiWorld], None]] = []
     additional_copy_functions: List[Callable[[CollectionState, CollectionState], CollectionState]] = []
 
     def __init__(self, parent: MultiWorld, allow_partial_entrances: bool = False):
         assert parent.worlds, "CollectionState created without worlds initialized in parent"
-        self.prog_items = {player: Counter() for player in parent.get_all_ids()}
         self.multiworld = parent
+        if parent.compact_collection_state:
+            self.prog_items = {player: CompactItemCounter() for player in parent.get_all_ids()}
+        else:
+            self.prog_items = {player: Counter() for player in parent.get_all_ids()}
         self.reachable_regions = {player: set() for player in parent.get_all_ids()}
         self.blocked_connections = {player: set() for player in parent.get_all_ids()}
         self.advancements = set()
@@ -744,23 +1120,61 @@ class CollectionState():
         self.locations_checked = set()
         self.stale = {player: True for player in parent.get_all_ids()}
         self.allow_partial_entrances = allow_partial_entrances
+        self.exclusive_items = set(parent.get_all_ids())
+        self.exclusive_regions = set(parent.get_all_ids())
         for function in self.additional_init_functions:
             function(self, parent)
         for items in parent.precollected_items.values():
             for item in items:
                 self.collect(item, True)
 
-    def update_reachable_regions(self, player: int):
+    def make_items_exclusive(self, player: int) -> Counter[str]:
+        """
+        Copies the prog_items container of `player` if it's still shared with a copy of this state, and returns it.
+        With MultiWorld.shared_state_copies, this has to be called before modifying prog_items outside of collect,
+        remove, add_item, remove_item, set_item and World.collect and World.remove.
+        """
+        if player not in self.exclusive_items:
+            self.prog_items[player] = self.prog_items[player].copy()
+            self.exclusive_items.add(player)
+        return self.prog_items[player]
+
+    def make_regions_exclusive(self, player: int) -> Tuple[Set[Region], Set[Entrance]]:
+        """
+        Copies the reachable_regions and blocked_connections containers of `player` if they're still shared with a
+        copy of this state, and returns them.
+        With MultiWorld.shared_state_copies, this has to be called before modifying them outside of
+        update_reachable_regions and remove.
+        """
+        if player not in self.exclusive_regions:
+            self.reachable_regions[player] = self.reachable_regions[player].copy()
+            self.blocked_connections[player] = self.blocked_connections[player].copy()
+            self.exclusive_regions.add(player)
+        return self.reachable_regions[player], self.blocked_connections[player]
+
+    def update_reachable_regions(self, player: int, connections: Optional[Iterable[Entrance]] = None):
+        """
+        Searches for newly reachable regions of a player.
+
+        :param connections: If given, the search starts from these connections instead of all blocked connections.
+        Only valid if nothing but these connections changed since the last update, like when connecting exits.
+        """
         self.stale[player] = False
         world: AutoWorld.World = self.multiworld.worlds[player]
         reachable_regions = self.reachable_regions[player]
-        queue = deque(self.blocked_connections[player])
+        blocked_connections = self.blocked_connections[player]
+        if connections is None:
+            queue = deque(blocked_connections)
+        else:
+            # connections that aren't blocked are either unreachable, or were already searched
+            queue = deque(connection for connection in connections if connection in blocked_connections)
         start: Region = world.get_region(world.origin_region_name)
 
         # init on first call - this can't be done on construction since the regions don't exist yet
         if start not in reachable_regions:
+            reachable_regions, blocked_connections = self.make_regions_exclusive(player)
             reachable_regions.add(start)
-            self.blocked_connections[player].update(start.exits)
+            blocked_connections.update(start.exits)
             queue.extend(start.exits)
 
         if world.explicit_indirect_conditions:
@@ -772,15 +1186,18 @@ class CollectionState():
         reachable_regions = self.reachable_regions[player]
         blocked_connections = self.blocked_connections[player]
         # run BFS on all connections, and keep track of those blocked by missing items
+        # the containers may be shared with a copy of this state, so they're only copied once something changes
         while queue:
             connection = queue.popleft()
             new_region = connection.connected_region
             if new_region in reachable_regions:
+                reachable_regions, blocked_connections = self.make_regions_exclusive(player)
                 blocked_connections.remove(connection)
             elif connection.can_reach(self):
                 if self.allow_partial_entrances and not new_region:
                     continue
                 assert new_region, f"tried to search through an Entrance \"{connection}\" with no connected Region"
+                reachable_regions, blocked_connections = self.make_regions_exclusive(player)
                 reachable_regions.add(new_region)
                 blocked_connections.remove(connection)
                 blocked_connections.update(new_region.exits)
@@ -800,17 +1217,20 @@ class CollectionState():
         blocked_connections = self.blocked_connections[player]
         new_connection: bool = True
         # run BFS on all connections, and keep track of those blocked by missing items
+        # the containers may be shared with a copy of this state, so they're only copied once something changes
         while new_connection:
             new_connection = False
             while queue:
                 connection = queue.popleft()
                 new_region = connection.connected_region
                 if new_region in reachable_regions:
+                    reachable_regions, blocked_connections = self.make_regions_exclusive(player)
                     blocked_connections.remove(connection)
                 elif connection.can_reach(self):
                     if self.allow_partial_entrances and not new_region:
                         continue
                     assert new_region, f"tried to search through an Entrance \"{connection}\" with no connected Region"
+                    reachable_regions, blocked_connections = self.make_regions_exclusive(player)
                     reachable_regions.add(new_region)
                     blocked_connections.remove(connection)
                     blocked_connections.update(new_region.exits)
@@ -822,12 +1242,29 @@ class CollectionState():
             queue.extend(blocked_connections)
 
     def copy(self) -> CollectionState:
-        ret = CollectionState(self.multiworld)
-        ret.prog_items = {player: counter.copy() for player, counter in self.prog_items.items()}
-        ret.reachable_regions = {player: region_set.copy() for player, region_set in
-                                 self.reachable_regions.items()}
-        ret.blocked_connections = {player: entrance_set.copy() for player, entrance_set in
-                                   self.blocked_connections.items()}
+        # skip __init__, all of its per player containers would be replaced anyway
+        ret = CollectionState.__new__(CollectionState)
+        ret.multiworld = self.multiworld
+        ret.stale = dict.fromkeys(self.stale, True)
+        for function in self.additional_init_functions:
+            function(ret, self.multiworld)
+        if self.multiworld.shared_state_copies:
+            # per player containers are shared between both states, and each state copies them before modifying them
+            ret.prog_items = self.prog_items.copy()
+            ret.reachable_regions = self.reachable_regions.copy()
+            ret.blocked_connections = self.blocked_connections.copy()
+            ret.exclusive_items = set()
+            ret.exclusive_regions = set()
+            self.exclusive_items.clear()
+            self.exclusive_regions.clear()
+        else:
+            ret.prog_items = {player: counter.copy() for player, counter in self.prog_items.items()}
+            ret.reachable_regions = {player: region_set.copy() for player, region_set in
+                                     self.reachable_regions.items()}
+            ret.blocked_connections = {player: entrance_set.copy() for player, entrance_set in
+                                       self.blocked_connections.items()}
+            ret.exclusive_items = set(ret.prog_items)
+            ret.exclusive_regions = set(ret.reachable_regions)
         ret.advancements = self.advancements.copy()
         ret.path = self.path.copy()
         ret.locations_checked = self.locations_checked.copy()
@@ -874,6 +1311,10 @@ class CollectionState():
         """
         all_players = {player for player, _ in advancements_per_player}
         players_to_check = all_players
+        # Only locations whose dependencies changed since they were last checked have to be checked again.
+        tracker = LocationDependencyTracker(self, (location for _, locations in advancements_per_player
+                                                   for location in locations))
+        always_checked = tracker.index.always_checked
         # As an optimization, it is assumed that each player's world only logically depends on itself. However, worlds
         # are allowed to logically depend on other worlds, so once there are no more players that should be checked
         # under this assumption, an extra sweep iteration is performed that checks every player, to confirm that the
@@ -892,8 +1333,11 @@ class CollectionState():
                 # stale whenever one of their own items is collected into the state.
                 reachable_locations: List[Location] = []
                 unreachable_locations: List[Location] = []
+                changed = tracker.get_changed(player)
                 for location in locations:
-                    if location.can_reach(self):
+                    if changed is not None and location not in changed and location not in always_checked:
+                        unreachable_locations.append(location)
+                    elif location.can_reach(self):
                         # Locations containing items that do not belong to `player` could be collected immediately
                         # because they won't stale `player`'s region accessibility cache, but, for simplicity, all the
                         # items at reachable locations are collected in a single loop.
@@ -923,6 +1367,7 @@ class CollectionState():
                         # The player the item belongs to may be able to reach additional locations in the next sweep
                         # iteration.
                         next_players_to_check.add(item.player)
+                        tracker.collected(item)
 
             if not next_players_to_check:
                 if not checking_if_finished:
@@ -1119,6 +1564,7 @@ class CollectionState():
         if location:
             self.locations_checked.add(location)
 
+        self.make_items_exclusive(item.player)
         changed = self.multiworld.worlds[item.player].collect(self, item)
 
         self.stale[item.player] = True
@@ -1137,14 +1583,16 @@ class CollectionState():
         :param count: How many of the item to add.
         """
         assert count > 0
-        self.prog_items[player][item] += count
+        self.make_items_exclusive(player)[item] += count
 
     def remove(self, item: Item):
+        self.make_items_exclusive(item.player)
         changed = self.multiworld.worlds[item.player].remove(self, item)
         if changed:
             # invalidate caches, nothing can be trusted anymore now
             self.reachable_regions[item.player] = set()
             self.blocked_connections[item.player] = set()
+            self.exclusive_regions.add(item.player)
             self.stale[item.player] = True
 
     def remove_item(self, item: str, player: int, count: int = 1) -> None:
@@ -1156,9 +1604,10 @@ class CollectionState():
         :param count: How many of the item to remove.
         """
         assert count > 0
-        self.prog_items[player][item] -= count
-        if self.prog_items[player][item] < 1:
-            del (self.prog_items[player][item])
+        player_prog_items = self.make_items_exclusive(player)
+        player_prog_items[item] -= count
+        if player_prog_items[item] < 1:
+            del (player_prog_items[item])
 
     def set_item(self, item: str, player: int, count: int) -> None:
         """
@@ -1169,10 +1618,11 @@ class CollectionState():
         :param count: How many of the item to now have.
         """
         assert count >= 0
+        player_prog_items = self.make_items_exclusive(player)
         if count == 0:
-            del (self.prog_items[player][item])
+            del (player_prog_items[item])
         else:
-            self.prog_items[player][item] = count
+            player_prog_items[item] = count
 
 
 CollectionRule = Callable[[CollectionState], bool]
@@ -1668,6 +2118,23 @@ class Item:
         return f"{self.name} (Player {self.player})"
 
 
+_playthrough_culling: Optional[Tuple[MultiWorld, List[Optional[CollectionState]], List[Location]]] = None
+"""Set while a playthrough is culled in worker processes, which are forked so they don't have to unpickle it."""
+
+
+def _required_for_playthrough(num: int, required: List[int], candidates: List[int]) -> List[bool]:
+    """Returns for each candidate location index whether the game can't be beaten from a sphere without it."""
+    assert _playthrough_culling, "playthrough culling worker wasn't forked from create_playthrough"
+    multiworld, state_cache, locations = _playthrough_culling
+    required_locations = {locations[index] for index in required}
+    results: List[bool] = []
+    for index in candidates:
+        required_locations.remove(locations[index])
+        results.append(not multiworld.can_beat_game(state_cache[num], required_locations))
+        required_locations.add(locations[index])
+    return results
+
+
 class EntranceInfo(TypedDict, total=False):
     player: int
     entrance: str
@@ -1699,6 +2166,57 @@ class Spoiler:
             self.entrances[(entrance, direction, player)] = \
                 {"player": player, "entrance": entrance, "exit": exit_, "direction": direction}
 
+    def _cull_sphere(self, num: int, sphere: Set[Location], state_cache: List[Optional[CollectionState]],
+                     required_locations: Set[Location], pool: Optional[concurrent.futures.Executor],
+                     processes: int) -> None:
+        """
+        Removes the locations of a sphere that aren't required to beat the game from the sphere and from
+        required_locations. They're checked in location order, so the result is the same as when removing them one at a
+        time in that order.
+        """
+        multiworld = self.multiworld
+        candidates = sorted(sphere)
+        if pool and len(candidates) > 1:
+            # a location that is required now stays required once fewer locations remain,
+            # so each location can be checked on its own against the current required locations, in parallel
+            assert _playthrough_culling
+            indices = {location: index for index, location in enumerate(_playthrough_culling[2])}
+            required = [indices[location] for location in required_locations]
+            chunk_size = -(-len(candidates) // (processes * 4))
+            chunks = [[indices[location] for location in candidates[start:start + chunk_size]]
+                      for start in range(0, len(candidates), chunk_size)]
+            is_required = [result for results in pool.map(_required_for_playthrough, itertools.repeat(num),
+                                                           itertools.repeat(required), chunks)
+                           for result in results]
+            candidates = [location for location, location_required in zip(candidates, is_required)
+                          if not location_required]
+
+        def cull(group: List[Location], known_required: bool = False) -> bool:
+            # removes a group of locations at once, and only checks them in halves if the game can't be beaten without
+            # all of them. Fewer locations are never easier to beat the game with, so that gives the same result.
+            # Returns whether the whole group was removed.
+            if not known_required:
+                logging.debug('Checking if %s are required to beat the game.', group)
+                required_locations.difference_update(group)
+                if multiworld.can_beat_game(state_cache[num], required_locations):
+                    sphere.difference_update(group)
+                    return True
+                # still required, got to keep it around
+                required_locations.update(group)
+            if len(group) > 1:
+                half = len(group) // 2
+                # if the first half can be removed, the second half has to contain a required location
+                cull(group[half:], cull(group[:half]))
+            return False
+
+        # grow the groups while they can be removed, and start over from single locations once one can't
+        group_size = 1
+        start = 0
+        while start < len(candidates):
+            group = candidates[start:start + group_size]
+            start += len(group)
+            group_size = group_size * 2 if cull(group) else 1
+
     def create_playthrough(self, create_paths: bool = True) -> None:
         """Destructive to the multiworld while it is run, damage gets repaired afterwards."""
         from itertools import chain
@@ -1709,13 +2227,22 @@ class Spoiler:
         collection_spheres: List[Set[Location]] = []
         state = CollectionState(multiworld)
         sphere_candidates = set(prog_locations)
+        # the steps of a sphere analysis are already in collection order, so the first phase doesn't have to sweep
+        analysis_steps = iter(multiworld.sphere_analysis.steps) if multiworld.sphere_analysis else None
         logging.debug('Building up collection spheres.')
         while sphere_candidates:
 
             # build up spheres of collection radius.
             # Everything in each sphere is independent from each other in dependencies and only depends on lower spheres
 
-            sphere = {location for location in sphere_candidates if state.can_reach(location)}
+            if analysis_steps is None:
+                sphere = {location for location in sphere_candidates if state.can_reach(location)}
+            else:
+                sphere = set()
+                for step in analysis_steps:
+                    sphere = {location for location in step if location in sphere_candidates}
+                    if sphere:
+                        break
 
             for location in sphere:
                 state.collect(location.item, True, location)
@@ -1742,21 +2269,18 @@ class Spoiler:
         # in the second phase, we cull each sphere such that the game is still beatable,
         # reducing each range of influence to the bare minimum required inside it
         required_locations = {location for sphere in collection_spheres for location in sphere}
-        for num, sphere in reversed(tuple(enumerate(collection_spheres))):
-            to_delete: Set[Location] = set()
-            for location in sphere:
-                # we remove the location from required_locations to sweep from, and check if the game is still beatable
-                logging.debug('Checking if %s (Player %d) is required to beat the game.', location.item.name,
-                              location.item.player)
-                required_locations.remove(location)
-                if multiworld.can_beat_game(state_cache[num], required_locations):
-                    to_delete.add(location)
-                else:
-                    # still required, got to keep it around
-                    required_locations.add(location)
-
-            # cull entries in spheres for spoiler walkthrough at end
-            sphere -= to_delete
+        # worker processes are forked, so they share the multiworld and the state cache without pickling them.
+        # fork is only safe on Linux, macOS offers it but system frameworks may crash in forked processes
+        processes = multiworld.playthrough_processes if Utils.is_linux else 1
+        global _playthrough_culling
+        _playthrough_culling = multiworld, state_cache, sorted(required_locations)
+        try:
+            with (concurrent.futures.ProcessPoolExecutor(processes, multiprocessing.get_context("fork"))
+                  if processes > 1 else contextlib.nullcontext()) as pool:
+                for num, sphere in reversed(tuple(enumerate(collection_spheres))):
+                    self._cull_sphere(num, sphere, state_cache, required_locations, pool, processes)
+        finally:
+            _playthrough_culling = None
 
         # second phase, sphere 0
         removed_precollected: List[Item] = []
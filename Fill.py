@@ -33,11 +33,85 @@ def sweep_from_pool(base_state: CollectionState, itempool: typing.Sequence[Item]
     return new_state
 
 
+class IncrementalSweep:
+    """
+    Produces the same states as `sweep_from_pool(base_state, itempool)`, but keeps the part of the sweep that does not
+    depend on the item pool alive between calls.
+
+    While filling, items only move from the pool onto locations, so the state reachable from `base_state` with only the
+    already placed items (the "pool-free" state) only ever grows. It is extended with newly placed items when they are
+    reachable, and each call then only has to collect and sweep for the current pool on top of it.
+    Removing an item from a location that was collected into the pool-free state invalidates it, in which case it gets
+    rebuilt from `base_state` on the next call.
+    """
+    base_state: CollectionState
+    _pool_free_states: typing.Dict[typing.Optional[int], CollectionState]
+    """Pool-free states, keyed by the player the swept locations were restricted to, or None for all players."""
+    _pending_placements: typing.Dict[typing.Optional[int], typing.List[Location]]
+    """Locations filled since the matching pool-free state was last updated."""
+
+    def __init__(self, base_state: CollectionState) -> None:
+        self.base_state = base_state
+        self._pool_free_states = {}
+        self._pending_placements = {}
+
+    def _sweep_locations(self, player: typing.Optional[int]) -> typing.Optional[typing.List[Location]]:
+        return None if player is None else self.base_state.multiworld.get_filled_locations(player)
+
+    def _get_pool_free_state(self, player: typing.Optional[int]) -> CollectionState:
+        state = self._pool_free_states.get(player)
+        if state is None:
+            state = sweep_from_pool(self.base_state, (), self._sweep_locations(player))
+            self._pool_free_states[player] = state
+            self._pending_placements[player] = []
+            return state
+
+        pending = self._pending_placements[player]
+        if pending:
+            newly_reachable = [location for location in pending
+                               if location.advancement and location not in state.advancements
+                               and location.can_reach(state)]
+            pending.clear()
+            if newly_reachable:
+                for location in newly_reachable:
+                    state.advancements.add(location)
+                    state.collect(location.item, True, location)
+                # collecting may have unlocked previously unreachable locations
+                state.sweep_for_advancements(self._sweep_locations(player))
+        return state
+
+    def add_placement(self, location: Location) -> None:
+        """Report that `location` has been filled, so its item can be swept into the pool-free states."""
+        for player, pending in self._pending_placements.items():
+            if player is None or player == location.player:
+                pending.append(location)
+
+    def remove_placement(self, location: Location) -> None:
+        """Report that the item of `location` has been removed or replaced."""
+        for player, state in tuple(self._pool_free_states.items()):
+            if location in state.advancements:
+                del self._pool_free_states[player]
+                del self._pending_placements[player]
+
+    def is_independent_of(self, location: Location, player: typing.Optional[int] = None) -> bool:
+        """Whether the kept pool-free state would remain valid with the item at `location` temporarily removed."""
+        state = self._pool_free_states.get(player)
+        return state is not None and location not in state.advancements
+
+    def sweep_from_pool(self, itempool: typing.Sequence[Item] = tuple(),
+                        player: typing.Optional[int] = None) -> CollectionState:
+        """
+        Equivalent to `sweep_from_pool(self.base_state, itempool, locations)` where locations are the filled locations
+        of `player`, or all locations when `player` is None.
+        """
+        return sweep_from_pool(self._get_pool_free_state(player), itempool, self._sweep_locations(player))
+
+
 def fill_restrictive(multiworld: MultiWorld, base_state: CollectionState, locations: typing.List[Location],
                      item_pool: typing.List[Item], single_player_placement: bool = False, lock: bool = False,
                      swap: bool = True, on_place: typing.Optional[typing.Callable[[Location], None]] = None,
                      allow_partial: bool = False, allow_excluded: bool = False, one_item_per_player: bool = True,
-                     name: str = "Unknown") -> None:
+                     name: str = "Unknown", sweep: typing.Optional[IncrementalSweep] = None) -> None:
     """
     :param multiworld: Multiworld to be filled.
     :param base_state: State assumed before fill.
@@ -50,7 +124,11 @@ def fill_restrictive(multiworld: MultiWorld, base_state: CollectionState, locati
     :param allow_partial: only place what is possible. Remaining items will be in the item_pool list.
     :param allow_excluded: if true and placement fails, it is re-attempted while ignoring excluded on Locations
     :param name: name of this fill step for progress logging purposes
+    :param sweep: incremental sweep of base_state to reuse, e.g. to share it with a previous sweep of the caller
     """
+    if sweep is None:
+        sweep = IncrementalSweep(base_state)
+    assert sweep.base_state is base_state, "IncrementalSweep has to be created from base_state"
     unplaced_items: typing.List[Item] = []
     placements: typing.List[Location] = []
     cleanup_required = False
@@ -82,9 +160,8 @@ def fill_restrictive(multiworld: MultiWorld, base_state: CollectionState, locati
                     del item_pool[-p]
                     break
 
-        maximum_exploration_state = sweep_from_pool(
-            base_state, item_pool + unplaced_items, multiworld.get_filled_locations(item.player)
-            if single_player_placement else None)
+        sweep_player = item.player if single_player_placement else None
+        maximum_exploration_state = sweep.sweep_from_pool(item_pool + unplaced_items, sweep_player)
 
         has_beaten_game = multiworld.has_beaten_game(maximum_exploration_state)
 
@@ -155,9 +232,15 @@ def fill_restrictive(multiworld: MultiWorld, base_state: CollectionState, locati
                                 break
                         else:
                             # No previous swap_state was usable as a base state to sweep from, so create a new one.
-                            swap_state = sweep_from_pool(base_state, [placed_item, *item_pool] if unsafe else item_pool,
-                                                         multiworld.get_filled_locations(item.player)
-                                                         if single_player_placement else None)
+                            swap_pool = [placed_item, *item_pool] if unsafe else item_pool
+                            if sweep.is_independent_of(location, sweep_player):
+                                # The pool-free state did not collect the item being swapped out, so it can be
+                                # swept from instead of `base_state`.
+                                swap_state = sweep.sweep_from_pool(swap_pool, sweep_player)
+                            else:
+                                swap_state = sweep_from_pool(base_state, swap_pool,
+                                                             multiworld.get_filled_locations(item.player)
+                                                             if single_player_placement else None)
                             # Unsafe states should not be added to the cache because they have collected `placed_item`.
                             if not unsafe:
                                 if len(previous_safe_swap_state_cache) >= max_swap_base_state_cache_length:
@@ -173,6 +256,7 @@ def fill_restrictive(multiworld: MultiWorld, base_state: CollectionState, locati
                             # Add this item to the existing placement, and
                             # add the old item to the back of the queue
                             spot_to_fill = placements.pop(i)
+                            sweep.remove_placement(spot_to_fill)
 
                             swap_count += 1
                             swapped_items[placed_item.player, placed_item.name, unsafe] = swap_count
@@ -200,6 +284,7 @@ def fill_restrictive(multiworld: MultiWorld, base_state: CollectionState, locati
             multiworld.push_item(spot_to_fill, item_to_place, False)
             spot_to_fill.locked = lock
             placements.append(spot_to_fill)
+            sweep.add_placement(spot_to_fill)
             placed += 1
             if not placed % 1000:
                 _log_fill_progress(name, placed, total)
@@ -211,15 +296,14 @@ def fill_restrictive(multiworld: MultiWorld, base_state: CollectionState, locati
 
     if cleanup_required:
         # validate all placements and remove invalid ones
-        state = sweep_from_pool(
-            base_state, [], multiworld.get_filled_locations(item.player)
-            if single_player_placement else None)
+        state = sweep.sweep_from_pool((), item.player if single_player_placement else None)
         for placement in placements:
             if multiworld.worlds[placement.item.player].options.accessibility != "minimal" and not placement.can_reach(state):
                 placement.item.location = None
                 unplaced_items.append(placement.item)
                 placement.item = None
                 locations.append(placement)
+                sweep.remove_placement(placement)
 
     if allow_excluded:
         # check if partial fill is the result of excluded locations, in which case retry
@@ -231,7 +315,7 @@ def fill_restrictive(multiworld: MultiWorld, base_state: CollectionState, locati
             for location in excluded_locations:
                 location.progress_type = location.progress_type.DEFAULT
             fill_restrictive(multiworld, base_state, excluded_locations, unplaced_items, single_player_placement, lock,
-                             swap, on_place, allow_partial, False)
+                             swap, on_place, allow_partial, False, sweep=sweep)
             for location in excluded_locations:
                 if not location.item:
                     location.progress_type = location.progress_type.EXCLUDED
@@ -369,7 +453,8 @@ def accessibility_corrections(multiworld: MultiWorld,
                               pool: list[Item] | None = None) -> None:
     if pool is None:
         pool = []
-    maximum_exploration_state = sweep_from_pool(state, pool)
+    sweep = IncrementalSweep(state)
+    maximum_exploration_state = sweep.sweep_from_pool(pool)
     minimal_players = {player for player in multiworld.player_ids if
                        multiworld.worlds[player].options.accessibility == "minimal"}
     unreachable_locations = [location for location in multiworld.get_locations() if
@@ -383,10 +468,11 @@ def accessibility_corrections(multiworld: MultiWorld,
             if location in state.advancements:
                 state.advancements.remove(location)
                 state.remove(location.item)
+            sweep.remove_placement(location)
             locations.append(location)
     if pool and locations:
         locations.sort(key=lambda loc: loc.progress_type != LocationProgressType.PRIORITY)
-        fill_restrictive(multiworld, state, locations, pool, name="Accessibility Corrections")
+        fill_restrictive(multiworld, state, locations, pool, name="Accessibility Corrections", sweep=sweep)
 
 
 def inaccessible_location_rules(multiworld: MultiWorld, state: CollectionState, locations):
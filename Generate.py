@@ -1,12 +1,17 @@
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
 import copy
 import logging
+import logging.handlers
+import multiprocessing
 import os
 import random
 import string
 import sys
+import traceback
+import typing
 import urllib.parse
 import urllib.request
 from collections import Counter
@@ -20,7 +25,7 @@ ModuleUpdate.update()
 import Utils
 import Options
 from BaseClasses import seeddigits, get_seed, PlandoOptions
-from Utils import parse_yamls, version_tuple, __version__, tuplize_version
+from Utils import parse_yamls_cached, version_tuple, __version__, tuplize_version
 
 
 def mystery_argparse(argv: list[str] | None = None) -> argparse.Namespace:
@@ -54,6 +59,8 @@ def mystery_argparse(argv: list[str] | None = None) -> argparse.Namespace:
     parser.add_argument("--skip_output", action="store_true",
                         help="Skips generation assertion and output stages and skips multidata and spoiler output. "
                              "Intended for debugging and testing purposes.")
+    parser.add_argument("--roll_processes", default=defaults.roll_processes, type=lambda value: max(int(value), 1),
+                        help="Number of processes to read player files and roll their options in.")
     parser.add_argument("--spoiler_only", action="store_true",
                         help="Skips generation assertion and multidata, outputting only a spoiler log. "
                              "Intended for debugging and testing purposes.")
@@ -123,26 +130,25 @@ def main(args=None) -> tuple[argparse.Namespace, int]:
     player_id: int = 1
     player_files: dict[int, str] = {}
     player_errors: list[str] = []
-    for file in os.scandir(args.player_files_path):
-        fname = file.name
-        if file.is_file() and not fname.startswith(".") and not fname.lower().endswith(".ini") and \
-                os.path.join(args.player_files_path, fname) not in {args.meta_file_path, args.weights_file_path}:
-            path = os.path.join(args.player_files_path, fname)
-            try:
-                weights_for_file = []
-                for doc_idx, yaml in enumerate(read_weights_yamls(path)):
-                    if yaml is None:
-                        logging.warning(f"Ignoring empty yaml document #{doc_idx + 1} in {fname}")
-                    else:
-                        weights_for_file.append(yaml)
-                weights_cache[fname] = tuple(weights_for_file)
-
-            except Exception as e:
-                logging.exception(f"Exception reading weights in file {fname}")
-                player_errors.append(
-                    f"{len(player_errors) + 1}. "
-                    f"File {fname} is invalid. Please fix your yaml.\n{Utils.get_all_causes(e)}"
-                )
+    fnames = [file.name for file in os.scandir(args.player_files_path)
+              if file.is_file() and not file.name.startswith(".") and not file.name.lower().endswith(".ini") and
+              os.path.join(args.player_files_path, file.name) not in {args.meta_file_path, args.weights_file_path}]
+    paths = [os.path.join(args.player_files_path, fname) for fname in fnames]
+    for fname, yamls in zip(fnames, map_isolated(read_weights_yamls, args.roll_processes, [(path,) for path in paths])):
+        if isinstance(yamls, IsolatedError):
+            logging.error(f"Exception reading weights in file {fname}\n{yamls.traceback}")
+            player_errors.append(
+                f"{len(player_errors) + 1}. "
+                f"File {fname} is invalid. Please fix your yaml.\n{yamls.causes}"
+            )
+            continue
+        weights_for_file = []
+        for doc_idx, yaml in enumerate(yamls):
+            if yaml is None:
+                logging.warning(f"Ignoring empty yaml document #{doc_idx + 1} in {fname}")
+            else:
+                weights_for_file.append(yaml)
+        weights_cache[fname] = tuple(weights_for_file)
 
     # sort dict for consistent results across platforms:
     weights_cache = {key: value for key, value in sorted(weights_cache.items(), key=lambda k: k[0].casefold())}
@@ -206,17 +212,32 @@ def main(args=None) -> tuple[argparse.Namespace, int]:
                             else:
                                 yaml[category_name][key] = option
 
+    # every roll gets its own seed, drawn in a fixed order, so the results don't depend on the number of processes
+    # or on scheduling
+    def draw_roll_seed() -> int:
+        return random.getrandbits(64)
+
     settings_cache: dict[str, tuple[argparse.Namespace, ...] | None] = {fname: None for fname in weights_cache}
     if args.sameoptions:
-        for fname, yamls in weights_cache.items():
-            try:
-                settings_cache[fname] = tuple(roll_settings(yaml, args.plando) for yaml in yamls)
-            except Exception as e:
-                logging.exception(f"Exception reading settings in file {fname}")
+        rolls = [(fname, yaml, draw_roll_seed()) for fname, yamls in weights_cache.items() for yaml in yamls]
+        rolled_settings: dict[str, list[argparse.Namespace]] = {}
+        rolled_errors: set[str] = set()
+        for (fname, _, _), settings_object in zip(rolls, map_isolated(
+                roll_settings_seeded, args.roll_processes,
+                [(yaml, args.plando, roll_seed) for _, yaml, roll_seed in rolls])):
+            if fname in rolled_errors:
+                continue  # only the first error of each file is reported
+            if isinstance(settings_object, IsolatedError):
+                rolled_errors.add(fname)
+                logging.error(f"Exception reading settings in file {fname}\n{settings_object.traceback}")
                 player_errors.append(
                     f"{len(player_errors) + 1}. "
-                    f"File {fname} is invalid. Please fix your yaml.\n{Utils.get_all_causes(e)}"
+                    f"File {fname} is invalid. Please fix your yaml.\n{settings_object.causes}"
                 )
+            else:
+                rolled_settings.setdefault(fname, []).append(settings_object)
+        for fname, settings_objects in rolled_settings.items():
+            settings_cache[fname] = tuple(settings_objects)
         # Exit early here to avoid throwing the same errors again later
         if player_errors:
             errors = "\n\n".join(player_errors)
@@ -229,6 +250,18 @@ def main(args=None) -> tuple[argparse.Namespace, int]:
     name_counter: Counter[str] = Counter()
     args.player_options = {}
 
+    player_rolls: dict[int, tuple[dict, int]] = {}
+    player = 1
+    while player <= args.multi:
+        path = player_path_cache[player]
+        for yaml in weights_cache[path] if path else (None,):
+            if path and not settings_cache[path]:
+                player_rolls[player] = yaml, draw_roll_seed()
+            player += 1
+    player_settings: dict[int, argparse.Namespace | IsolatedError] = dict(zip(player_rolls, map_isolated(
+        roll_settings_seeded, args.roll_processes,
+        [(yaml, args.plando, roll_seed) for yaml, roll_seed in player_rolls.values()])))
+
     player = 1
     while player <= args.multi:
         path = player_path_cache[player]
@@ -239,12 +272,20 @@ def main(args=None) -> tuple[argparse.Namespace, int]:
 
         for doc_index, yaml in enumerate(weights_cache[path]):
             name = yaml.get("name")
+            # Use the cached settings object if it exists, otherwise the settings rolled for this player
+            # Invariant: settings_cache[path] and weights_cache[path] have the same length
+            cached = settings_cache[path]
+            settings_object = cached[doc_index] if cached else player_settings[player]
+            if isinstance(settings_object, IsolatedError):
+                logging.error(f"Exception reading settings in file {path} document #{doc_index + 1} "
+                              f"(name: {args.name.get(player, name)})\n{settings_object.traceback}")
+                player_errors.append(
+                    f"{len(player_errors) + 1}. "
+                    f"File {path} document #{doc_index + 1} (name: {args.name.get(player, name)}) is invalid. "
+                    f"Please fix your yaml.\n{settings_object.causes}")
+                player += 1
+                continue
             try:
-                # Use the cached settings object if it exists, otherwise roll settings within the try-catch
-                # Invariant: settings_cache[path] and weights_cache[path] have the same length
-                cached = settings_cache[path]
-                settings_object: argparse.Namespace = (cached[doc_index] if cached else roll_settings(yaml, args.plando))
-
                 for k, v in vars(settings_object).items():
                     if v is not None:
                         try:
@@ -289,6 +330,65 @@ def main(args=None) -> tuple[argparse.Namespace, int]:
     return args, seed
 
 
+class IsolatedError(typing.NamedTuple):
+    """An exception of a call made by map_isolated, described so it can be reported in the calling process."""
+    causes: str
+    traceback: str
+
+
+class _IsolatedCall:
+    def __init__(self, function: typing.Callable[..., Any]) -> None:
+        self.function = function
+
+    def __call__(self, args: tuple[Any, ...]) -> Any:
+        try:
+            return self.function(*args)
+        except Exception as e:
+            return IsolatedError(Utils.get_all_causes(e), traceback.format_exc())
+
+
+def _init_isolated_process(log_queue: multiprocessing.Queue, log_level: int) -> None:
+    # the generating process writes the log records of its pool to its own log file and console
+    root_logger = logging.getLogger()
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    root_logger.setLevel(log_level)
+
+
+def map_isolated(function: typing.Callable[..., Any], processes: int, calls: list[tuple[Any, ...]]) -> list[Any]:
+    """
+    Calls function with each tuple of arguments in calls, in a pool of processes if processes is more than 1.
+    Exceptions are returned as an IsolatedError in place of the result of their call, to be reported the same either way.
+    """
+    call = _IsolatedCall(function)
+    if processes > 1 and len(calls) > 1:
+        root_logger = logging.getLogger()
+        log_queue = multiprocessing.Queue()
+        log_listener = logging.handlers.QueueListener(log_queue, *root_logger.handlers, respect_handler_level=True)
+        log_listener.start()
+        try:
+            with concurrent.futures.ProcessPoolExecutor(min(processes, len(calls)), initializer=_init_isolated_process,
+                                                        initargs=(log_queue, root_logger.level)) as pool:
+                return list(pool.map(call, calls, chunksize=max(1, len(calls) // (processes * 4))))
+        finally:
+            log_listener.stop()
+    return list(map(call, calls))
+
+
+def roll_settings_seeded(weights: dict, plando_options: PlandoOptions, roll_seed: int) -> argparse.Namespace:
+    """
+    Rolls options like roll_settings, from a random state that only depends on roll_seed. The global random state is
+    restored afterward.
+    """
+    random_state = random.getstate()
+    random.seed(roll_seed)
+    try:
+        return roll_settings(weights, plando_options)
+    finally:
+        random.setstate(random_state)
+
+
 def read_weights_yamls(path) -> tuple[Any, ...]:
     try:
         if urllib.parse.urlparse(path).scheme in ('https', 'file'):
@@ -301,7 +401,7 @@ def read_weights_yamls(path) -> tuple[Any, ...]:
 
     from yaml.error import MarkedYAMLError
     try:
-        return tuple(parse_yamls(yaml))
+        return parse_yamls_cached(yaml)
     except MarkedYAMLError as ex:
         if ex.problem_mark:
             lines = yaml.splitlines()
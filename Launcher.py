@@ -36,6 +36,10 @@ if __name__ == "__main__":
     init_logging('Launcher')
 
 from worlds.LauncherComponents import Component, components, icon_paths, SuffixIdentifier, Type
+from worlds import load_all_worlds
+
+# worlds add their launcher components when imported
+load_all_worlds()
 
 
 def open_host_yaml():
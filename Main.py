@@ -1,13 +1,14 @@
 import collections
 from collections.abc import Mapping
 import concurrent.futures
+import contextlib
 import logging
+import multiprocessing
 import os
 import tempfile
 import time
 from typing import Any
 import zipfile
-import zlib
 
 import worlds
 from BaseClasses import CollectionState, Item, Location, LocationProgressType, MultiWorld
@@ -15,7 +16,7 @@ from Fill import FillError, balance_multiworld_progression, distribute_items_res
     parse_planned_blocks, distribute_planned_blocks, resolve_early_locations_for_planned
 from NetUtils import convert_to_base_types
 from Options import StartInventoryPool
-from Utils import __version__, output_path, restricted_dumps, version_tuple
+from Utils import __version__, output_path, version_tuple
 from settings import get_settings
 from worlds import AutoWorld
 from worlds.generic.Rules import exclusion_rules, locality_rules
@@ -34,6 +35,9 @@ def main(args, seed=None, baked_server_options: dict[str, object] | None = None)
     start = time.perf_counter()
     # initialize the multiworld
     multiworld = MultiWorld(args.multi)
+    multiworld.compact_collection_state = bool(get_settings().generator.compact_collection_state)
+    multiworld.shared_state_copies = bool(get_settings().generator.shared_state_copies)
+    multiworld.playthrough_processes = max(1, get_settings().generator.playthrough_processes)
 
     logger = logging.getLogger()
     multiworld.set_seed(seed, args.race, str(args.outputname) if args.outputname else None)
@@ -51,18 +55,19 @@ def main(args, seed=None, baked_server_options: dict[str, object] | None = None)
     multiworld.state = CollectionState(multiworld)
     logger.info('Archipelago Version %s  -  Seed: %s\n', __version__, multiworld.seed)
 
-    logger.info(f"Found {len(AutoWorld.AutoWorldRegister.world_types)} World Types:")
-    longest_name = max(len(text) for text in AutoWorld.AutoWorldRegister.world_types)
-
-    world_classes = AutoWorld.AutoWorldRegister.world_types.values()
+    # only the worlds in this multiworld are listed, so the other worlds don't have to be imported
+    world_classes = sorted({type(multiworld.worlds[player]) for player in multiworld.player_ids},
+                           key=lambda cls: cls.game)
+    logger.info(f"Using {len(world_classes)} World Types:")
+    longest_name = max(len(cls.game) for cls in world_classes)
 
     version_count = max(len(cls.world_version.as_simple_string()) for cls in world_classes)
     item_count = len(str(max(len(cls.item_names) for cls in world_classes)))
     location_count = len(str(max(len(cls.location_names) for cls in world_classes)))
 
-    for name, cls in AutoWorld.AutoWorldRegister.world_types.items():
+    for cls in world_classes:
         if not cls.hidden and len(cls.item_names) > 0:
-            logger.info(f" {name:{longest_name}}: "
+            logger.info(f" {cls.game:{longest_name}}: "
                         f"v{cls.world_version.as_simple_string():{version_count}} | "
                         f"Items: {len(cls.item_names):{item_count}} | "
                         f"Locations: {len(cls.location_names):{location_count}}")
@@ -233,14 +238,23 @@ def main(args, seed=None, baked_server_options: dict[str, object] | None = None)
     with output as temp_dir:
         output_players = [player for player in multiworld.player_ids if AutoWorld.World.generate_output.__code__
                           is not multiworld.worlds[player].generate_output.__code__]
-        with concurrent.futures.ThreadPoolExecutor(len(output_players) + 2) as pool:
-            check_accessibility_task = pool.submit(multiworld.fulfills_accessibility)
+        isolated_output_players = [player for player in multiworld.player_ids
+                                   if AutoWorld.uses_isolated_output(type(multiworld.worlds[player]))]
+        output_processes = min(get_settings().generator.output_processes, len(isolated_output_players))
+        with (concurrent.futures.ProcessPoolExecutor(output_processes, multiprocessing.get_context("spawn"))
+              if output_processes > 1 else contextlib.nullcontext()) as process_pool, \
+                concurrent.futures.ThreadPoolExecutor(len(output_players) + len(isolated_output_players) + 2) as pool:
+            # one sweep shared by the multidata spheres, the accessibility check and the playthrough
+            sphere_analysis_task = pool.submit(multiworld.analyze_spheres)
 
             output_file_futures = [pool.submit(AutoWorld.call_stage, multiworld, "generate_output", temp_dir)]
             for player in output_players:
                 # skip starting a thread for methods that say "pass".
                 output_file_futures.append(
                     pool.submit(AutoWorld.call_single, multiworld, "generate_output", player, temp_dir))
+            for player in isolated_output_players:
+                output_file_futures.append(
+                    pool.submit(AutoWorld.call_output_isolated, multiworld, player, temp_dir, process_pool))
 
             # collect ER hint info
             er_hint_data: dict[int, dict[int, str]] = {}
@@ -249,7 +263,6 @@ def main(args, seed=None, baked_server_options: dict[str, object] | None = None)
             def write_multidata():
                 import NetUtils
                 from NetUtils import HintStatus
-                slot_data: dict[int, Mapping[str, Any]] = {}
                 client_versions: dict[int, tuple[int, int, int]] = {}
                 games: dict[int, str] = {}
                 minimum_versions: NetUtils.MinimumVersions = {
@@ -274,93 +287,103 @@ def main(args, seed=None, baked_server_options: dict[str, object] | None = None)
                     player: set() for player in range(1, multiworld.players + 1 + len(multiworld.groups))
                 }
 
-                for slot in multiworld.player_ids:
-                    slot_data[slot] = multiworld.worlds[slot].fill_slot_data()
-
-                def precollect_hint(location: Location, auto_status: HintStatus):
-                    entrance = er_hint_data.get(location.player, {}).get(location.address, "")
-                    hint = NetUtils.Hint(location.item.player, location.player, location.address,
-                                         location.item.code, False, entrance, location.item.flags, auto_status)
-                    precollected_hints[location.player].add(hint)
-                    if location.item.player not in multiworld.groups:
-                        precollected_hints[location.item.player].add(hint)
-                    else:
-                        for player in multiworld.groups[location.item.player]["players"]:
-                            precollected_hints[player].add(hint)
-
-                locations_data: dict[int, dict[int, tuple[int, int, int]]] = {player: {} for player in multiworld.player_ids}
-                for location in multiworld.get_filled_locations():
-                    if type(location.address) == int:
-                        assert location.item.code is not None, "item code None should be event, " \
-                                                               "location.address should then also be None. Location: " \
-                                                               f" {location}, Item: {location.item}"
-                        assert location.address not in locations_data[location.player], (
-                            f"Locations with duplicate address. {location} and "
-                            f"{locations_data[location.player][location.address]}")
-                        locations_data[location.player][location.address] = \
-                            location.item.code, location.item.player, location.item.flags
-                        auto_status = HintStatus.HINT_AVOID if location.item.trap else HintStatus.HINT_PRIORITY
-                        if location.name in multiworld.worlds[location.player].options.start_location_hints:
-                            if not location.item.trap:  # Unspecified status for location hints, except traps
-                                auto_status = HintStatus.HINT_UNSPECIFIED
-                            precollect_hint(location, auto_status)
-                        elif location.item.name in multiworld.worlds[location.item.player].options.start_hints:
-                            precollect_hint(location, auto_status)
-                        elif any([location.item.name in multiworld.worlds[player].options.start_hints
-                                  for player in multiworld.groups.get(location.item.player, {}).get("players", [])]):
-                            precollect_hint(location, auto_status)
-
-                # embedded data package
-                data_package = {
-                    game_world.game: worlds.network_data_package["games"][game_world.game]
-                    for game_world in multiworld.worlds.values()
-                }
-                data_package["Archipelago"] = worlds.network_data_package["games"]["Archipelago"]
-
-                checks_in_area: dict[int, dict[str, int | list[int]]] = {}
-
-                # get spheres -> filter address==None -> skip empty
-                spheres: list[dict[int, set[int]]] = []
-                for sphere in multiworld.get_sendable_spheres():
-                    current_sphere: dict[int, set[int]] = collections.defaultdict(set)
-                    for sphere_location in sphere:
-                        current_sphere[sphere_location.player].add(sphere_location.address)
-
-                    if current_sphere:
-                        spheres.append(dict(current_sphere))
-
-                multidata: NetUtils.MultiData = {
-                    "slot_data": slot_data,
-                    "slot_info": slot_info,
-                    "connect_names": {name: (0, player) for player, name in multiworld.player_name.items()},
-                    "locations": locations_data,
-                    "checks_in_area": checks_in_area,
-                    "server_options": baked_server_options,
-                    "er_hint_data": er_hint_data,
-                    "precollected_items": precollected_items,
-                    "precollected_hints": precollected_hints,
-                    "version": (version_tuple.major, version_tuple.minor, version_tuple.build),
-                    "tags": ["AP"],
-                    "minimum_versions": minimum_versions,
-                    "seed_name": multiworld.seed_name,
-                    "spheres": spheres,
-                    "datapackage": data_package,
-                    "race_mode": int(multiworld.is_race),
-                }
-                # TODO: change to `"version": version_tuple` after getting better serialization
-                AutoWorld.call_all(multiworld, "modify_multidata", multidata)
-
-                for key in ("slot_data", "er_hint_data"):
-                    multidata[key] = convert_to_base_types(multidata[key])
-
-                serialized_multidata = zlib.compress(restricted_dumps(multidata), 9)
-
                 with open(os.path.join(temp_dir, f'{outfilebase}.archipelago'), 'wb') as f:
-                    f.write(bytes([3]))  # version of format
-                    f.write(serialized_multidata)
+                    # the large sections are written as soon as they are produced and released right after,
+                    # so the whole multidata is never held in memory at once
+                    writer = NetUtils.MultiDataWriter(f)
+                    for slot in multiworld.player_ids:
+                        writer.write_section("slot_data", slot,
+                                             convert_to_base_types(multiworld.worlds[slot].fill_slot_data()))
+
+                    def precollect_hint(location: Location, auto_status: HintStatus):
+                        entrance = er_hint_data.get(location.player, {}).get(location.address, "")
+                        hint = NetUtils.Hint(location.item.player, location.player, location.address,
+                                             location.item.code, False, entrance, location.item.flags, auto_status)
+                        precollected_hints[location.player].add(hint)
+                        if location.item.player not in multiworld.groups:
+                            precollected_hints[location.item.player].add(hint)
+                        else:
+                            for player in multiworld.groups[location.item.player]["players"]:
+                                precollected_hints[player].add(hint)
+
+                    locations_data: dict[int, dict[int, tuple[int, int, int]]] = {
+                        player: {} for player in multiworld.player_ids
+                    }
+                    for location in multiworld.get_filled_locations():
+                        if type(location.address) == int:
+                            assert location.item.code is not None, "item code None should be event, " \
+                                                                   "location.address should then also be None. " \
+                                                                   f"Location:  {location}, Item: {location.item}"
+                            assert location.address not in locations_data[location.player], (
+                                f"Locations with duplicate address. {location} and "
+                                f"{locations_data[location.player][location.address]}")
+                            locations_data[location.player][location.address] = \
+                                location.item.code, location.item.player, location.item.flags
+                            auto_status = HintStatus.HINT_AVOID if location.item.trap else HintStatus.HINT_PRIORITY
+                            if location.name in multiworld.worlds[location.player].options.start_location_hints:
+                                if not location.item.trap:  # Unspecified status for location hints, except traps
+                                    auto_status = HintStatus.HINT_UNSPECIFIED
+                                precollect_hint(location, auto_status)
+                            elif location.item.name in multiworld.worlds[location.item.player].options.start_hints:
+                                precollect_hint(location, auto_status)
+                            elif any([location.item.name in multiworld.worlds[player].options.start_hints
+                                      for player in
+                                      multiworld.groups.get(location.item.player, {}).get("players", [])]):
+                                precollect_hint(location, auto_status)
+                    writer.write("locations", locations_data)
+                    del locations_data
+                    writer.write("precollected_hints", precollected_hints)
+                    del precollected_hints
+
+                    # get spheres -> filter address==None -> skip empty
+                    spheres: list[dict[int, set[int]]] = []
+                    sphere_analysis_task.result()
+                    for sphere in multiworld.get_sendable_spheres():
+                        current_sphere: dict[int, set[int]] = collections.defaultdict(set)
+                        for sphere_location in sphere:
+                            current_sphere[sphere_location.player].add(sphere_location.address)
+
+                        if current_sphere:
+                            spheres.append(dict(current_sphere))
+                    writer.write("spheres", spheres)
+                    del spheres
+
+                    # embedded data package
+                    data_package = {
+                        game_world.game: worlds.get_data_package(game_world.game)
+                        for game_world in multiworld.worlds.values()
+                    }
+                    data_package["Archipelago"] = worlds.get_data_package("Archipelago")
+                    writer.write("datapackage", data_package)
+                    del data_package
+
+                    checks_in_area: dict[int, dict[str, int | list[int]]] = {}
+
+                    # the sections written above are not part of what modify_multidata gets
+                    multidata: dict[str, Any] = {
+                        "slot_info": slot_info,
+                        "connect_names": {name: (0, player) for player, name in multiworld.player_name.items()},
+                        "checks_in_area": checks_in_area,
+                        "server_options": baked_server_options,
+                        "er_hint_data": er_hint_data,
+                        "precollected_items": precollected_items,
+                        "version": (version_tuple.major, version_tuple.minor, version_tuple.build),
+                        "tags": ["AP"],
+                        "minimum_versions": minimum_versions,
+                        "seed_name": multiworld.seed_name,
+                        "race_mode": int(multiworld.is_race),
+                    }
+                    # TODO: change to `"version": version_tuple` after getting better serialization
+                    AutoWorld.call_all(multiworld, "modify_multidata", multidata)
+
+                    multidata["er_hint_data"] = convert_to_base_types(multidata["er_hint_data"])
+                    for key, value in multidata.items():
+                        writer.write(key, value)
+                    writer.finish()
 
             output_file_futures.append(pool.submit(write_multidata))
-            if not check_accessibility_task.result():
+            sphere_analysis_task.result()
+            if not multiworld.fulfills_accessibility():
                 if not multiworld.can_beat_game():
                     raise FillError("Game appears as unbeatable. Aborting.", multiworld=multiworld)
                 else:
@@ -375,6 +398,7 @@ def main(args, seed=None, baked_server_options: dict[str, object] | None = None)
         if args.spoiler > 1:
             logger.info('Calculating playthrough.')
             multiworld.spoiler.create_playthrough(create_paths=args.spoiler > 2)
+        multiworld.sphere_analysis = None
 
         if args.spoiler:
             multiworld.spoiler.to_file(os.path.join(temp_dir, '%s_Spoiler.txt' % outfilebase))
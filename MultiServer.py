@@ -12,7 +12,9 @@ import inspect
 import itertools
 import logging
 import math
+import mmap
 import operator
+import os
 import pickle
 import random
 import shlex
@@ -42,7 +44,8 @@ except ImportError:
 
 import NetUtils
 import Utils
-from Utils import version_tuple, restricted_loads, Version, async_start, get_intended_text
+from Utils import version_tuple, restricted_loads, Version, async_start, get_intended_text, get_fuzzy_index, \
+    FuzzyIndex
 from NetUtils import Endpoint, ClientStatus, NetworkItem, decode, encode, NetworkPlayer, Permission, NetworkSlot, \
     SlotType, LocationStore, MultiData, Hint, HintStatus
 from BaseClasses import ItemClassification
@@ -140,6 +143,136 @@ def get_saving_second(seed_name: str, interval: int = 60) -> int:
     return int(hashlib.sha256(seed_name.encode()).hexdigest(), 16) % interval
 
 
+class SaveJournal:
+    """
+    Append-only log of the changes to a save since its last full snapshot.
+
+    Each entry only holds the received items, location checks, hints and data storage keys that changed since the
+    previous entry, plus the parts of the small remainder of the save that changed. Entries are replayed onto the
+    snapshot when loading.
+    Only used for save files. WebHostContext stores the whole save in the database instead, as every reader of
+    Room.multisave would have to replay a journal.
+    """
+    min_compaction_size = 1024 * 1024
+    """Journal size in bytes below which it is never compacted into a new snapshot."""
+
+    path: str
+    generation: int
+    size: int
+    snapshot_size: int
+    dirty_stored_data: typing.Set[str]
+    _received_lengths: typing.Dict[typing.Tuple[int, int, bool], int]
+    _location_check_counts: typing.Dict[team_slot, int]
+    _hints: typing.Dict[team_slot, typing.FrozenSet[Hint]]
+    _state: typing.Dict[str, bytes]
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.generation = 0
+        self.size = 0
+        self.snapshot_size = 0
+        self.dirty_stored_data = set()
+        self._received_lengths = {}
+        self._location_check_counts = {}
+        self._hints = {}
+        self._state = {}
+
+    @staticmethod
+    def _encode(obj: typing.Any) -> bytes:
+        data = zlib.compress(pickle.dumps(obj))
+        return len(data).to_bytes(4, "little") + data
+
+    def replay(self, savedata: typing.Dict[str, typing.Any]) -> int:
+        """Applies the entries of the journal that belong to the snapshot `savedata` to it, returns the entry count."""
+        entries = 0
+        try:
+            with open(self.path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return entries
+        position = 0
+        header = True
+        while position + 4 <= len(data):
+            length = int.from_bytes(data[position:position + 4], "little")
+            if position + 4 + length > len(data):
+                break  # entry was cut off while it was being written
+            entry = restricted_loads(zlib.decompress(data[position + 4:position + 4 + length]))
+            position += 4 + length
+            if header:
+                header = False
+                if entry["generation"] != savedata.get("journal_generation", 0):
+                    break  # journal of an older snapshot
+                continue
+            for key, (start, items) in entry["received_items"].items():
+                savedata["received_items"].setdefault(key, [])[start:] = items
+            savedata["location_checks"].update(entry["location_checks"])
+            savedata["hints"].update(entry["hints"])
+            for key, value in entry["stored_data"].items():
+                savedata["stored_data"][key] = value
+            for key in entry["deleted_stored_data"]:
+                savedata["stored_data"].pop(key, None)
+            savedata.update(entry["state"])
+            entries += 1
+        return entries
+
+    def start(self, ctx: Context, snapshot_size: int) -> None:
+        """Starts a new, empty journal on top of the snapshot that was just written from `ctx`."""
+        self.generation += 1
+        self.snapshot_size = snapshot_size
+        self.dirty_stored_data.clear()
+        self._received_lengths = {key: len(items) for key, items in ctx.received_items.items()}
+        self._location_check_counts = {key: len(checks) for key, checks in ctx.location_checks.items()}
+        self._hints = {key: frozenset(hints) for key, hints in ctx.hints.items()}
+        self._state.clear()
+        header = self._encode({"generation": self.generation})
+        with open(self.path, "wb") as f:
+            f.write(header)
+        self.size = len(header)
+
+    def needs_compaction(self) -> bool:
+        return self.size > max(self.min_compaction_size, self.snapshot_size)
+
+    def append(self, ctx: Context, save_state: typing.Dict[str, typing.Any]) -> None:
+        """Appends the changes of `ctx` and its `save_state` since the last entry to the journal."""
+        received_items: typing.Dict[typing.Tuple[int, int, bool], typing.Tuple[int, typing.List[NetworkItem]]] = {}
+        for key, items in ctx.received_items.items():
+            start = self._received_lengths.get(key, 0)
+            if len(items) != start:
+                received_items[key] = start, items[start:]
+                self._received_lengths[key] = len(items)
+        location_checks: typing.Dict[team_slot, typing.Set[int]] = {}
+        for key, checks in ctx.location_checks.items():
+            if len(checks) != self._location_check_counts.get(key, 0):
+                location_checks[key] = checks
+                self._location_check_counts[key] = len(checks)
+        hints: typing.Dict[team_slot, typing.Set[Hint]] = {}
+        for key, key_hints in ctx.hints.items():
+            if self._hints.get(key, frozenset()) != key_hints:
+                hints[key] = key_hints
+                self._hints[key] = frozenset(key_hints)
+        stored_data = {key: ctx.stored_data[key] for key in self.dirty_stored_data if key in ctx.stored_data}
+        deleted_stored_data = [key for key in self.dirty_stored_data if key not in ctx.stored_data]
+        self.dirty_stored_data.clear()
+        state: typing.Dict[str, typing.Any] = {}
+        for key, value in save_state.items():
+            encoded_value = pickle.dumps(value)
+            if self._state.get(key) != encoded_value:
+                state[key] = value
+                self._state[key] = encoded_value
+
+        entry = self._encode({
+            "received_items": received_items,
+            "location_checks": location_checks,
+            "hints": hints,
+            "stored_data": stored_data,
+            "deleted_stored_data": deleted_stored_data,
+            "state": state,
+        })
+        with open(self.path, "ab") as f:
+            f.write(entry)
+        self.size += len(entry)
+
+
 class Client(Endpoint):
     __slots__ = (
         "__weakref__",
@@ -216,6 +349,8 @@ team_slot = typing.Tuple[int, int]
 class Context:
     dumper = staticmethod(encode)
     loader = staticmethod(decode)
+    send_coalescing_interval: float = 0.005
+    """Seconds to wait for more messages to an endpoint before sending the ones queued for it as one frame."""
 
     simple_options = {"hint_cost": int,
                       "location_check_points": int,
@@ -241,9 +376,9 @@ class Context:
     slot_info: typing.Dict[int, NetworkSlot]
     generator_version = Version(0, 0, 0)
     checksums: typing.Dict[str, str]
-    item_names: typing.Dict[str, typing.Dict[int, str]]
+    item_names: typing.Dict[str, typing.Mapping[int, str]]
     item_name_groups: typing.Dict[str, typing.Dict[str, typing.Set[str]]]
-    location_names: typing.Dict[str, typing.Dict[int, str]]
+    location_names: typing.Dict[str, typing.Mapping[int, str]]
     location_name_groups: typing.Dict[str, typing.Dict[str, typing.Set[str]]]
     all_item_and_group_names: typing.Dict[str, typing.Set[str]]
     all_location_and_group_names: typing.Dict[str, typing.Set[str]]
@@ -262,11 +397,14 @@ class Context:
         self.log_network = log_network
         self.endpoints = []
         self.clients = {}
+        self.send_queues: typing.Dict[Endpoint, typing.List[str]] = {}
         self.compatibility: int = compatibility
         self.shutdown_task = None
         self.data_filename = None
         self.save_filename = None
         self.saving = False
+        self.journal_saves = False
+        self.save_journal: typing.Optional[SaveJournal] = None
         self.player_names: typing.Dict[team_slot, str] = {}
         self.player_name_lookup: typing.Dict[str, team_slot] = {}
         self.connect_names = {}  # names of slots clients can connect to
@@ -278,6 +416,7 @@ class Context:
         self.server = None
         self.countdown_timer = 0
         self.received_items = {}
+        self.pending_item_receivers: typing.Set[team_slot] = set()
         self.start_inventory = {}
         self.name_aliases: typing.Dict[team_slot, str] = {}
         self.location_checks = collections.defaultdict(set)
@@ -291,6 +430,7 @@ class Context:
         self.countdown_mode: str = countdown_mode
         self.item_cheat = item_cheat
         self.exit_event = asyncio.Event()
+        self.multidata_map: typing.Optional[mmap.mmap] = None
         self.client_activity_timers: typing.Dict[
             team_slot, datetime.datetime] = {}  # datetime of last new item check
         self.client_connection_timers: typing.Dict[
@@ -323,6 +463,7 @@ class Context:
         self.location_name_groups = {}
         self.all_item_and_group_names = {}
         self.all_location_and_group_names = {}
+        self.fuzzy_indices: typing.Dict[int, typing.Tuple[typing.Collection[str], FuzzyIndex]] = {}
         self.item_names = collections.defaultdict(
             lambda: Utils.KeyedDefaultDict(lambda code: f'Unknown item (ID:{code})'))
         self.location_names = collections.defaultdict(
@@ -334,39 +475,46 @@ class Context:
     # Data package retrieval
     def _load_game_data(self):
         import worlds
-        self.gamespackage = worlds.network_data_package["games"]
-
-        self.item_name_groups = {world_name: world.item_name_groups for world_name, world in
-                                 worlds.AutoWorldRegister.world_types.items()}
-        self.location_name_groups = {world_name: world.location_name_groups for world_name, world in
-                                     worlds.AutoWorldRegister.world_types.items()}
-        for world_name, world in worlds.AutoWorldRegister.world_types.items():
-            self.non_hintable_names[world_name] = world.hint_blacklist
-
-        for game_package in self.gamespackage.values():
+        # the name groups are taken from the data packages, which doesn't require importing any world
+        for world_name, game_package in worlds.network_data_package["games"].items():
             # remove groups from data sent to clients
-            del game_package["item_name_groups"]
-            del game_package["location_name_groups"]
+            self.gamespackage[world_name] = {key: value for key, value in game_package.items()
+                                             if key not in ("item_name_groups", "location_name_groups")}
+            self.item_name_groups[world_name] = game_package["item_name_groups"]
+            self.location_name_groups[world_name] = game_package["location_name_groups"]
+
+    def _load_non_hintable_names(self):
+        """Loads the names that can't be hinted for the hosted games, from the world cache if possible."""
+        import worlds
+        for game in set(self.games.values()):
+            if game in worlds.network_data_package["games"]:
+                self.non_hintable_names[game] = worlds.get_hint_blacklist(game)
 
     def _init_game_data(self):
+        item_tables: typing.Dict[str, NetUtils.NameTable] = {}
+        location_tables: typing.Dict[str, NetUtils.NameTable] = {}
         for game_name, game_package in self.gamespackage.items():
+            checksum = game_package.get("checksum")
             if "checksum" in game_package:
-                self.checksums[game_name] = game_package["checksum"]
-            for item_name, item_id in game_package["item_name_to_id"].items():
-                self.item_names[game_name][item_id] = item_name
-            for location_name, location_id in game_package["location_name_to_id"].items():
-                self.location_names[game_name][location_id] = location_name
+                self.checksums[game_name] = checksum
+            # shared with all other rooms and trackers in this process that use the same data package
+            item_tables[game_name] = NetUtils.get_name_table(game_package["item_name_to_id"], checksum, "item")
+            location_tables[game_name] = NetUtils.get_name_table(game_package["location_name_to_id"], checksum,
+                                                                 "location")
             self.all_item_and_group_names[game_name] = \
                 set(game_package["item_name_to_id"]) | set(self.item_name_groups[game_name])
             self.all_location_and_group_names[game_name] = \
                 set(game_package["location_name_to_id"]) | set(self.location_name_groups.get(game_name, []))
 
-        archipelago_item_names = self.item_names["Archipelago"]
-        archipelago_location_names = self.location_names["Archipelago"]
-        for game in [game_name for game_name in self.gamespackage if game_name != "Archipelago"]:
-            # Add Archipelago items and locations to each data package.
-            self.item_names[game].update(archipelago_item_names)
-            self.location_names[game].update(archipelago_location_names)
+        for game_name in self.gamespackage:
+            # Archipelago items and locations can be looked up in each data package, taking precedence.
+            item_maps = [item_tables[game_name], self.item_names.default_factory()]
+            location_maps = [location_tables[game_name], self.location_names.default_factory()]
+            if game_name != "Archipelago" and "Archipelago" in item_tables:
+                item_maps.insert(0, item_tables["Archipelago"])
+                location_maps.insert(0, location_tables["Archipelago"])
+            self.item_names[game_name] = collections.ChainMap(*item_maps)
+            self.location_names[game_name] = collections.ChainMap(*location_maps)
 
     def item_names_for_game(self, game: str) -> typing.Optional[typing.Dict[str, int]]:
         return self.gamespackage[game]["item_name_to_id"] if game in self.gamespackage else None
@@ -374,50 +522,60 @@ class Context:
     def location_names_for_game(self, game: str) -> typing.Optional[typing.Dict[str, int]]:
         return self.gamespackage[game]["location_name_to_id"] if game in self.gamespackage else None
 
+    def get_fuzzy_index(self, names: typing.Collection[str]) -> FuzzyIndex:
+        """Returns the FuzzyIndex to look up user input in one of the name collections of this context."""
+        cached = self.fuzzy_indices.get(id(names))
+        if cached is None or cached[0] is not names:
+            # the index itself is shared with every other context of the process using the same names
+            cached = self.fuzzy_indices[id(names)] = names, get_fuzzy_index(tuple(names))
+        return cached[1]
+
     # General networking
-    async def send_msgs(self, endpoint: Endpoint, msgs: typing.Iterable[dict]) -> bool:
+    def queue_encoded_msgs(self, endpoint: Endpoint, msg: str) -> bool:
+        """
+        Queues an encoded list of messages for endpoint. Messages queued within send_coalescing_interval, or while the
+        endpoint is still receiving the previous frame, are merged and sent as one frame.
+        """
         if not endpoint.socket or not endpoint.socket.open:
             return False
-        msg = self.dumper(msgs)
+        queue = self.send_queues.get(endpoint)
+        if queue is None:
+            queue = self.send_queues[endpoint] = []
+            async_start(self._send_queued_msgs(endpoint, queue), name="send queued messages")
+        queue.append(msg)
+        return True
+
+    def queue_msgs(self, endpoint: Endpoint, msgs: typing.Iterable[dict]) -> bool:
+        return self.queue_encoded_msgs(endpoint, self.dumper(msgs))
+
+    async def _send_queued_msgs(self, endpoint: Endpoint, queue: typing.List[str]) -> None:
+        await asyncio.sleep(self.send_coalescing_interval)
         try:
-            await endpoint.socket.send(msg)
+            while queue and endpoint.socket.open:
+                msg = queue[0] if len(queue) == 1 else \
+                    "[" + ",".join(queued[1:-1] for queued in queue if queued != "[]") + "]"
+                queue.clear()
+                # waits for the socket to drain, messages queued in the meantime are merged into the next frame
+                await endpoint.socket.send(msg)
+                if self.log_network:
+                    self.logger.info(f"Outgoing message: {msg}")
         except websockets.ConnectionClosed:
-            self.logger.exception(f"Exception during send_msgs, could not send {msg}")
+            self.logger.exception("Exception during send_queued_msgs")
+            del self.send_queues[endpoint]
             await self.disconnect(endpoint)
-            return False
-        else:
-            if self.log_network:
-                self.logger.info(f"Outgoing message: {msg}")
-            return True
+        finally:
+            self.send_queues.pop(endpoint, None)
+
+    async def send_msgs(self, endpoint: Endpoint, msgs: typing.Iterable[dict]) -> bool:
+        return self.queue_msgs(endpoint, msgs)
 
     async def send_encoded_msgs(self, endpoint: Endpoint, msg: str) -> bool:
-        if not endpoint.socket or not endpoint.socket.open:
-            return False
-        try:
-            await endpoint.socket.send(msg)
-        except websockets.ConnectionClosed:
-            self.logger.exception("Exception during send_encoded_msgs")
-            await self.disconnect(endpoint)
-            return False
-        else:
-            if self.log_network:
-                self.logger.info(f"Outgoing message: {msg}")
-            return True
+        return self.queue_encoded_msgs(endpoint, msg)
 
     async def broadcast_send_encoded_msgs(self, endpoints: typing.Iterable[Endpoint], msg: str) -> bool:
-        sockets = []
         for endpoint in endpoints:
-            if endpoint.socket and endpoint.socket.open:
-                sockets.append(endpoint.socket)
-        try:
-            websockets.broadcast(sockets, msg)
-        except RuntimeError:
-            self.logger.exception("Exception during broadcast_send_encoded_msgs")
-            return False
-        else:
-            if self.log_network:
-                self.logger.info(f"Outgoing broadcast: {msg}")
-            return True
+            self.queue_encoded_msgs(endpoint, msg)
+        return True
 
     def broadcast_all(self, msgs: typing.List[dict]):
         msg_is_text = all(msg["cmd"] == "PrintJSON" for msg in msgs)
@@ -427,7 +585,8 @@ class Context:
             for endpoint in self.endpoints
             if endpoint.auth and not (msg_is_text and endpoint.no_text)
         )
-        async_start(self.broadcast_send_encoded_msgs(endpoints, data))
+        for endpoint in endpoints:
+            self.queue_encoded_msgs(endpoint, data)
 
     def broadcast_text_all(self, text: str, additional_arguments: dict = {}):
         self.logger.info("Notice (all): %s" % text)
@@ -441,11 +600,13 @@ class Context:
             for endpoint in itertools.chain.from_iterable(self.clients[team].values())
             if not (msg_is_text and endpoint.no_text)
         )
-        async_start(self.broadcast_send_encoded_msgs(endpoints, data))
+        for endpoint in endpoints:
+            self.queue_encoded_msgs(endpoint, data)
 
     def broadcast(self, endpoints: typing.Iterable[Client], msgs: typing.List[dict]):
-        msgs = self.dumper(msgs)
-        async_start(self.broadcast_send_encoded_msgs(endpoints, msgs))
+        data = self.dumper(msgs)
+        for endpoint in endpoints:
+            self.queue_encoded_msgs(endpoint, data)
 
     async def disconnect(self, endpoint: Client):
         if endpoint in self.endpoints:
@@ -458,14 +619,13 @@ class Context:
         if not client.auth or client.no_text:
             return
         self.logger.info("Notice (Player %s in team %d): %s" % (client.name, client.team + 1, text))
-        async_start(self.send_msgs(client, [{"cmd": "PrintJSON", "data": [{ "text": text }], **additional_arguments}]))
+        self.queue_msgs(client, [{"cmd": "PrintJSON", "data": [{ "text": text }], **additional_arguments}])
 
     def notify_client_multiple(self, client: Client, texts: typing.List[str], additional_arguments: dict = {}):
         if not client.auth or client.no_text:
             return
-        async_start(self.send_msgs(client,
-                                   [{"cmd": "PrintJSON", "data": [{ "text": text }], **additional_arguments}
-                                    for text in texts]))
+        self.queue_msgs(client, [{"cmd": "PrintJSON", "data": [{ "text": text }], **additional_arguments}
+                                 for text in texts])
 
     # loading
     def load(self, multidatapath: str, use_embedded_server_options: bool = False):
@@ -480,16 +640,36 @@ class Context:
                     raise Exception("No .archipelago found in archive.")
         else:
             with open(multidatapath, 'rb') as f:
-                data = f.read()
+                # sectioned multidata is read lazily from the memory map, so unused sections are never loaded
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self.multidata_map = data
 
         self._load(self.decompress(data), {}, use_embedded_server_options)
         self.data_filename = multidatapath
 
+    def close_multidata(self) -> None:
+        """
+        Closes the memory map of the loaded multidata file once the room shut down, so the file isn't kept open.
+        The location store may be read from the map, so the exit save is done first and the context is unusable after.
+        """
+        if self.multidata_map is None:
+            return
+        self.save_dirty = False  # make sure the saving thread does not save after the exit save
+        if self.saving:
+            import atexit
+            atexit.unregister(self._save)
+            self._save(True)
+        del self.locations
+        self.multidata_map.close()
+        self.multidata_map = None
+
     @staticmethod
-    def decompress(data: bytes) -> dict:
+    def decompress(data: bytes) -> typing.MutableMapping[str, typing.Any]:
         format_version = data[0]
-        if format_version > 3:
+        if format_version > NetUtils.multidata_format_version:
             raise Utils.VersionException("Incompatible multidata.")
+        if format_version >= NetUtils.MultiDataSections.min_format_version:
+            return NetUtils.MultiDataSections(data)
         return restricted_loads(zlib.decompress(data[1:]))
 
     def _load(self, decoded_obj: MultiData, game_data_packages: typing.Dict[str, typing.Any],
@@ -535,10 +715,15 @@ class Context:
         self.seed_name = decoded_obj["seed_name"]
         self.random.seed(self.seed_name)
         self.connect_names = decoded_obj['connect_names']
-        self.locations = LocationStore(decoded_obj.pop("locations"))  # pre-emptively free memory
+        if isinstance(decoded_obj, NetUtils.MultiDataSections) and decoded_obj.has_binary_locations \
+                and not decoded_obj.is_loaded("locations"):
+            # use the records in place instead of building the dicts of every location first
+            self.locations = LocationStore.from_buffer(decoded_obj.get_raw("locations"))
+        else:
+            self.locations = LocationStore(decoded_obj.pop("locations"))  # pre-emptively free memory
         self.slot_data = decoded_obj['slot_data']
-        for slot, data in self.slot_data.items():
-            self.read_data[f"slot_data_{slot}"] = lambda data=data: data
+        for slot in self.slot_data:
+            self.read_data[f"slot_data_{slot}"] = lambda slot=slot: self.slot_data[slot]
         self.er_hint_data = {int(player): {int(address): name for address, name in loc_data.items()}
                              for player, loc_data in decoded_obj["er_hint_data"].items()}
 
@@ -571,6 +756,7 @@ class Context:
                 del data["location_name_groups"]
             del data["item_name_groups"]  # remove from data package, but keep in self.item_name_groups
         self._init_game_data()
+        self._load_non_hintable_names()
         for game_name, data in self.item_name_groups.items():
             self.read_data[f"item_name_groups_{game_name}"] = lambda lgame=game_name: self.item_name_groups[lgame]
         for game_name, data in self.location_name_groups.items():
@@ -592,12 +778,28 @@ class Context:
 
         return False
 
-    def _save(self, exit_save: bool = False) -> bool:
+    def _save(self, exit_save: bool = False, snapshot: bool = False) -> bool:
         try:
+            journal = self.save_journal
+            if journal and journal.generation and not snapshot and not journal.needs_compaction():
+                # only the changes are journaled, so the full save doesn't have to be built
+                self.recheck_hints()
+                journal.append(self, self.get_save_state())
+                return True
+            save_data = self.get_save()
+            if journal:
+                save_data["journal_generation"] = journal.generation + 1
             # Does not use Utils.restricted_dumps because we'd rather make a save than not make one
-            encoded_save = pickle.dumps(self.get_save())
-            with open(self.save_filename, "wb") as f:
-                f.write(zlib.compress(encoded_save))
+            encoded_save = zlib.compress(pickle.dumps(save_data))
+            if journal:
+                # the snapshot has to be complete before the journal it replaces is discarded
+                with open(self.save_filename + ".tmp", "wb") as f:
+                    f.write(encoded_save)
+                os.replace(self.save_filename + ".tmp", self.save_filename)
+                journal.start(self, len(encoded_save))
+            else:
+                with open(self.save_filename, "wb") as f:
+                    f.write(encoded_save)
         except Exception as e:
             self.logger.exception(e)
             return False
@@ -612,10 +814,20 @@ class Context:
                 name, ext = os.path.splitext(self.data_filename)
                 self.save_filename = name + '.apsave' if ext.lower() in ('.archipelago', '.zip') \
                     else self.data_filename + '_' + 'apsave'
+            if self.journal_saves:
+                self.save_journal = SaveJournal(self.save_filename + ".journal")
             try:
                 with open(self.save_filename, 'rb') as f:
                     save_data = restricted_loads(zlib.decompress(f.read()))
-                    self.set_save(save_data)
+                if self.save_journal:
+                    self.save_journal.generation = save_data.get("journal_generation", 0)
+                    replayed = self.save_journal.replay(save_data)
+                    if replayed:
+                        self.logger.info(f"Replayed {replayed} save journal entries.")
+                self.set_save(save_data)
+                if self.save_journal:
+                    # fold the replayed entries into a new snapshot, the journal only tracks changes made after it
+                    self._save(snapshot=True)
             except FileNotFoundError:
                 self.logger.error('No save data found, starting a new game')
             except Exception as e:
@@ -659,9 +871,17 @@ class Context:
             "version": self.save_version,
             "connect_names": self.connect_names,
             "received_items": self.received_items,
-            "hints_used": dict(self.hints_used),
             "hints": dict(self.hints),
             "location_checks": dict(self.location_checks),
+            "stored_data": self.stored_data,
+        }
+        d.update(self.get_save_state())
+        return d
+
+    def get_save_state(self) -> dict:
+        """Returns the part of the save that isn't journaled in detail by SaveJournal, or known from the multidata."""
+        return {
+            "hints_used": dict(self.hints_used),
             "name_aliases": self.name_aliases,
             "client_game_state": dict(self.client_game_state),
             "client_activity_timers": tuple(
@@ -670,18 +890,14 @@ class Context:
                 (key, value.timestamp()) for key, value in self.client_connection_timers.items()),
             "random_state": self.random.getstate(),
             "group_collected": dict(self.group_collected),
-            "stored_data": self.stored_data,
             "game_options": {"hint_cost": self.hint_cost, "location_check_points": self.location_check_points,
                              "server_password": self.server_password, "password": self.password,
                              "release_mode": self.release_mode,
                              "remaining_mode": self.remaining_mode, "collect_mode": self.collect_mode,
                              "countdown_mode": self.countdown_mode,
                              "item_cheat": self.item_cheat, "compatibility": self.compatibility}
-
         }
 
-        return d
-
     def set_save(self, savedata: dict):
         if self.connect_names != savedata["connect_names"]:
             raise Exception("This savegame does not appear to match the loaded multiworld.")
@@ -840,7 +1056,7 @@ class Context:
                     continue
                 client_hints = [datum[1] for datum in sorted(hint_data, key=lambda x: x[0].finding_player != slot)]
                 for client in clients:
-                    async_start(self.send_msgs(client, client_hints))
+                    self.queue_msgs(client, client_hints)
 
     def get_hint(self, team: int, finding_player: int, seeked_location: int) -> typing.Optional[Hint]:
         for hint in self.hints[team, finding_player]:
@@ -891,7 +1107,7 @@ def update_aliases(ctx: Context, team: int):
 
     for clients in ctx.clients[team].values():
         for client in clients:
-            async_start(ctx.send_encoded_msgs(client, cmd))
+            ctx.queue_encoded_msgs(client, cmd)
 
 
 async def server(websocket: "ServerConnection", path: str = "/", ctx: Context = None) -> None:
@@ -1068,20 +1284,28 @@ def get_start_inventory(ctx: Context, player: int, remote_start_inventory: bool)
 
 
 def send_new_items(ctx: Context):
-    for team, clients in ctx.clients.items():
-        for slot, clients in clients.items():
-            for client in clients:
-                if client.no_items:
-                    continue
-                start_inventory = get_start_inventory(ctx, slot, client.remote_start_inventory)
-                items = get_received_items(ctx, team, slot, client.remote_items)
-                if len(start_inventory) + len(items) > client.send_index:
+    """Sends the items received since the last call to the clients of the slots in ctx.pending_item_receivers."""
+    receivers = ctx.pending_item_receivers
+    ctx.pending_item_receivers = set()
+    for team, slot in receivers:
+        # clients of a slot mostly share their items handling and index, so they can share the encoded message
+        encoded_msgs: typing.Dict[typing.Tuple[bool, bool, int], str] = {}
+        for client in ctx.clients.get(team, {}).get(slot, ()):
+            if client.no_items:
+                continue
+            start_inventory = get_start_inventory(ctx, slot, client.remote_start_inventory)
+            items = get_received_items(ctx, team, slot, client.remote_items)
+            if len(start_inventory) + len(items) > client.send_index:
+                key = client.remote_start_inventory, client.remote_items, client.send_index
+                msg = encoded_msgs.get(key)
+                if msg is None:
                     first_new_item = max(0, client.send_index - len(start_inventory))
-                    async_start(ctx.send_msgs(client, [{
+                    msg = encoded_msgs[key] = ctx.dumper([{
                         "cmd": "ReceivedItems",
                         "index": client.send_index,
-                        "items": start_inventory[client.send_index:] + items[first_new_item:]}]))
-                    client.send_index = len(start_inventory) + len(items)
+                        "items": start_inventory[client.send_index:] + items[first_new_item:]}])
+                ctx.queue_encoded_msgs(client, msg)
+                client.send_index = len(start_inventory) + len(items)
 
 
 def update_checked_locations(ctx: Context, team: int, slot: int):
@@ -1125,6 +1349,7 @@ def get_remaining(ctx: Context, team: int, slot: int) -> typing.List[typing.Tupl
 
 def send_items_to(ctx: Context, team: int, target_slot: int, *items: NetworkItem):
     for target in ctx.slot_set(target_slot):
+        ctx.pending_item_receivers.add((team, target))
         for item in items:
             if item.player != target_slot:
                 get_received_items(ctx, team, target, False).append(item)
@@ -1669,12 +1894,13 @@ class ClientMessageProcessor(CommonCommandProcessor):
             names = self.ctx.item_names_for_game(self.ctx.games[self.client.slot])
             item_name, usable, response = get_intended_text(
                 item_name,
-                names
+                self.ctx.get_fuzzy_index(names)
             )
             if usable:
                 new_item = NetworkItem(names[item_name], -1, self.client.slot)
                 get_received_items(self.ctx, self.client.team, self.client.slot, False).append(new_item)
                 get_received_items(self.ctx, self.client.team, self.client.slot, True).append(new_item)
+                self.ctx.pending_item_receivers.add((self.client.team, self.client.slot))
                 self.ctx.broadcast_text_all(
                     'Cheat console: sending "' + item_name + '" to ' + self.ctx.get_aliased_name(self.client.team,
                                                                                                  self.client.slot),
@@ -1728,7 +1954,7 @@ class ClientMessageProcessor(CommonCommandProcessor):
             names = self.ctx.all_location_and_group_names[game] \
                 if for_location else \
                 self.ctx.all_item_and_group_names[game]
-            hint_name, usable, response = get_intended_text(input_text, names)
+            hint_name, usable, response = get_intended_text(input_text, self.ctx.get_fuzzy_index(names))
 
             if usable:
                 if hint_name in self.ctx.non_hintable_names[game]:
@@ -2187,6 +2413,8 @@ async def process_client_cmd(ctx: Context, client: Client, args: dict):
                 func = modify_functions[operation["operation"]]
                 value = func(value, operation["value"])
             ctx.stored_data[args["key"]] = args["value"] = value
+            if ctx.save_journal:
+                ctx.save_journal.dirty_stored_data.add(args["key"])
             targets = set(ctx.stored_data_notification_clients[args["key"]])
             if args.get("want_reply", False):
                 targets.add(client)
@@ -2377,7 +2605,7 @@ class ServerCommandProcessor(CommonCommandProcessor):
             team, slot = self.ctx.player_name_lookup[seeked_player]
             item_name = " ".join(item_name)
             names = self.ctx.item_names_for_game(self.ctx.games[slot])
-            item_name, usable, response = get_intended_text(item_name, names)
+            item_name, usable, response = get_intended_text(item_name, self.ctx.get_fuzzy_index(names))
             if usable:
                 amount: int = int(amount)
                 if amount > 100:
@@ -2412,7 +2640,8 @@ class ServerCommandProcessor(CommonCommandProcessor):
             if full_name.isnumeric():
                 location, usable, response = int(full_name), True, None
             elif self.ctx.location_names_for_game(game) is not None:
-                location, usable, response = get_intended_text(full_name, self.ctx.location_names_for_game(game))
+                location, usable, response = get_intended_text(
+                    full_name, self.ctx.get_fuzzy_index(self.ctx.location_names_for_game(game)))
             else:
                 self.output("Can't look up location for unknown game. Send by ID instead.")
                 return False
@@ -2443,7 +2672,8 @@ class ServerCommandProcessor(CommonCommandProcessor):
             if full_name.isnumeric():
                 item, usable, response = int(full_name), True, None
             elif game in self.ctx.all_item_and_group_names:
-                item, usable, response = get_intended_text(full_name, self.ctx.all_item_and_group_names[game])
+                item, usable, response = get_intended_text(
+                    full_name, self.ctx.get_fuzzy_index(self.ctx.all_item_and_group_names[game]))
             else:
                 self.output("Can't look up item for unknown game. Hint for ID instead.")
                 return False
@@ -2482,7 +2712,8 @@ class ServerCommandProcessor(CommonCommandProcessor):
             if full_name.isnumeric():
                 location, usable, response = int(full_name), True, None
             elif game in self.ctx.all_location_and_group_names:
-                location, usable, response = get_intended_text(full_name, self.ctx.all_location_and_group_names[game])
+                location, usable, response = get_intended_text(
+                    full_name, self.ctx.get_fuzzy_index(self.ctx.all_location_and_group_names[game]))
             else:
                 self.output("Can't look up location for unknown game. Hint for ID instead.")
                 return False
@@ -2591,6 +2822,8 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument('--password', default=defaults["password"])
     parser.add_argument('--savefile', default=defaults["savefile"])
     parser.add_argument('--disable_save', default=defaults["disable_save"], action='store_true')
+    parser.add_argument('--journal_save', default=defaults["journal_save"], action='store_true',
+                        help="Append changes to a save journal instead of rewriting the whole save each time.")
     parser.add_argument('--cert', help="Path to a SSL Certificate for encryption.")
     parser.add_argument('--cert_key', help="Path to SSL Certificate Key file")
     parser.add_argument('--loglevel', default=defaults["loglevel"],
@@ -2721,6 +2954,7 @@ async def main(args: argparse.Namespace):
         logging.exception(f"Failed to read multiworld data ({e})")
         raise
 
+    ctx.journal_saves = args.journal_save
     ctx.init_save(not args.disable_save)
 
     ssl_context = load_server_cert(args.cert, args.cert_key) if args.cert else None
@@ -2764,6 +2998,7 @@ async def main(args: argparse.Namespace):
     console_task.cancel()
     if ctx.shutdown_task:
         await ctx.shutdown_task
+    ctx.close_multidata()
 
 
 client_message_processor = ClientMessageProcessor
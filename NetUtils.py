@@ -1,15 +1,21 @@
 from __future__ import annotations
 
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterator, Mapping, MutableMapping, Sequence
+import array
+import bisect
 import typing
 import enum
+import struct
+import sys
 import warnings
+import weakref
+import zlib
 from json import JSONEncoder, JSONDecoder
 
 if typing.TYPE_CHECKING:
     from websockets import WebSocketServerProtocol as ServerConnection
 
-from Utils import ByValue, Version
+from Utils import ByValue, Version, restricted_dumps, restricted_loads
 
 
 class HintStatus(ByValue, enum.IntEnum):
@@ -427,6 +433,11 @@ class _LocationStore(dict, typing.MutableMapping[int, typing.Dict[int, typing.Tu
         if len(self.get(0, {})):
             raise ValueError("Invalid player id 0 for location")
 
+    @classmethod
+    def from_buffer(cls, buffer: typing.Any) -> _LocationStore:
+        """Creates a store from the binary locations section of a multidata, see pack_locations."""
+        return cls(unpack_locations(buffer))
+
     def find_item(self, slots: typing.Set[int], seeked_item_id: int
                   ) -> typing.Generator[typing.Tuple[int, int, int, int, int], None, None]:
         for finding_player, check_data in self.items():
@@ -491,6 +502,67 @@ class DataPackage(typing.TypedDict):
     games: dict[str, GamesPackage]
 
 
+class NameTable(Mapping[int, str]):
+    """
+    Immutable id -> name lookup of an item_name_to_id or location_name_to_id table.
+    Ids are stored sorted in an array next to the interned names. Contiguous ids are indexed directly, others are
+    binary searched.
+    """
+    __slots__ = ("_ids", "_names", "_first", "_dense", "__weakref__")
+    _ids: array.array[int]
+    _names: tuple[str, ...]
+    _first: int
+    _dense: bool
+
+    def __init__(self, name_to_id: Mapping[str, int]) -> None:
+        id_to_name = {code: name for name, code in name_to_id.items()}
+        codes = sorted(id_to_name)
+        self._ids = array.array("q", codes)
+        self._names = tuple(sys.intern(id_to_name[code]) for code in codes)
+        self._first = codes[0] if codes else 0
+        self._dense = not codes or codes[-1] - self._first + 1 == len(codes)
+
+    def __getitem__(self, code: int) -> str:
+        if not isinstance(code, int):
+            raise KeyError(code)
+        if self._dense:
+            index = code - self._first
+            if 0 <= index < len(self._names):
+                return self._names[index]
+        else:
+            index = bisect.bisect_left(self._ids, code)
+            if index < len(self._ids) and self._ids[index] == code:
+                return self._names[index]
+        raise KeyError(code)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self)} names)"
+
+
+_name_tables: weakref.WeakValueDictionary[tuple[str, str], NameTable] = weakref.WeakValueDictionary()
+
+
+def get_name_table(name_to_id: Mapping[str, int], checksum: str | None,
+                   lookup_type: typing.Literal["item", "location"]) -> NameTable:
+    """
+    Returns the NameTable of a data package table. Tables of data packages with a checksum are shared by everything in
+    the process that uses that data package, for as long as anything uses them.
+    """
+    if not checksum:
+        return NameTable(name_to_id)
+    key = checksum, lookup_type
+    name_table = _name_tables.get(key)
+    if name_table is None:
+        name_table = _name_tables.setdefault(key, NameTable(name_to_id))
+    return name_table
+
+
 class MultiData(typing.TypedDict):
     slot_data: dict[int, Mapping[str, typing.Any]]
     slot_info: dict[int, NetworkSlot]
@@ -510,6 +582,192 @@ class MultiData(typing.TypedDict):
     race_mode: int
 
 
+multidata_format_version = 5
+"""Version of the .archipelago format written by MultiDataWriter."""
+sectioned_multidata_keys = frozenset({"slot_data"})
+"""Keys of the multidata that are split into one section per slot."""
+
+locations_header = struct.Struct("<QQ")
+"""Header of the binary locations section: record size and player count."""
+location_record = struct.Struct("<qIIqI4x")
+"""Record of the binary locations section, laid out like LocationEntry in _speedups: location, sender, receiver, item
+and flags."""
+
+
+def pack_locations(locations: Mapping[int, Mapping[int, Sequence[int]]]) -> bytes:
+    """
+    Packs the locations of a multidata into records sorted by sender, then location, which LocationStore.from_buffer
+    can use without creating python objects for each location.
+    """
+    data = bytearray(locations_header.pack(location_record.size, len(locations)))
+    for sender, sender_locations in sorted(locations.items()):
+        for location, (item, receiver, flags) in sorted(sender_locations.items()):
+            data += location_record.pack(location, sender, receiver, item, flags)
+    return bytes(data)
+
+
+def unpack_locations(buffer: typing.Any) -> dict[int, dict[int, tuple[int, int, int]]]:
+    """Unpacks locations packed by pack_locations back into the dicts of the multidata."""
+    record_size, player_count = locations_header.unpack_from(buffer)
+    if record_size != location_record.size:
+        raise ValueError(f"Location records of size {record_size} are not supported.")
+    locations: dict[int, dict[int, tuple[int, int, int]]] = {player: {} for player in range(1, player_count + 1)}
+    for location, sender, receiver, item, flags in \
+            location_record.iter_unpack(memoryview(buffer)[locations_header.size:]):
+        locations[sender][location] = item, receiver, flags
+    return locations
+
+SectionTable = dict[typing.Any, typing.Union[tuple[int, int], "SectionTable"]]
+
+
+class MultiDataWriter:
+    """
+    Writes multidata to a .archipelago file one section at a time, each compressed on its own.
+
+    The file starts with the format version byte, followed by the compressed sections, the compressed table of section
+    offsets and finally the offset of that table as an 8 byte little endian integer.
+    The locations are the exception, which are stored uncompressed and 8 byte aligned, see pack_locations.
+    """
+    file: typing.BinaryIO
+    table: SectionTable
+    offset: int
+
+    def __init__(self, file: typing.BinaryIO) -> None:
+        self.file = file
+        self.table = {}
+        file.write(bytes([multidata_format_version]))
+        self.offset = 1
+
+    def _write_raw(self, data: bytes | memoryview) -> tuple[int, int]:
+        position = self.offset, len(data)
+        self.file.write(data)
+        self.offset += len(data)
+        return position
+
+    def _write_value(self, value: typing.Any) -> tuple[int, int]:
+        return self._write_raw(zlib.compress(restricted_dumps(value), 9))
+
+    def _write_aligned(self, data: bytes | memoryview) -> tuple[int, int]:
+        padding = -self.offset % 8
+        if padding:
+            self._write_raw(bytes(padding))
+        return self._write_raw(data)
+
+    def write(self, key: str, value: typing.Any, sectioned: bool | None = None) -> None:
+        """
+        Writes the multidata entry `key`, splitting it into one section per slot if it is sectioned.
+        `sectioned` overrides whether `key` is one of the sectioned_multidata_keys.
+        """
+        if sectioned is None:
+            sectioned = key in sectioned_multidata_keys
+        if sectioned:
+            self.table[key] = {slot: self._write_entry(value, slot) for slot in value}
+        elif key == "locations":
+            self.table[key] = self._write_aligned(pack_locations(value))
+        else:
+            self.table[key] = self._write_value(value)
+
+    def write_section(self, key: str, slot: typing.Any, value: typing.Any) -> None:
+        """Writes the section of `slot` of the sectioned entry `key`, so slots can be written as they are produced."""
+        self.table.setdefault(key, {})[slot] = self._write_value(value)
+
+    def _write_entry(self, multidata: Mapping[typing.Any, typing.Any], key: typing.Any) -> tuple[int, int]:
+        if isinstance(multidata, MultiDataSections) and not multidata.is_loaded(key):
+            # unmodified sections can be copied without recompressing them
+            if key != "locations":
+                return self._write_raw(multidata.get_raw(key))
+            if multidata.has_binary_locations:
+                return self._write_aligned(multidata.get_raw(key))
+        if key == "locations":
+            return self._write_aligned(pack_locations(multidata[key]))
+        return self._write_value(multidata[key])
+
+    def write_all(self, multidata: Mapping[str, typing.Any]) -> None:
+        """Writes all entries of `multidata`, which can also be the MultiDataSections of another file."""
+        for key in multidata:
+            if key in sectioned_multidata_keys:
+                self.write(key, multidata[key])
+            else:
+                self.table[key] = self._write_entry(multidata, key)
+
+    def finish(self) -> None:
+        """Writes the section table, completing the file."""
+        table_offset = self.offset
+        self._write_raw(zlib.compress(restricted_dumps(self.table), 9))
+        self.file.write(struct.pack("<Q", table_offset))
+
+
+class MultiDataSections(MutableMapping[typing.Any, typing.Any]):
+    """
+    Lazily loaded multidata of a sectioned .archipelago file. A section is only decompressed when it's first accessed.
+    The buffer can be bytes or a memory map of the file.
+    """
+    min_format_version: typing.ClassVar[int] = 4
+    """First format version that is sectioned."""
+    buffer: bytes | memoryview | typing.Any
+    table: SectionTable
+    format_version: int
+    _values: dict[typing.Any, typing.Any]
+
+    def __init__(self, buffer: typing.Any, table: SectionTable | None = None,
+                 format_version: int = multidata_format_version) -> None:
+        self.buffer = buffer
+        if table is None:
+            format_version = buffer[0]
+            if not self.min_format_version <= format_version <= multidata_format_version:
+                raise ValueError(f"Multidata is not of format version {self.min_format_version} "
+                                 f"to {multidata_format_version}.")
+            table_offset, = struct.unpack_from("<Q", buffer, len(buffer) - 8)
+            table = restricted_loads(zlib.decompress(memoryview(buffer)[table_offset:len(buffer) - 8]))
+        self.table = table
+        self.format_version = format_version
+        self._values = {}
+
+    @property
+    def has_binary_locations(self) -> bool:
+        """Whether the locations section is packed by pack_locations, which format version 5 introduced."""
+        return self.format_version >= 5 and "locations" in self.table
+
+    def get_raw(self, key: typing.Any) -> memoryview:
+        """Returns the still compressed data of a section."""
+        offset, length = self.table[key]
+        return memoryview(self.buffer)[offset:offset + length]
+
+    def is_loaded(self, key: typing.Any) -> bool:
+        return key in self._values or key not in self.table
+
+    def __getitem__(self, key: typing.Any) -> typing.Any:
+        if key in self._values:
+            return self._values[key]
+        entry = self.table[key]
+        if isinstance(entry, dict):
+            value = MultiDataSections(self.buffer, entry, self.format_version)
+        elif key == "locations" and self.has_binary_locations:
+            value = unpack_locations(self.get_raw(key))
+        else:
+            value = restricted_loads(zlib.decompress(self.get_raw(key)))
+        self._values[key] = value
+        return value
+
+    def __setitem__(self, key: typing.Any, value: typing.Any) -> None:
+        if key not in self.table:
+            self.table[key] = (0, 0)
+        self._values[key] = value
+
+    def __delitem__(self, key: typing.Any) -> None:
+        del self.table[key]
+        self._values.pop(key, None)
+
+    def __iter__(self) -> Iterator[typing.Any]:
+        return iter(self.table)
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self.table)})"
+
+
 if typing.TYPE_CHECKING:  # type-check with pure python implementation until we have a typing stub
     LocationStore = _LocationStore
 else:
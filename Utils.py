@@ -260,6 +260,75 @@ parse_yaml = functools.partial(load, Loader=UniqueKeyLoader)
 parse_yamls = functools.partial(load_all, Loader=UniqueKeyLoader)
 unsafe_parse_yaml = functools.partial(load, Loader=UnsafeLoader)
 
+
+_yaml_cache_sizes: typing.Dict[str, int] = {}
+
+
+def _evict_yaml_cache(folder: str, added_size: int, max_cache_size: int) -> None:
+    """
+    Evicts the least recently used entries of the yaml cache in `folder` once it grows past max_cache_size bytes.
+    The folder is only scanned when the size tracked by this process passes the limit, and is then trimmed to 3/4 of
+    it, so scanning is amortized over many added entries.
+    """
+    if folder in _yaml_cache_sizes:
+        _yaml_cache_sizes[folder] += added_size
+        if _yaml_cache_sizes[folder] <= max_cache_size:
+            return
+    entries = sorted((entry.stat().st_mtime, entry.stat().st_size, entry.path)
+                     for entry in os.scandir(folder) if entry.name.endswith(".pickle"))
+    size = sum(entry_size for _, entry_size, _ in entries)
+    if size > max_cache_size:
+        for _, entry_size, entry_path in entries:
+            if size <= max_cache_size * 3 // 4:
+                break
+            os.remove(entry_path)
+            size -= entry_size
+    _yaml_cache_sizes[folder] = size
+
+
+def parse_yamls_cached(text: str, max_cache_size: int = 64 * 1024 * 1024) -> typing.Tuple[typing.Any, ...]:
+    """
+    Returns all documents of a yaml like parse_yamls, keeping the parsed documents in the user's cache directory,
+    keyed by the hash of the yaml, so parsing the same yaml again only has to load them.
+    The least recently used entries are evicted once the cache grows past max_cache_size bytes.
+    Every call returns new objects, so they can be modified freely.
+
+    Only parsing is cached, not validated options. Options are validated through from_any/verify on the values rolled
+    from their weights, and triggers can change any option after a roll, so there is no validated document before the
+    roll. As nothing cached depends on the worlds, their versions aren't part of the key either.
+    """
+    import hashlib
+
+    folder = cache_path("yaml")
+    key = hashlib.sha256(f"{__version__}\n{text}".encode("utf-8")).hexdigest()
+    path = os.path.join(folder, f"{key}.pickle")
+    try:
+        with open(path, "rb") as f:
+            documents = restricted_loads(f.read())
+        os.utime(path)  # mark as recently used
+        return documents
+    except Exception:
+        pass  # not cached, or cached by something we don't trust to load
+
+    documents = tuple(parse_yamls(text))
+    try:
+        data = pickle.dumps(documents)
+        # documents restricted_loads can't load, like dates, would be parsed and written again every time
+        restricted_loads(data)
+    except Exception as e:
+        logging.debug(f"Not caching parsed yaml: {e}")
+        return documents
+    try:
+        os.makedirs(folder, exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+        _evict_yaml_cache(folder, len(data), max_cache_size)
+    except Exception as e:
+        logging.debug(f"Could not cache parsed yaml: {e}")
+    return documents
+
 del load, load_all  # should not be used. don't leak their names
 
 
@@ -677,27 +746,146 @@ def format_SI_prefix(value, power=1000, power_labels=("", "k", "M", "G", "T", "P
     return f"{value.quantize(decimal.Decimal('1.00'))} {chaining_prefix(n, power_labels)}"
 
 
-def get_fuzzy_results(input_word: str, word_list: typing.Collection[str], limit: typing.Optional[int] = None) \
-        -> typing.List[typing.Tuple[str, int]]:
+def _get_fuzzy_ratio(word1: str, word2: str, lowered1: str, lowered2: str) -> float:
     import jellyfish
 
-    def get_fuzzy_ratio(word1: str, word2: str) -> float:
-        if word1 == word2:
-            return 1.01
-        return (1 - jellyfish.damerau_levenshtein_distance(word1.lower(), word2.lower())
-                / max(len(word1), len(word2)))
+    if word1 == word2:
+        return 1.01
+    return 1 - jellyfish.damerau_levenshtein_distance(lowered1, lowered2) / max(len(word1), len(word2))
+
 
+def get_fuzzy_results(input_word: str, word_list: typing.Union[typing.Collection[str], FuzzyIndex],
+                      limit: typing.Optional[int] = None) -> typing.List[typing.Tuple[str, int]]:
+    if isinstance(word_list, FuzzyIndex):
+        return word_list.get_fuzzy_results(input_word, limit)
+    import heapq
+
+    lowered_input = input_word.lower()
     limit = limit if limit else len(word_list)
-    return list(
-        map(
-            lambda container: (container[0], int(container[1]*100)),  # convert up to limit to int %
-            sorted(
-                map(lambda candidate: (candidate, get_fuzzy_ratio(input_word, candidate)), word_list),
-                key=lambda element: element[1],
-                reverse=True
-            )[0:limit]
+    return [
+        (candidate, int(ratio * 100))  # convert up to limit to int %
+        for candidate, ratio in heapq.nlargest(
+            limit,
+            ((candidate, _get_fuzzy_ratio(input_word, candidate, lowered_input, candidate.lower()))
+             for candidate in word_list),
+            key=lambda element: element[1]
         )
-    )
+    ]
+
+
+class FuzzyIndex:
+    """
+    Bigram index over a collection of words, giving the same results as get_fuzzy_results on it without scoring every
+    word. Words that share few bigrams with the input can't be closer than the results found so far, so they are
+    skipped.
+    """
+    gram_size: typing.ClassVar[int] = 2
+
+    words: typing.Tuple[str, ...]
+    _lowered: typing.Tuple[str, ...]
+    _gram_counts: typing.Tuple[int, ...]
+    _postings: typing.Dict[str, typing.List[typing.Tuple[int, int]]]
+    _by_length: typing.Dict[typing.Tuple[int, int, int], typing.List[int]]
+    """Indices of the words per (length, lowered length, bigram count)."""
+    _unindexed: typing.List[int]
+    """Indices of the words that are always scored, see _is_indexable."""
+
+    def __init__(self, words: typing.Iterable[str]) -> None:
+        self.words = tuple(words)
+        self._lowered = tuple(word.lower() for word in self.words)
+        postings: typing.DefaultDict[str, typing.List[typing.Tuple[int, int]]] = collections.defaultdict(list)
+        by_length: typing.DefaultDict[typing.Tuple[int, int, int], typing.List[int]] = collections.defaultdict(list)
+        gram_counts: typing.List[int] = []
+        self._unindexed = []
+        for index, (word, lowered) in enumerate(zip(self.words, self._lowered)):
+            if not self._is_indexable(lowered):
+                self._unindexed.append(index)
+                gram_counts.append(0)
+                continue
+            grams = self._get_grams(lowered)
+            for gram, count in grams.items():
+                postings[gram].append((index, count))
+            gram_counts.append(sum(grams.values()))
+            by_length[len(word), len(lowered), gram_counts[-1]].append(index)
+        self._gram_counts = tuple(gram_counts)
+        self._postings = dict(postings)
+        self._by_length = dict(by_length)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    @staticmethod
+    def _is_indexable(lowered_word: str) -> bool:
+        # distances are counted in grapheme clusters, which are only guaranteed to be single characters for ascii
+        return lowered_word.isascii() and "\r" not in lowered_word
+
+    @classmethod
+    def _get_grams(cls, word: str) -> collections.Counter[str]:
+        word = f" {word} "  # padded, so the first and last letters count as much as the others
+        return collections.Counter(word[i:i + cls.gram_size] for i in range(len(word) - cls.gram_size + 1))
+
+    @classmethod
+    def _get_max_ratio(cls, input_length: int, lowered_input_length: int, input_grams: int, length: int,
+                       lowered_length: int, grams: int, common_grams: int) -> float:
+        # every edit, including a transposition, removes at most gram_size + 1 of the bigrams of either word
+        min_distance = max(abs(lowered_input_length - lowered_length),
+                           -(-(max(input_grams, grams) - common_grams) // (cls.gram_size + 1)))
+        if not min_distance or not max(input_length, length):
+            return 1.01
+        return 1 - min_distance / max(input_length, length)
+
+    def get_fuzzy_results(self, input_word: str, limit: typing.Optional[int] = None) \
+            -> typing.List[typing.Tuple[str, int]]:
+        import heapq
+
+        lowered_input = input_word.lower()
+        if not self._is_indexable(lowered_input):
+            return get_fuzzy_results(input_word, self.words, limit)
+        limit = limit if limit else len(self.words)
+        input_grams = self._get_grams(lowered_input)
+        input_gram_count = sum(input_grams.values())
+        common: typing.DefaultDict[int, int] = collections.defaultdict(int)
+        for gram, input_count in input_grams.items():
+            for index, count in self._postings.get(gram, ()):
+                common[index] += min(input_count, count)
+
+        # upper bounds of the ratio of single words sharing bigrams with the input, and of groups of words without
+        input_lengths = len(input_word), len(lowered_input), input_gram_count
+        bounds: typing.List[typing.Tuple[float, int, typing.Union[int, typing.List[int]]]] = [
+            (self._get_max_ratio(*input_lengths, len(self.words[index]), len(self._lowered[index]),
+                                 self._gram_counts[index], common_grams), index, index)
+            for index, common_grams in common.items()
+        ]
+        bounds.extend((self._get_max_ratio(*input_lengths, *lengths, 0), indices[0], indices)
+                      for lengths, indices in self._by_length.items())
+        if self._unindexed:
+            bounds.append((1.01, self._unindexed[0], self._unindexed))
+        bounds.sort(key=lambda bound: (-bound[0], bound[1]))
+
+        # keeps the best ratios seen so far, ties are broken by the order of the words like a stable sort would
+        best: typing.List[typing.Tuple[float, int]] = []
+        for max_ratio, _, indices in bounds:
+            if len(best) >= limit and max_ratio < best[0][0]:
+                break
+            for index in (indices,) if isinstance(indices, int) else indices:
+                if isinstance(indices, list) and index in common:
+                    continue
+                ratio = _get_fuzzy_ratio(input_word, self.words[index], lowered_input, self._lowered[index])
+                if len(best) < limit:
+                    heapq.heappush(best, (ratio, -index))
+                elif (ratio, -index) > best[0]:
+                    heapq.heapreplace(best, (ratio, -index))
+        return [(self.words[-index], int(ratio * 100))
+                for ratio, index in sorted(best, key=lambda element: (-element[0], -element[1]))]
+
+
+@functools.lru_cache(maxsize=256)
+def get_fuzzy_index(words: typing.Tuple[str, ...]) -> FuzzyIndex:
+    """
+    Returns a FuzzyIndex over words, shared by every caller in the process asking for the same words in the same
+    order. The order is kept, as it decides between results of the same ratio.
+    """
+    return FuzzyIndex(words)
 
 
 def get_intended_text(input_text: str, possible_answers) -> typing.Tuple[str, bool, str]:
@@ -48,6 +48,10 @@ app.config["JOB_THRESHOLD"] = 1
 app.config["JOB_TIME"] = 600
 # maximum time in seconds since last activity for a room to be hosted
 app.config["MAX_ROOM_TIMEOUT"] = 259200
+# UDP port the website can push room starts and commands to the room hosting on. None only polls the database for them.
+app.config["ROOM_NOTIFY_PORT"] = None
+# address the room hosting receives those notifications on, which has to be reachable from the website
+app.config["ROOM_NOTIFY_HOST"] = "127.0.0.1"
 # memory limit for generator processes in bytes
 app.config["GENERATOR_MEMORY_LIMIT"] = 4294967296
 
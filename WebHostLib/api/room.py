@@ -16,7 +16,7 @@ def room_info(room_id: UUID) -> Dict[str, Any]:
         return abort(404)
 
     def supports_apdeltapatch(game: str) -> bool:
-        return game in worlds.Files.AutoPatchRegister.patch_types
+        return worlds.Files.AutoPatchRegister.get_patch_type(game) is not None
 
     downloads = []
     for slot in sorted(room.seed.slots):
@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import logging
 import multiprocessing
+import time
 import typing
 from datetime import timedelta
 from threading import Event, Thread
@@ -119,22 +120,50 @@ def autohost(config: dict):
         try:
             with Locker("autohost"):
                 cleanup()
+                listener = None
+                if config["ROOM_NOTIFY_PORT"]:
+                    try:
+                        listener = roomnotify.open_listener(config["ROOM_NOTIFY_HOST"], config["ROOM_NOTIFY_PORT"],
+                                                            0.1)
+                    except OSError as e:
+                        logging.exception(f"Could not listen for room notifications, only polling for rooms. {e}")
+                # once notifications arrive, they start rooms immediately and polling only catches lost notifications
+                poll_interval = 0.1
                 hosters = []
                 for x in range(config["HOSTERS"]):
-                    hoster = MultiworldInstance(config, x)
+                    hoster = MultiworldInstance(config, x, listener is not None)
                     hosters.append(hoster)
                     hoster.start()
 
-                while not stop_event.wait(0.1):
-                    with db_session:
-                        rooms = select(
-                            room for room in Room if
-                            room.last_activity >= utcnow() - timedelta(
-                                seconds=config["MAX_ROOM_TIMEOUT"])).order_by(desc(Room.last_port))
-                        for room in rooms:
-                            # we have to filter twice, as the per-room timeout can't currently be PonyORM transpiled.
-                            if room.last_activity >= utcnow() - timedelta(seconds=room.timeout + 5):
-                                hosters[room.id.int % len(hosters)].start_room(room.id)
+                next_poll = 0.
+                while not stop_event.is_set():
+                    if time.monotonic() >= next_poll:
+                        next_poll = time.monotonic() + poll_interval
+                        with db_session:
+                            rooms = select(
+                                room for room in Room if
+                                room.last_activity >= utcnow() - timedelta(
+                                    seconds=config["MAX_ROOM_TIMEOUT"])).order_by(desc(Room.last_port))
+                            for room in rooms:
+                                if should_host(room, config):
+                                    hosters[room.id.int % len(hosters)].start_room(room.id)
+                    if not listener:
+                        stop_event.wait(poll_interval)
+                        continue
+                    notification = roomnotify.receive(listener)
+                    if notification:
+                        poll_interval = 5
+                        kind, room_id = notification
+                        hoster = hosters[room_id.int % len(hosters)]
+                        if kind == roomnotify.ROOM_START:
+                            with db_session:
+                                room = Room.get(id=room_id)
+                                if room and should_host(room, config):
+                                    hoster.start_room(room_id)
+                        elif kind == roomnotify.ROOM_COMMAND:
+                            hoster.notify_command(room_id)
+                if listener:
+                    listener.close()
 
         except AlreadyRunningException:
             logging.info("Autohost reports as already running, not starting another.")
@@ -180,8 +209,15 @@ def autogen(config: dict):
     Thread(target=keep_running, name="AP_Autogen").start()
 
 
+def should_host(room: Room, config: dict) -> bool:
+    # the per-room timeout can't currently be PonyORM transpiled, so this is checked after querying
+    now = utcnow()
+    return (room.last_activity >= now - timedelta(seconds=config["MAX_ROOM_TIMEOUT"])
+            and room.last_activity >= now - timedelta(seconds=room.timeout + 5))
+
+
 class MultiworldInstance():
-    def __init__(self, config: dict, id: int):
+    def __init__(self, config: dict, id: int, notified: bool = False):
         self.room_ids = set()
         self.process: typing.Optional[multiprocessing.Process] = None
         self.ponyconfig = config["PONY"]
@@ -190,6 +226,8 @@ class MultiworldInstance():
         self.host = config["HOST_ADDRESS"]
         self.rooms_to_start = multiprocessing.Queue()
         self.rooms_shutting_down = multiprocessing.Queue()
+        # room ids with new commands, None if the rooms have to poll for commands on their own
+        self.rooms_with_commands: typing.Optional[multiprocessing.Queue] = multiprocessing.Queue() if notified else None
         self.name = f"MultiHoster{id}"
 
     def start(self):
@@ -197,9 +235,10 @@ class MultiworldInstance():
             return False
 
         process = multiprocessing.Process(group=None, target=run_server_process,
-                                          args=(self.name, self.ponyconfig, get_static_server_data(),
+                                          args=(self.name, self.ponyconfig, get_static_server_data_path(),
                                                 self.cert, self.key, self.host,
-                                                self.rooms_to_start, self.rooms_shutting_down),
+                                                self.rooms_to_start, self.rooms_shutting_down,
+                                                self.rooms_with_commands),
                                           name=self.name)
         process.start()
         self.process = process
@@ -213,6 +252,10 @@ class MultiworldInstance():
             self.room_ids.add(room_id)
             self.rooms_to_start.put(room_id)
 
+    def notify_command(self, room_id):
+        if self.rooms_with_commands and room_id in self.room_ids:
+            self.rooms_with_commands.put(room_id)
+
     def stop(self):
         if self.process:
             self.process.terminate()
@@ -227,5 +270,6 @@ class MultiworldInstance():
 
 
 from .models import Room, Generation, STATE_QUEUED, STATE_STARTED, STATE_ERROR, db, Seed, Slot
-from .customserver import run_server_process, get_static_server_data
+from .customserver import run_server_process, get_static_server_data_path
 from .generate import gen_game
+from . import roomnotify
@@ -10,7 +10,7 @@ from WebHostLib import app
 from WebHostLib.upload import allowed_options, allowed_options_extensions, banned_file
 
 from Generate import roll_settings, PlandoOptions
-from Utils import parse_yamls
+from Utils import parse_yamls_cached
 
 
 @app.route('/check', methods=['GET', 'POST'])
@@ -95,7 +95,7 @@ def roll_options(options: dict[str, dict | str],
             if type(text) is dict:
                 yaml_datas = (text, )
             else:
-                yaml_datas = tuple(parse_yamls(text))
+                yaml_datas = parse_yamls_cached(text)
         except Exception as e:
             results[filename] = f"Failed to parse YAML data in {filename}: {e}"
         else:
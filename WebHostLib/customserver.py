@@ -5,7 +5,9 @@ import collections
 import datetime
 import functools
 import logging
+import mmap
 import multiprocessing
+import os
 import pickle
 import random
 import socket
@@ -23,6 +25,7 @@ from MultiServer import (
     Context, server, auto_shutdown, ServerCommandProcessor, ClientMessageProcessor, load_server_cert,
     server_per_message_deflate_factory,
 )
+from NetUtils import MultiDataSections, MultiDataWriter
 from Utils import restricted_loads, cache_argsless
 from .locker import Locker
 from .models import Command, GameDataPackage, Room, db
@@ -62,6 +65,8 @@ class DBCommandProcessor(ServerCommandProcessor):
 
 class WebHostContext(Context):
     room_id: int
+    command_poll_interval: float = 5
+    """seconds between checks for new commands, if no notification about them arrives"""
 
     def __init__(self, static_server_data: dict, logger: logging.Logger):
         # static server data is used during _load_game_data to load required data,
@@ -72,6 +77,7 @@ class WebHostContext(Context):
                                              "enabled", 0, 2, logger=logger)
         del self.static_server_data
         self.main_loop = asyncio.get_running_loop()
+        self.db_commands_event = asyncio.Event()
         self.video = {}
         self.tags = ["AP", "WebHost"]
 
@@ -87,17 +93,20 @@ class WebHostContext(Context):
         for key, value in self.static_server_data.items():
             # NOTE: attributes are mutable and shared, so they will have to be copied before being modified
             setattr(self, key, value)
-        self.non_hintable_names = collections.defaultdict(frozenset, self.non_hintable_names)
+        # filled with the hosted games in _load_non_hintable_names, so the hint blacklists of other games aren't loaded
+        self.static_non_hintable_names = self.non_hintable_names
+        self.non_hintable_names = collections.defaultdict(frozenset)
 
     async def listen_to_db_commands(self):
         cmdprocessor = DBCommandProcessor(self)
 
         while not self.exit_event.is_set():
+            self.db_commands_event.clear()
             await self.main_loop.run_in_executor(None, self._process_db_commands, cmdprocessor)
-            try:
-                await asyncio.wait_for(self.exit_event.wait(), 5)
-            except asyncio.TimeoutError:
-                pass
+            waits = [asyncio.create_task(self.exit_event.wait()), asyncio.create_task(self.db_commands_event.wait())]
+            await asyncio.wait(waits, timeout=self.command_poll_interval, return_when=asyncio.FIRST_COMPLETED)
+            for wait in waits:
+                wait.cancel()
 
     def _process_db_commands(self, cmdprocessor):
         with db_session:
@@ -119,6 +128,7 @@ class WebHostContext(Context):
 
         multidata = self.decompress(room.seed.multidata)
         game_data_packages = {}
+        has_datapackage = "datapackage" in multidata
 
         static_gamespackage = self.gamespackage  # this is shared across all rooms
         static_item_name_groups = self.item_name_groups
@@ -126,7 +136,6 @@ class WebHostContext(Context):
         self.gamespackage = {"Archipelago": static_gamespackage.get("Archipelago", {})}  # this may be modified by _load
         self.item_name_groups = {"Archipelago": static_item_name_groups.get("Archipelago", {})}
         self.location_name_groups = {"Archipelago": static_location_name_groups.get("Archipelago", {})}
-        missing_checksum = False
 
         for game in list(multidata.get("datapackage", {})):
             game_data = multidata["datapackage"][game]
@@ -136,25 +145,29 @@ class WebHostContext(Context):
                     # games package could be dropped from static data once all rooms embed data package
                     del multidata["datapackage"][game]
                 else:
-                    row = GameDataPackage.get(checksum=game_data["checksum"])
-                    if row:  # None if rolled on >= 0.3.9 but uploaded to <= 0.3.8. multidata should be complete
-                        game_data_packages[game] = restricted_loads(row.data)
+                    data = get_game_data_package(game_data["checksum"])
+                    if data:  # None if rolled on >= 0.3.9 but uploaded to <= 0.3.8. multidata should be complete
+                        game_data_packages[game] = data
                         continue
                     else:
                         self.logger.warning(f"Did not find game_data_package for {game}: {game_data['checksum']}")
-            else:
-                missing_checksum = True  # Game rolled on old AP and will load data package from multidata
+            # else: Game rolled on old AP and will load data package from multidata
             self.gamespackage[game] = static_gamespackage.get(game, {})
             self.item_name_groups[game] = static_item_name_groups.get(game, {})
             self.location_name_groups[game] = static_location_name_groups.get(game, {})
 
-        if not game_data_packages and not missing_checksum:
-            # all static -> use the static dicts directly
+        if not has_datapackage:
+            # rolled before data packages were embedded, so any game may be hosted -> use the static data directly
             self.gamespackage = static_gamespackage
             self.item_name_groups = static_item_name_groups
             self.location_name_groups = static_location_name_groups
         return self._load(multidata, game_data_packages, True)
 
+    def _load_non_hintable_names(self):
+        for game in set(self.games.values()):
+            if game in self.static_non_hintable_names:
+                self.non_hintable_names[game] = self.static_non_hintable_names[game]
+
     def init_save(self, enabled: bool = True):
         self.saving = enabled
         if self.saving:
@@ -168,6 +181,7 @@ class WebHostContext(Context):
     @db_session
     def _save(self, exit_save: bool = False) -> bool:
         room = Room.get(id=self.room_id)
+        # always the whole save, as the tracker and other readers of multisave don't replay a SaveJournal
         # Does not use Utils.restricted_dumps because we'd rather make a save than not make one
         room.multisave = pickle.dumps(self.get_save())
         # saving only occurs on activity, so we can "abuse" this information to mark this as last_activity
@@ -185,13 +199,31 @@ def get_random_port():
     return random.randint(49152, 65535)
 
 
+game_data_packages: typing.Dict[str, typing.Dict[str, typing.Any]] = {}
+
+
+def get_game_data_package(checksum: str) -> typing.Optional[typing.Dict[str, typing.Any]]:
+    """
+    Returns the custom data package with the checksum from the database, which is only loaded once per process.
+    Returns a shallow copy, as loading a room removes the name groups from its data package.
+    """
+    if checksum not in game_data_packages:
+        row = GameDataPackage.get(checksum=checksum)
+        if not row:
+            return None
+        game_data_packages[checksum] = restricted_loads(row.data)
+    return dict(game_data_packages[checksum])
+
+
 @cache_argsless
 def get_static_server_data() -> dict:
     import worlds
+    # everything is read from the world cache, so the worlds only get imported if it is outdated
+    games = worlds.network_data_package["games"]
     data = {
         "non_hintable_names": {
-            world_name: world.hint_blacklist
-            for world_name, world in worlds.AutoWorldRegister.world_types.items()
+            world_name: worlds.get_hint_blacklist(world_name)
+            for world_name in games
         },
         "gamespackage": {
             world_name: {
@@ -199,21 +231,48 @@ def get_static_server_data() -> dict:
                 for key, value in game_package.items()
                 if key not in ("item_name_groups", "location_name_groups")
             }
-            for world_name, game_package in worlds.network_data_package["games"].items()
+            for world_name, game_package in games.items()
         },
         "item_name_groups": {
-            world_name: world.item_name_groups
-            for world_name, world in worlds.AutoWorldRegister.world_types.items()
+            world_name: game_package["item_name_groups"]
+            for world_name, game_package in games.items()
         },
         "location_name_groups": {
-            world_name: world.location_name_groups
-            for world_name, world in worlds.AutoWorldRegister.world_types.items()
+            world_name: game_package["location_name_groups"]
+            for world_name, game_package in games.items()
         },
     }
 
     return data
 
 
+@cache_argsless
+def get_static_server_data_path() -> str:
+    """
+    Writes the static server data to a temporary file with one compressed section per game and returns its path.
+    Server processes memory map that file, so only the data of games that are actually hosted gets loaded.
+    """
+    import atexit
+    import tempfile
+
+    with tempfile.NamedTemporaryFile("wb", prefix="static_server_data_", suffix=".archipelago",
+                                     delete=False) as f:
+        writer = MultiDataWriter(f)
+        for key, value in get_static_server_data().items():
+            writer.write(key, value, sectioned=True)
+        writer.finish()
+    atexit.register(os.remove, f.name)
+    return f.name
+
+
+def load_static_server_data(path: str) -> typing.Dict[str, MultiDataSections]:
+    """Maps the file written by get_static_server_data_path, loading the data of each game on first access."""
+    with open(path, "rb") as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    sections = MultiDataSections(buffer)
+    return {key: sections[key] for key in sections}
+
+
 def set_up_logging(room_id) -> logging.Logger:
     import os
     # logger setup
@@ -245,9 +304,10 @@ def tear_down_logging(room_id):
         del logging.Logger.manager.loggerDict[logger_name]
 
 
-def run_server_process(name: str, ponyconfig: dict, static_server_data: dict,
+def run_server_process(name: str, ponyconfig: dict, static_server_data_path: str,
                        cert_file: typing.Optional[str], cert_key_file: typing.Optional[str],
-                       host: str, rooms_to_run: multiprocessing.Queue, rooms_shutting_down: multiprocessing.Queue):
+                       host: str, rooms_to_run: multiprocessing.Queue, rooms_shutting_down: multiprocessing.Queue,
+                       rooms_with_commands: typing.Optional[multiprocessing.Queue] = None):
     from setproctitle import setproctitle
 
     setproctitle(name)
@@ -287,16 +347,25 @@ def run_server_process(name: str, ponyconfig: dict, static_server_data: dict,
                 load_date = today
             return ssl_context
 
+    static_server_data = load_static_server_data(static_server_data_path)
+
     del ponyconfig
     gc.collect()  # free intermediate objects used during setup
 
     loop = asyncio.get_event_loop()
+    contexts: typing.Dict[typing.Any, WebHostContext] = {}
+
+    # set once commands are announced through rooms_with_commands, then polling only catches lost notifications
+    notified_command_poll_interval: typing.Optional[float] = None
 
     async def start_room(room_id):
         with Locker(f"RoomLocker {room_id}"):
             try:
                 logger = set_up_logging(room_id)
                 ctx = WebHostContext(static_server_data, logger)
+                if notified_command_poll_interval:
+                    ctx.command_poll_interval = notified_command_poll_interval
+                contexts[room_id] = ctx
                 ctx.load(room_id)
                 ctx.init_save()
                 assert ctx.server is None
@@ -355,6 +424,8 @@ def run_server_process(name: str, ponyconfig: dict, static_server_data: dict,
                     ctx._save(True)
                     setattr(asyncio.current_task(), "save", None)
             finally:
+                if contexts.get(room_id) is ctx:
+                    del contexts[room_id]
                 try:
                     ctx.save_dirty = False  # make sure the saving thread does not write to DB after final wakeup
                     ctx.exit_event.set()  # make sure the saving thread stops at some point
@@ -396,9 +467,29 @@ def run_server_process(name: str, ponyconfig: dict, static_server_data: dict,
                 logging.info(f"Starting room {next_room} on {name}.")
                 del task  # delete reference to task object
 
+    def notify_commands(room_id):
+        nonlocal notified_command_poll_interval
+        if not notified_command_poll_interval:
+            notified_command_poll_interval = 30
+            for running_ctx in contexts.values():
+                running_ctx.command_poll_interval = notified_command_poll_interval
+        ctx = contexts.get(room_id)
+        if ctx:
+            ctx.db_commands_event.set()
+
+    class CommandNotifier(threading.Thread):
+        def run(self):
+            while 1:
+                room_id = rooms_with_commands.get(block=True, timeout=None)
+                loop.call_soon_threadsafe(notify_commands, room_id)
+
     starter = Starter()
     starter.daemon = True
     starter.start()
+    if rooms_with_commands:
+        command_notifier = CommandNotifier()
+        command_notifier.daemon = True
+        command_notifier.start()
     try:
         loop.run_forever()
     finally:
@@ -36,7 +36,7 @@ def download_patch(room_id, patch_id):
             if "patch_file_ending" in manifest:
                 patch_file_ending = manifest["patch_file_ending"]
             else:
-                patch_file_ending = AutoPatchRegister.patch_types[patch.game].patch_file_ending
+                patch_file_ending = AutoPatchRegister.get_patch_type(patch.game).patch_file_ending
             fname = f"P{patch.player_id}_{patch.player_name}_{app.jinja_env.filters['suuid'](room_id)}" \
                     f"{patch_file_ending}"
             new_file.seek(0)
@@ -14,6 +14,7 @@ from worlds.AutoWorld import AutoWorldRegister, World
 from . import app, cache
 from .markdown import render_markdown
 from .models import Seed, Room, Command, UUID, uuid4
+from .roomnotify import notify_room_command, notify_room_start
 from Utils import title_sorted, utcnow
 
 class WebWorldTheme(StrEnum):
@@ -176,6 +177,7 @@ def new_room(seed: UUID):
         abort(404)
     room = Room(seed=seed, owner=session["_id"], tracker=uuid4())
     commit()
+    notify_room_start(app.config, room.id)
     return redirect(url_for("host_room", room=room.id))
 
 
@@ -225,6 +227,7 @@ def host_room_command(room: UUID):
         if cmd:
             Command(room=room, commandtext=cmd)
             commit()
+            notify_room_command(app.config, room.id)
     return redirect(url_for("host_room", room=room.id))
 
 
@@ -244,6 +247,8 @@ def host_room(room: UUID):
         # we only set last_activity if needed, otherwise parallel access on /room will cause an internal server error
         # due to "pony.orm.core.OptimisticCheckError: Object Room was updated outside of current transaction"
         room.last_activity = now  # will trigger a spinup, if it's not already running
+        commit()
+        notify_room_start(app.config, room.id)
 
     browser_tokens = "Mozilla", "Chrome", "Safari"
     automated = ("update" in request.args
@@ -0,0 +1,60 @@
+"""
+Notifications pushed from the website to the room hosting, so rooms start and run commands without waiting for the next
+database poll. Notifications only carry the room id, the database stays the source of truth, and a notification that
+gets lost is still picked up by polling.
+Notifications are opt-in through ROOM_NOTIFY_PORT. ROOM_NOTIFY_HOST is the address the room hosting listens on, which
+has to be reachable from the website.
+"""
+from __future__ import annotations
+
+import socket
+import typing
+from uuid import UUID
+
+ROOM_START = b"s"
+ROOM_COMMAND = b"c"
+
+
+def notify(config: typing.Mapping[str, typing.Any], kind: bytes, room_id: UUID) -> None:
+    """Sends a notification of `kind` for the room, if notifications are enabled."""
+    port = config.get("ROOM_NOTIFY_PORT")
+    if not port:
+        return
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        try:
+            sock.sendto(kind + room_id.bytes, (config.get("ROOM_NOTIFY_HOST", "127.0.0.1"), port))
+        except OSError:
+            pass  # room hosting will find out through polling
+
+
+def notify_room_start(config: typing.Mapping[str, typing.Any], room_id: UUID) -> None:
+    notify(config, ROOM_START, room_id)
+
+
+def notify_room_command(config: typing.Mapping[str, typing.Any], room_id: UUID) -> None:
+    notify(config, ROOM_COMMAND, room_id)
+
+
+def open_listener(host: str, port: int, timeout: float) -> socket.socket:
+    """Opens the socket notifications are received on. Receiving gives up after `timeout` seconds."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        sock.bind((host, port))
+    except OSError:
+        sock.close()
+        raise
+    sock.settimeout(timeout)
+    return sock
+
+
+def receive(sock: socket.socket) -> typing.Optional[typing.Tuple[bytes, UUID]]:
+    """Waits for the next notification, returning its kind and room id, or None if none arrived in time."""
+    while True:
+        try:
+            data = sock.recv(64)
+        except socket.timeout:
+            return None
+        except ConnectionResetError:
+            continue  # reported on Windows after sending to a closed port, not relevant for receiving
+        if len(data) == 17:
+            return data[:1], UUID(bytes=data[1:])
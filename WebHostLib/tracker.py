@@ -1,7 +1,8 @@
 import datetime
 import collections
+import threading
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple, NamedTuple, Counter
+from typing import Any, Callable, Dict, List, Mapping, Optional, Set, Tuple, NamedTuple, Counter, TypeVar
 from uuid import UUID
 from email.utils import parsedate_to_datetime
 
@@ -9,13 +10,16 @@ from flask import make_response, render_template, request, Request, Response
 from werkzeug.exceptions import abort
 
 from MultiServer import Context, get_saving_second
-from NetUtils import ClientStatus, Hint, NetworkItem, NetworkSlot, SlotType
+from NetUtils import ClientStatus, Hint, NetworkItem, NetworkSlot, SlotType, get_name_table
 from Utils import restricted_loads, KeyedDefaultDict, utcnow
 from . import app, cache
 from .models import GameDataPackage, Room
 
 # Multisave is currently updated, at most, every minute.
 TRACKER_CACHE_TIMEOUT_IN_SECONDS = 60
+# Size in bytes of the stored seeds and room saves whose decoded data is kept in each process, so trackers don't have to
+# decode them again. Decoded data takes about 10 to 15 times as much memory as its stored form.
+TRACKER_DATA_CACHE_SIZE = 32 * 1024 * 1024  # 32 megabyte limit
 
 _multiworld_trackers: Dict[str, Callable] = {}
 _player_trackers: Dict[str, Callable] = {}
@@ -40,12 +44,92 @@ def _cache_results(func: Callable) -> Callable:
     return method_wrapper
 
 
+class _SeedData(NamedTuple):
+    """The part of the tracker data that is the same for all rooms of a seed."""
+    multidata: Dict[str, Any]
+    item_name_to_id: Dict[str, Dict[str, int]]
+    location_name_to_id: Dict[str, Dict[str, int]]
+    item_id_to_name: Dict[str, Mapping[int, str]]
+    location_id_to_name: Dict[str, Mapping[int, str]]
+
+
+class _SaveData(NamedTuple):
+    raw: bytes
+    multisave: Dict[str, Any]
+
+
+_T = TypeVar("_T")
+_CacheKey = Tuple[str, UUID]
+_cached_data: "collections.OrderedDict[_CacheKey, Tuple[Any, int]]" = collections.OrderedDict()
+_cached_data_size = 0
+_data_lock = threading.Lock()
+
+
+def _get_cached(key: _CacheKey, is_valid: Callable[[_T], bool], load: Callable[[], Tuple[_T, int]]) -> _T:
+    """Returns the entry of the process-level LRU cache, loading it again if missing or no longer valid.
+    load returns the entry and the size of the stored data it was decoded from. Least recently used entries are evicted
+    while the cache holds more than TRACKER_DATA_CACHE_SIZE bytes of stored data."""
+    global _cached_data_size
+    with _data_lock:
+        entry = _cached_data.get(key)
+        if entry is not None and is_valid(entry[0]):
+            _cached_data.move_to_end(key)
+            return entry[0]
+    value, size = load()
+    with _data_lock:
+        old_entry = _cached_data.pop(key, None)
+        if old_entry is not None:
+            _cached_data_size -= old_entry[1]
+        _cached_data[key] = value, size
+        _cached_data_size += size
+        while _cached_data_size > TRACKER_DATA_CACHE_SIZE:
+            _cached_data_size -= _cached_data.popitem(last=False)[1][1]
+    return value
+
+
+def _load_seed_data(room: Room) -> Tuple[_SeedData, int]:
+    raw = room.seed.multidata
+    multidata = Context.decompress(raw)
+    seed_data = _SeedData(multidata, {}, {}, KeyedDefaultDict(lambda game_name: {
+        game_name: KeyedDefaultDict(lambda code: f"Unknown Game {game_name} - Item (ID: {code})")
+    }), KeyedDefaultDict(lambda game_name: {
+        game_name: KeyedDefaultDict(lambda code: f"Unknown Game {game_name} - Location (ID: {code})")
+    }))
+
+    # Generate inverse lookup tables from data package, useful for trackers.
+    for game, game_package in multidata["datapackage"].items():
+        checksum = game_package["checksum"]
+        game_package = restricted_loads(GameDataPackage.get(checksum=checksum).data)
+        seed_data.item_id_to_name[game] = collections.ChainMap(
+            get_name_table(game_package["item_name_to_id"], checksum, "item"),
+            KeyedDefaultDict(lambda code: f"Unknown Item (ID: {code})"))
+        seed_data.location_id_to_name[game] = collections.ChainMap(
+            get_name_table(game_package["location_name_to_id"], checksum, "location"),
+            KeyedDefaultDict(lambda code: f"Unknown Location (ID: {code})"))
+
+        # Normal lookup tables as well.
+        seed_data.item_name_to_id[game] = game_package["item_name_to_id"]
+        seed_data.location_name_to_id[game] = game_package["location_name_to_id"]
+    return seed_data, len(raw)
+
+
+def _get_save_data(room: Room) -> Dict[str, Any]:
+    """Returns the decoded multisave of the room, which is only decoded again when the room saved since."""
+    raw = room.multisave
+    if not raw:
+        return {}
+    raw = bytes(raw)
+    return _get_cached(("save", room.id), lambda save_data: save_data.raw == raw,
+                       lambda: (_SaveData(raw, restricted_loads(raw)), len(raw))).multisave
+
+
 @dataclass
 class TrackerData:
     """A helper dataclass that is instantiated each time an HTTP request comes in for tracker data.
 
     Provides helper methods to lazily load necessary data that each tracker require and caches any results so any
     subsequent helper method calls do not need to recompute results during the lifetime of this instance.
+    The decoded multidata and multisave are shared between instances and must not be modified.
     """
     room: Room
     _multidata: Dict[str, Any]
@@ -55,30 +139,16 @@ class TrackerData:
     def __init__(self, room: Room):
         """Initialize a new RoomMultidata object for the current room."""
         self.room = room
-        self._multidata = Context.decompress(room.seed.multidata)
-        self._multisave = restricted_loads(room.multisave) if room.multisave else {}
+        # seeds never change, so their decoded data is kept until evicted
+        seed_data = _get_cached(("seed", room.seed.id), lambda _: True, lambda: _load_seed_data(room))
+        self._multidata = seed_data.multidata
+        self._multisave = _get_save_data(room)
         self._tracker_cache = {}
 
-        self.item_name_to_id: Dict[str, Dict[str, int]] = {}
-        self.location_name_to_id: Dict[str, Dict[str, int]] = {}
-
-        # Generate inverse lookup tables from data package, useful for trackers.
-        self.item_id_to_name: Dict[str, Dict[int, str]] = KeyedDefaultDict(lambda game_name: {
-            game_name: KeyedDefaultDict(lambda code: f"Unknown Game {game_name} - Item (ID: {code})")
-        })
-        self.location_id_to_name: Dict[str, Dict[int, str]] = KeyedDefaultDict(lambda game_name: {
-            game_name: KeyedDefaultDict(lambda code: f"Unknown Game {game_name} - Location (ID: {code})")
-        })
-        for game, game_package in self._multidata["datapackage"].items():
-            game_package = restricted_loads(GameDataPackage.get(checksum=game_package["checksum"]).data)
-            self.item_id_to_name[game] = KeyedDefaultDict(lambda code: f"Unknown Item (ID: {code})", {
-                id: name for name, id in game_package["item_name_to_id"].items()})
-            self.location_id_to_name[game] = KeyedDefaultDict(lambda code: f"Unknown Location (ID: {code})", {
-                id: name for name, id in game_package["location_name_to_id"].items()})
-
-            # Normal lookup tables as well.
-            self.item_name_to_id[game] = game_package["item_name_to_id"]
-            self.location_name_to_id[game] = game_package["location_name_to_id"]
+        self.item_name_to_id: Dict[str, Dict[str, int]] = seed_data.item_name_to_id
+        self.location_name_to_id: Dict[str, Dict[str, int]] = seed_data.location_name_to_id
+        self.item_id_to_name: Dict[str, Mapping[int, str]] = seed_data.item_id_to_name
+        self.location_id_to_name: Dict[str, Mapping[int, str]] = seed_data.location_id_to_name
 
     def get_seed_name(self) -> str:
         """Retrieves the seed name."""
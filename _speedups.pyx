@@ -9,11 +9,13 @@ This is deliberately .pyx because using a non-compiled "pure python" may be slow
 
 # pip install cython cymem
 import cython
+import sys
 import warnings
 from cpython cimport PyObject
 from typing import Any, Dict, Iterable, Iterator, Generator, Sequence, Tuple, TypeVar, Union, Set, List, TYPE_CHECKING
 from cymem.cymem cimport Pool
-from libc.stdint cimport int64_t, uint32_t
+from libc.stdint cimport int64_t, uint32_t, uint64_t
+from libc.string cimport memcpy
 from collections import defaultdict
 
 cdef extern from *:
@@ -88,6 +90,7 @@ cdef class LocationStore:
 
     cdef Pool _mem
     cdef object _len
+    cdef object _buffer  # owner of entries, if they are not allocated from _mem
     cdef LocationEntry* entries  # 3.2MB/100k items
     cdef size_t entry_count
     cdef IndexEntry* sender_index  # 16KB/1000 players
@@ -172,7 +175,81 @@ cdef class LocationStore:
                 self.sender_index[sender].count += 1
                 i += 1
 
+        self._build_caches(max_sender, count, sender_count)
+
+    @staticmethod
+    def from_buffer(buffer: Any) -> LocationStore:
+        """
+        Creates a store from the binary locations section of a multidata, see NetUtils.pack_locations.
+        The records are used in place, without creating python objects for them, unless they have to be realigned.
+        """
+        if sys.byteorder != "little":
+            # records are stored little endian
+            from NetUtils import unpack_locations
+            return LocationStore(unpack_locations(buffer))
+
+        cdef const unsigned char[::1] data = memoryview(buffer).cast("B")
+        cdef LocationStore store = LocationStore.__new__(LocationStore)
+        store._mem = Pool()
+        store._keys = []
+        store._items = []
+        store._proxies = []
+
+        cdef uint64_t header[2]  # record size, player count
+        if <size_t>data.shape[0] < sizeof(header):
+            raise ValueError("Locations buffer is too short")
+        memcpy(header, &data[0], sizeof(header))
+        if header[0] != sizeof(LocationEntry):
+            raise ValueError(f"Location records of size {header[0]} do not match LocationEntry")
+        cdef size_t max_sender = header[1]
+        if max_sender < 1:
+            raise ValueError(f"Rejecting game with 0 players")
+        if max_sender > MAX_PLAYER_ID:
+            raise ValueError(f"Invalid player count {max_sender}")
+        cdef size_t size = data.shape[0] - sizeof(header)
+        if size % sizeof(LocationEntry):
+            raise ValueError("Locations buffer does not contain whole records")
+        cdef size_t count = size // sizeof(LocationEntry)
+
+        store.sender_index = <IndexEntry*>store._mem.alloc(max_sender + 1, sizeof(IndexEntry))
+        store._raw_proxies = <PyObject**>store._mem.alloc(max_sender + 1, sizeof(PyObject*))
+        assert store.sender_index
+        assert store._raw_proxies
+
+        if not count:
+            warnings.warn("Game has no locations")
+        elif (<size_t>&data[sizeof(header)]) % sizeof(ap_id_t):
+            # copy misaligned records, such as from a buffer that does not start at the beginning of the file
+            store.entries = <LocationEntry*>store._mem.alloc(count, sizeof(LocationEntry))
+            memcpy(store.entries, &data[sizeof(header)], size)
+        else:
+            store.entries = <LocationEntry*>&data[sizeof(header)]
+            store._buffer = data  # keep the records alive; also prevents closing a memory map while in use
+
+        # validate the records and build the index, which requires them to be sorted by sender, then location
+        cdef size_t i
+        cdef LocationEntry* entry
+        cdef LocationEntry* previous = NULL
+        for i in range(count):
+            entry = store.entries + i
+            if entry.sender < 1 or entry.sender > max_sender:
+                raise ValueError(f"Invalid player id {entry.sender} for location")
+            if entry.receiver < 1 or entry.receiver > MAX_PLAYER_ID:
+                raise ValueError(f"Invalid player id {entry.receiver} for item")
+            if previous and (entry.sender < previous.sender or
+                             entry.sender == previous.sender and entry.location <= previous.location):
+                raise ValueError("Location records are not sorted")
+            if not store.sender_index[entry.sender].count:
+                store.sender_index[entry.sender].start = i
+            store.sender_index[entry.sender].count += 1
+            previous = entry
+
+        store._build_caches(max_sender, count, max_sender)
+        return store
+
+    cdef _build_caches(self, size_t max_sender, size_t count, size_t sender_count):
         # build pyobject caches
+        cdef size_t i
         self._proxies.append(None)  # player 0
         assert self.sender_index[0].count == 0
         for i in range(1, max_sender + 1):
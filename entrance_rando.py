@@ -5,7 +5,7 @@ import time
 from collections import deque
 from collections.abc import Callable, Iterable
 
-from BaseClasses import CollectionState, Entrance, Region, EntranceType
+from BaseClasses import CollectionState, Entrance, EntranceType, Location, Region
 from Options import Accessibility
 from worlds.AutoWorld import World
 
@@ -16,34 +16,66 @@ class EntranceRandomizationError(RuntimeError):
 
 class EntranceLookup:
     class GroupLookup:
-        _lookup: dict[int, list[Entrance]]
+        _lookup: dict[int, dict[Entrance, None]]
+        """entrances by group. dicts keep the order of a list, but entrances can be removed in constant time"""
+        _names: dict[str, list[Entrance]]
+        _count: int
 
         def __init__(self):
             self._lookup = {}
+            self._names = {}
+            self._count = 0
 
         def __len__(self):
-            return sum(map(len, self._lookup.values()))
+            return self._count
 
         def __bool__(self):
             return bool(self._lookup)
 
+        def __contains__(self, entrance: Entrance) -> bool:
+            return entrance in self._lookup.get(entrance.randomization_group, ())
+
         def __getitem__(self, item: int) -> list[Entrance]:
-            return self._lookup.get(item, [])
+            return list(self._lookup.get(item, ()))
 
         def __iter__(self):
             return itertools.chain.from_iterable(self._lookup.values())
 
         def __repr__(self):
-            return str(self._lookup)
+            return str({group: list(entrances) for group, entrances in self._lookup.items()})
 
         def add(self, entrance: Entrance) -> None:
-            self._lookup.setdefault(entrance.randomization_group, []).append(entrance)
+            self._lookup.setdefault(entrance.randomization_group, {})[entrance] = None
+            self._names.setdefault(entrance.name, []).append(entrance)
+            self._count += 1
 
         def remove(self, entrance: Entrance) -> None:
             group = self._lookup[entrance.randomization_group]
-            group.remove(entrance)
+            del group[entrance]
             if not group:
                 del self._lookup[entrance.randomization_group]
+            named = self._names[entrance.name]
+            named.remove(entrance)
+            if not named:
+                del self._names[entrance.name]
+            self._count -= 1
+
+        def shuffle(self, group: int, rng: random.Random) -> None:
+            """Shuffles the order of a group in place, consuming the same randomness as shuffling it as a list."""
+            entrances = self[group]
+            rng.shuffle(entrances)
+            if entrances:
+                self._lookup[group] = dict.fromkeys(entrances)
+
+        def find(self, name: str, group: int | None = None) -> Entrance | None:
+            named = self._names.get(name, [])
+            if group is not None:
+                named = [entrance for entrance in named if entrance.randomization_group == group]
+            if len(named) < 2:
+                return named[0] if named else None
+            # targets sharing a name are found in the current, possibly shuffled order of the groups
+            return next(entrance for entrance in (self if group is None else self._lookup[group])
+                        if entrance.name == name)
 
     dead_ends: GroupLookup
     others: GroupLookup
@@ -134,7 +166,7 @@ class EntranceLookup:
         lookup = self.dead_ends if dead_end else self.others
         if preserve_group_order:
             for group in groups:
-                self._random.shuffle(lookup[group])
+                lookup.shuffle(group, self._random)
             ret = [entrance for group in groups for entrance in lookup[group]]
         else:
             ret = [entrance for group in groups for entrance in lookup[group]]
@@ -146,8 +178,8 @@ class EntranceLookup:
         Finds a specific target in the lookup, if it is present.
 
         :param name: The name of the target
-        :param group: The target's group. Providing this will make the lookup faster, but can be omitted if it is not
-                      known ahead of time for some reason.
+        :param group: The target's group. Providing this excludes targets of the same name in other groups, but can be
+                      omitted if it is not known ahead of time for some reason.
         :param dead_end: Whether the target is a dead end. Providing this will make the lookup faster, but can be
                          omitted if this is not known ahead of time (much more likely)
         """
@@ -156,11 +188,7 @@ class EntranceLookup:
                     if (found := self.find_target(name, group, True))
                     else self.find_target(name, group, False))
         lookup = self.dead_ends if dead_end else self.others
-        targets_to_check = lookup if group is None else lookup[group]
-        for target in targets_to_check:
-            if target.name == name:
-                return target
-        return None
+        return lookup.find(name, group)
 
     def __len__(self):
         return len(self.dead_ends) + len(self.others)
@@ -180,6 +208,10 @@ class ERPlacementState:
     """A lookup table of all unconnected ER targets"""
     coupled: bool
     """Whether entrance randomization is operating in coupled mode"""
+    _new_connections: list[Entrance] | None
+    """Exits connected since the last update of the reachable regions, or None if other changes need a full update"""
+    _advancement_locations: list[Location]
+    """The world's locations holding advancement items, which are the only ones a sweep has to check"""
 
     def __init__(self, world: World, entrance_lookup: EntranceLookup, coupled: bool):
         self.placements = []
@@ -187,6 +219,7 @@ class ERPlacementState:
         self.world = world
         self.coupled = coupled
         self.entrance_lookup = entrance_lookup
+        self._new_connections = None
 
         # Construct an 'all state', similar to MultiWorld.get_all_state(), but only for the world which is having its
         # entrances randomized.
@@ -197,7 +230,8 @@ class ERPlacementState:
                 world.collect(single_player_all_state, item)
         for item in world.get_pre_fill_items():
             world.collect(single_player_all_state, item)
-        single_player_all_state.sweep_for_advancements(world.get_locations())
+        self._advancement_locations = [location for location in world.get_locations() if location.advancement]
+        single_player_all_state.sweep_for_advancements(self._advancement_locations)
         self.collection_state = single_player_all_state
 
     @property
@@ -223,21 +257,48 @@ class ERPlacementState:
         target_region.entrances.remove(target_entrance)
         source_exit.connect(target_region)
 
+        if not self.collection_state.stale[self.world.player]:
+            # nothing else changed since the last update, so it only has to search from the new connections
+            self._new_connections = []
+        if self._new_connections is not None:
+            self._new_connections.append(source_exit)
         self.collection_state.stale[self.world.player] = True
         self.placements.append(source_exit)
         self.pairings.append((source_exit.name, target_entrance.name))
         self.entrance_lookup.remove(target_entrance)
 
+    def update_reachable_regions(self) -> None:
+        """
+        Propagates the connections made since the last update to the reachable regions, then sweeps for advancements.
+        Only the new connections are searched from, unless the state changed in other ways, like collecting items.
+        """
+        player = self.world.player
+        if self.collection_state.stale[player]:
+            self.collection_state.update_reachable_regions(player, self._new_connections)
+        self._new_connections = None
+        self.collection_state.sweep_for_advancements(self._advancement_locations)
+
     def test_speculative_connection(self, source_exit: Entrance, target_entrance: Entrance,
                                     usable_exits: set[Entrance]) -> bool:
+        # the copy shares the containers of the state until they're modified, and is only searched from the new region
         copied_state = self.collection_state.copy()
+        player = self.world.player
+        target_region = target_entrance.connected_region
         # simulated connection. A real connection is unsafe because the region graph is shallow-copied and would
         # propagate back to the real multiworld.
-        copied_state.reachable_regions[self.world.player].add(target_entrance.connected_region)
-        copied_state.blocked_connections[self.world.player].remove(source_exit)
-        copied_state.blocked_connections[self.world.player].update(target_entrance.connected_region.exits)
-        copied_state.update_reachable_regions(self.world.player)
-        copied_state.sweep_for_advancements(self.world.get_locations())
+        reachable_regions, blocked_connections = copied_state.make_regions_exclusive(player)
+        reachable_regions.add(target_region)
+        blocked_connections.remove(source_exit)
+        blocked_connections.update(target_region.exits)
+        new_connections = list(target_region.exits)
+        if self.collection_state.stale[player] or not self.world.explicit_indirect_conditions:
+            # the state changed in other ways as well, or entrances may depend on the region added by hand without
+            # being registered, so search from everything
+            new_connections = None
+        elif target_region in self.world.multiworld.indirect_connections:
+            new_connections.extend(self.world.multiworld.indirect_connections[target_region])
+        copied_state.update_reachable_regions(player, new_connections)
+        copied_state.sweep_for_advancements(self._advancement_locations)
         # test that at there are newly reachable randomized exits that are ACTUALLY reachable
         available_randomized_exits = copied_state.blocked_connections[self.world.player]
         for _exit in available_randomized_exits:
@@ -412,8 +473,7 @@ def randomize_entrances(
     def do_placement(source_exit: Entrance, target_entrance: Entrance) -> None:
         placed_exits, paired_entrances = er_state.connect(source_exit, target_entrance)
         # propagate new connections
-        er_state.collection_state.update_reachable_regions(world.player)
-        er_state.collection_state.sweep_for_advancements(world.get_locations())
+        er_state.update_reachable_regions()
         if on_connect:
             change = on_connect(er_state, placed_exits, paired_entrances)
             if change:
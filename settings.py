@@ -37,6 +37,7 @@ def _update_cache() -> None:
 
     try:
         from worlds.AutoWorld import AutoWorldRegister
+        # iterating world_types imports every world
         for world in AutoWorldRegister.world_types.values():
             annotation = world.__annotations__.get("settings", None)
             if annotation is None or annotation == "ClassVar[Optional['Group']]":
@@ -609,12 +610,20 @@ class ServerOptions(Group):
         OFF = 0
         ON = 1
 
+    class JournalSave(Bool):
+        """
+        Append only the changes since the last save to a journal next to the save file,
+        instead of rewriting the whole save every time. The journal is compacted into the save file once it grows large.
+        Only applies to save files, rooms hosted by the WebHost always store their whole save in the database.
+        """
+
     host: str | None = None
     port: int = 38281
     password: str | None = None
     multidata: str | None = None
     savefile: str | None = None
     disable_save: bool = False
+    journal_save: JournalSave | bool = False
     loglevel: str = "info"
     logtime: bool = False
     server_password: ServerPassword | None = None
@@ -687,6 +696,37 @@ class GeneratorOptions(Group):
         start_inventory -> Move remaining items to start_inventory, generate additional filler items to fill locations.
         """
 
+    class RollProcesses(int):
+        """
+        Number of processes to read player files and roll their options in.
+        1 does it in the generating process. Every number rolls the same options for the same seed.
+        """
+
+    class OutputProcesses(int):
+        """
+        Number of processes to generate the output of worlds that support it in, such as patch files.
+        1 generates all output in threads of the generating process.
+        """
+
+    class PlaythroughProcesses(int):
+        """
+        Number of processes to check which progression items the spoiler playthrough requires in.
+        Only used on Linux, the only platform where processes can safely be forked. Results are the same either way.
+        """
+
+    class SharedStateCopies(Bool):
+        """
+        Let copies of collection states share their item and region containers until either modifies them,
+        making copies during fill cheaper.
+        Only safe if all worlds modify them through CollectionState's methods or in World.collect and World.remove.
+        """
+
+    class CompactCollectionState(Bool):
+        """
+        Store the item counts of collection states in a dict that copies faster than a Counter,
+        making copies during fill cheaper.
+        """
+
     enemizer_path: EnemizerPath = EnemizerPath("EnemizerCLI/EnemizerCLI.Core")  # + ".exe" is implied on Windows
     player_files_path: PlayerFilesPath = PlayerFilesPath("Players")
     players: Players = Players(0)
@@ -696,6 +736,11 @@ class GeneratorOptions(Group):
     race: Race = Race(0)
     plando_options: PlandoOptions = PlandoOptions("bosses, connections, texts")
     panic_method: PanicMethod = PanicMethod("swap")
+    roll_processes: RollProcesses = RollProcesses(1)
+    output_processes: OutputProcesses = OutputProcesses(1)
+    playthrough_processes: PlaythroughProcesses = PlaythroughProcesses(1)
+    compact_collection_state: CompactCollectionState | bool = False
+    shared_state_copies: SharedStateCopies | bool = False
     loglevel: str = "info"
     logtime: bool = False
 
@@ -838,6 +883,9 @@ class Settings(Group):
         if not skip_autosave:
             import atexit
             atexit.register(autosave)
+            if self.changed:
+                # saving imports all worlds, which can fail once the interpreter is shutting down, so import them now
+                _update_cache()
 
     def save(self, location: str | None = None) -> None:  # as above
         from Utils import parse_yaml
@@ -0,0 +1,174 @@
+def run_generation_benchmark() -> None:
+    """
+    Generate multiworlds from fixed sets of player files and seeds, reporting the time taken by each generation stage,
+    the peak memory usage and the amount of can_reach calls as JSON, so results can be compared between commits.
+
+    Every fixture is generated in a fresh process, so world imports and peak memory are not shared between fixtures.
+    """
+    import argparse
+    import concurrent.futures
+    import json
+    import logging
+    import multiprocessing
+    import platform
+    import subprocess
+    import sys
+
+    from Utils import init_logging, __version__
+
+    parser = argparse.ArgumentParser(description="Benchmark end-to-end generation of player file fixtures.")
+    parser.add_argument("--players", type=int, nargs="+", default=[1, 25, 100, 500],
+                        help="Slot counts of the fixtures to generate.")
+    parser.add_argument("--games", nargs="+", default=default_games,
+                        help="Games to cycle through when creating the player files of a fixture.")
+    parser.add_argument("--seed", type=int, default=1, help="Seed to generate every fixture with.")
+    parser.add_argument("--no_call_counts", action="store_true",
+                        help="Don't count can_reach calls, which adds a small overhead to every call.")
+    parser.add_argument("--output", help="File to write the JSON report to, instead of stdout.")
+    args = parser.parse_args()
+
+    init_logging("Benchmark Runner")
+    logger = logging.getLogger("Benchmark")
+
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        commit = None
+    report = {
+        "version": __version__,
+        "commit": commit,
+        "python": sys.version,
+        "platform": platform.platform(),
+        "fixtures": [],
+    }
+    for players in args.players:
+        logger.info(f"Generating fixture with {players} players.")
+        with concurrent.futures.ProcessPoolExecutor(1, multiprocessing.get_context("spawn")) as pool:
+            try:
+                result = pool.submit(generate_fixture, players, args.games, args.seed,
+                                     not args.no_call_counts).result()
+            except Exception as e:
+                logger.exception(e)
+                result = {"players": players, "error": repr(e)}
+        report["fixtures"].append(result)
+        if "total" in result:
+            logger.info(f"{result['total']:.4f} seconds for {players} players.")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+
+default_games = [
+    "A Hat in Time",
+    "DLCQuest",
+    "Hollow Knight",
+    "Risk of Rain 2",
+    "Stardew Valley",
+    "Subnautica",
+    "Terraria",
+    "The Witness",
+    "Timespinner",
+]
+
+
+def generate_fixture(players: int, games: list[str], seed: int, count_calls: bool) -> dict:
+    """Generates `players` slots cycling through `games`, returning the measurements of that generation."""
+    import collections
+    import functools
+    import os
+    import sys
+    import tempfile
+    import time
+
+    import Generate
+    import Main
+    from BaseClasses import CollectionState, Entrance, Location, Region
+    from worlds import AutoWorld
+
+    stages: collections.Counter[str] = collections.Counter()
+    can_reach_calls: collections.Counter[str] = collections.Counter()
+    output_start = 0.
+
+    def timed(name: str, function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                stages[name] += time.perf_counter() - start
+
+        return wrapper
+
+    def counted(name: str, function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            can_reach_calls[name] += 1
+            return function(*args, **kwargs)
+
+        return wrapper
+
+    call_all = AutoWorld.call_all
+
+    def call_all_timed(multiworld, method_name: str, *args):
+        nonlocal output_start
+        start = time.perf_counter()
+        try:
+            return call_all(multiworld, method_name, *args)
+        finally:
+            stages[method_name] += time.perf_counter() - start
+            if method_name == "pre_output":
+                output_start = time.perf_counter()
+
+    AutoWorld.call_all = call_all_timed
+    Main.distribute_items_restrictive = timed("distribute_items_restrictive", Main.distribute_items_restrictive)
+    Main.balance_multiworld_progression = timed("balance_multiworld_progression",
+                                                Main.balance_multiworld_progression)
+    if count_calls:
+        for cls in (CollectionState, Region, Entrance, Location):
+            cls.can_reach = counted(f"{cls.__name__}.can_reach", cls.can_reach)
+
+    with tempfile.TemporaryDirectory() as player_files, tempfile.TemporaryDirectory() as output:
+        for player in range(1, players + 1):
+            game = games[(player - 1) % len(games)]
+            with open(os.path.join(player_files, f"Player{player}.yaml"), "w") as f:
+                f.write(f"name: Player{player}\ngame: {game}\n{game}: {{}}\n")
+
+        start = time.perf_counter()
+        generate_args, seed = Generate.main(Generate.mystery_argparse([
+            "--player_files_path", player_files,
+            "--outputpath", output,
+            "--seed", str(seed),
+            "--spoiler", "1",
+        ]))
+        stages["roll_settings"] = time.perf_counter() - start
+        Main.main(generate_args, seed)
+        end = time.perf_counter()
+        stages["output"] = end - output_start
+
+    try:
+        import resource
+    except ImportError:
+        peak_rss = None  # not available on Windows
+    else:
+        peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform == "darwin":
+            peak_rss //= 1024  # bytes instead of kilobytes
+    return {
+        "players": players,
+        "games": sorted(set(games[:players])),
+        "seed": seed,
+        "total": end - start,
+        "stages": dict(stages),
+        "peak_rss_kb": peak_rss,
+        "can_reach_calls": dict(can_reach_calls) if count_calls else None,
+    }
+
+
+if __name__ == "__main__":
+    from path_change import change_home
+    change_home()
+    run_generation_benchmark()
@@ -12,10 +12,11 @@ def run_load_worlds_benchmark():
 
     import BaseClasses, Launcher, Fill
 
-    from worlds import world_sources
+    from worlds import load_all_worlds, world_sources
 
     init_logging("Benchmark Runner")
     logger = logging.getLogger("Benchmark")
+    load_all_worlds()
 
     for module in world_sources:
         logger.info(f"{module} took {module.time_taken:.4f} seconds.")
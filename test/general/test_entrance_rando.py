@@ -1,8 +1,9 @@
 from typing import Callable
+import random
 import unittest
 from enum import IntEnum
 
-from BaseClasses import Region, EntranceType, MultiWorld, Entrance
+from BaseClasses import CollectionState, Region, EntranceType, MultiWorld, Entrance
 from entrance_rando import disconnect_entrance_for_randomization, randomize_entrances, EntranceRandomizationError, \
     ERPlacementState, EntranceLookup, bake_target_group_lookup
 from Options import Accessibility
@@ -173,6 +174,41 @@ class TestEntranceLookup(unittest.TestCase):
         # wrong deadendedness
         self.assertIsNone(lookup.find_target("region0_right", ERTestGroups.RIGHT, True))
 
+    def test_remove_target(self):
+        """Tests that removed targets can't be found anymore and the remaining targets keep their order"""
+        multiworld = generate_test_multiworld()
+        generate_disconnected_region_grid(multiworld, 5)
+        exits_set = set([ex for region in multiworld.get_regions(1)
+                         for ex in region.exits if not ex.connected_region])
+
+        er_targets = [entrance for region in multiworld.get_regions(1)
+                      for entrance in region.entrances if not entrance.parent_region]
+        lookup = EntranceLookup(multiworld.worlds[1].random, coupled=True, usable_exits=exits_set, targets=er_targets)
+
+        expected = [entrance for entrance in lookup.others if entrance.randomization_group == ERTestGroups.RIGHT]
+        target = lookup.find_target("region0_right")
+        lookup.remove(target)
+        expected.remove(target)
+        self.assertIsNone(lookup.find_target("region0_right"))
+        self.assertNotIn(target, lookup.others)
+        self.assertEqual(len(er_targets) - 1, len(lookup))
+        self.assertEqual(expected, lookup.others[ERTestGroups.RIGHT])
+
+    def test_find_duplicate_name(self):
+        """Tests that of targets sharing a name, the first one in the current order of the lookup is found"""
+        lookup = EntranceLookup.GroupLookup()
+        targets = [Entrance(1, "duplicate", randomization_group=group) for group in (1, 2, 2, 2)]
+        for target in targets:
+            lookup.add(target)
+        lookup.shuffle(2, random.Random(1))
+        group_order = lookup[2]
+        self.assertIs(targets[0], lookup.find("duplicate"))
+        self.assertIs(group_order[0], lookup.find("duplicate", 2))
+        lookup.remove(group_order[0])
+        self.assertIs(group_order[1], lookup.find("duplicate", 2))
+        self.assertIsNone(lookup.find("duplicate", 3))
+
+
 class TestBakeTargetGroupLookup(unittest.TestCase):
     def test_lookup_generation(self):
         multiworld = generate_test_multiworld()
@@ -321,6 +357,46 @@ class TestRandomizeEntrances(unittest.TestCase):
         # if we didn't visit every placement the verification on_connect doesn't really mean much
         self.assertEqual(len(result.placements), seen_placement_count)
 
+    def test_incremental_reachability(self):
+        """tests that the reachable regions after each placement are the same as when searching the whole graph"""
+        multiworld = generate_test_multiworld()
+        generate_disconnected_region_grid(multiworld, 5)
+        secret = Region("Secret", 1, multiworld)
+        multiworld.regions.append(secret)
+        secret_entrance = multiworld.get_region("Menu", 1).connect(
+            secret, rule=lambda state: state.can_reach_region("region12", 1))
+        multiworld.register_indirect_condition(multiworld.get_region("region12", 1), secret_entrance)
+
+        def verify_reachability(state: ERPlacementState, placed_exits: list[Entrance], placed_targets: list[Entrance]):
+            full_state = CollectionState(multiworld, True)
+            full_state.update_reachable_regions(1)
+            self.assertEqual(set(full_state.reachable_regions[1]), set(state.placed_regions))
+
+        randomize_entrances(multiworld.worlds[1], True, directionally_matched_group_lookup,
+                            on_connect=verify_reachability)
+        self.assertTrue(secret.can_reach(CollectionState(multiworld)))
+
+    def test_speculative_connection_auto_indirect_conditions(self):
+        """tests that entrances depending on a speculatively connected region are checked in auto indirect worlds"""
+        multiworld = generate_test_multiworld()
+        world = multiworld.worlds[1]
+        world.explicit_indirect_conditions = False
+        menu = multiworld.get_region("Menu", 1)
+        source_exit = menu.create_exit("Source")
+        target = Region("Target", 1, multiworld)
+        gated = Region("Gated", 1, multiworld)
+        multiworld.regions += [target, gated]
+        target_entrance = target.create_er_target("Target")
+        menu.connect(gated, rule=lambda state: state.can_reach_region("Target", 1))
+        gated_exit = gated.create_exit("Gated Exit")
+
+        lookup = EntranceLookup(world.random, coupled=False, usable_exits={source_exit, gated_exit},
+                                targets=[target_entrance])
+        er_state = ERPlacementState(world, lookup, False)
+        er_state.update_reachable_regions()
+        self.assertTrue(er_state.test_speculative_connection(source_exit, target_entrance, {gated_exit}))
+        self.assertNotIn(target, er_state.placed_regions)
+
     def test_uncoupled_succeeds_stage1_indirect_condition(self):
         multiworld = generate_test_multiworld()
         menu = multiworld.get_region("Menu", 1)
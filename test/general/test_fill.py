@@ -3,8 +3,8 @@ import unittest
 
 from Options import Accessibility
 from test.general import generate_items, generate_locations, generate_test_multiworld
-from Fill import FillError, balance_multiworld_progression, fill_restrictive, \
-    distribute_early_items, distribute_items_restrictive
+from Fill import FillError, IncrementalSweep, balance_multiworld_progression, fill_restrictive, \
+    distribute_early_items, distribute_items_restrictive, sweep_from_pool
 from BaseClasses import Entrance, LocationProgressType, MultiWorld, Region, Item, Location, \
     ItemClassification
 from worlds.generic.Rules import CollectionRule, add_item_rule, locality_rules, set_rule
@@ -464,6 +464,47 @@ class TestFillRestrictive(unittest.TestCase):
         self.assertIsNot(loc0.item, player1.prog_items[0], "Filled item was still present in item pool")
 
 
+class TestIncrementalSweep(unittest.TestCase):
+    def setUp(self) -> None:
+        self.multiworld = generate_test_multiworld()
+        self.player1 = generate_player_data(self.multiworld, 1, 3, 3)
+        items = self.player1.prog_items
+        locations = self.player1.locations
+        # location 1 needs item 0, location 2 needs item 1
+        set_rule(locations[1], lambda state: state.has(items[0].name, 1))
+        set_rule(locations[2], lambda state: state.has(items[1].name, 1))
+
+    def test_matches_sweep_from_pool(self):
+        """Test that the incremental sweep produces the same states as sweeping from the base state each time"""
+        items = self.player1.prog_items
+        locations = self.player1.locations
+        sweep = IncrementalSweep(self.multiworld.state)
+        pool = items.copy()
+        for location in locations:
+            item = pool.pop(0)
+            self.multiworld.push_item(location, item, False)
+            sweep.add_placement(location)
+            expected = sweep_from_pool(self.multiworld.state, pool)
+            self.assertEqual(sweep.sweep_from_pool(pool).prog_items, expected.prog_items)
+            self.assertEqual(sweep.sweep_from_pool(pool).advancements, expected.advancements)
+
+    def test_removal_rebuilds(self):
+        """Test that removing a swept item from a location is not kept in the incremental state"""
+        items = self.player1.prog_items
+        locations = self.player1.locations
+        sweep = IncrementalSweep(self.multiworld.state)
+        self.multiworld.push_item(locations[0], items[0], False)
+        sweep.add_placement(locations[0])
+        self.assertTrue(sweep.sweep_from_pool().has(items[0].name, 1))
+        self.assertFalse(sweep.is_independent_of(locations[0]))
+
+        locations[0].item = None
+        items[0].location = None
+        sweep.remove_placement(locations[0])
+        self.assertFalse(sweep.sweep_from_pool().has(items[0].name, 1))
+        self.assertTrue(sweep.is_independent_of(locations[0]))
+
+
 class TestDistributeItemsRestrictive(unittest.TestCase):
     def test_basic_distribute(self):
         """Test that distribute_items_restrictive is deterministic"""
@@ -3,7 +3,7 @@ import unittest
 from Fill import distribute_items_restrictive
 from NetUtils import convert_to_base_types
 from worlds.AutoWorld import AutoWorldRegister, call_all
-from worlds import failed_world_loads
+from worlds import failed_world_loads, load_all_worlds
 from . import setup_solo_multiworld
 
 
@@ -53,6 +53,7 @@ class TestImplemented(unittest.TestCase):
                     convert_to_base_types(data)  # only put base data types into slot data
 
     def test_no_failed_world_loads(self):
+        load_all_worlds()
         if failed_world_loads:
             self.fail(f"The following worlds failed to load: {failed_world_loads}")
 
@@ -0,0 +1,71 @@
+import concurrent.futures
+import multiprocessing
+import os
+import tempfile
+import unittest
+from typing import Any, ClassVar
+
+from BaseClasses import Region
+from worlds.AutoWorld import AutoWorldRegister, World, call_output_isolated, uses_isolated_output
+from . import setup_multiworld
+
+
+class IsolatedOutputWorld(World):
+    game = "Isolated Output Test Game"
+    item_name_to_id: ClassVar = {}
+    location_name_to_id: ClassVar = {}
+    hidden = True
+
+    def create_regions(self) -> None:
+        self.multiworld.regions.append(Region("Menu", self.player, self.multiworld))
+
+    def get_output_state(self) -> Any:
+        return self.multiworld.get_out_file_name_base(self.player), self.random.random()
+
+    @classmethod
+    def generate_output_isolated(cls, output_state: Any, output_directory: str) -> None:
+        name, value = output_state
+        with open(os.path.join(output_directory, f"{name}.txt"), "w") as f:
+            f.write(f"{value} {os.getpid()}")
+
+
+# only registered while testing, so it doesn't show up for tests that check every world.
+# The class stays at module level, so the worker processes can unpickle it.
+del AutoWorldRegister.world_types[IsolatedOutputWorld.game]
+
+
+class TestIsolatedOutput(unittest.TestCase):
+    old_world_types: dict[str, type[World]]
+
+    def setUp(self) -> None:
+        self.old_world_types = AutoWorldRegister.world_types.copy()
+        AutoWorldRegister.world_types[IsolatedOutputWorld.game] = IsolatedOutputWorld
+
+    def tearDown(self) -> None:
+        AutoWorldRegister.world_types = self.old_world_types
+
+    def test_detection(self) -> None:
+        self.assertTrue(uses_isolated_output(IsolatedOutputWorld))
+        self.assertFalse(uses_isolated_output(World))
+
+    def test_output(self) -> None:
+        """Tests that isolated output is the same when generated in the calling thread and in other processes"""
+        multiworld = setup_multiworld([IsolatedOutputWorld] * 2, ("generate_early", "create_regions"), seed=0)
+        outputs = []
+        with tempfile.TemporaryDirectory() as thread_dir, tempfile.TemporaryDirectory() as process_dir, \
+                concurrent.futures.ProcessPoolExecutor(2, multiprocessing.get_context("spawn")) as process_pool:
+            for output_dir, pool in ((thread_dir, None), (process_dir, process_pool)):
+                for player in multiworld.player_ids:
+                    multiworld.worlds[player].random.seed(player)
+                    call_output_isolated(multiworld, player, output_dir, pool)
+                output = {}
+                for name in os.listdir(output_dir):
+                    with open(os.path.join(output_dir, name)) as f:
+                        output[name] = f.read().split()
+                outputs.append(output)
+        thread_output, process_output = outputs
+        self.assertEqual(2, len(thread_output))
+        self.assertEqual({name: value for name, (value, pid) in thread_output.items()},
+                         {name: value for name, (value, pid) in process_output.items()})
+        self.assertTrue(all(pid == str(os.getpid()) for _, pid in thread_output.values()))
+        self.assertTrue(all(pid != str(os.getpid()) for _, pid in process_output.values()))
@@ -1,10 +1,13 @@
 ﻿import unittest
+from worlds import load_all_worlds
 from worlds.AutoWorld import AutoWorldRegister
 from worlds.Files import AutoPatchRegister
 
 
 class TestPatches(unittest.TestCase):
     def test_patch_name_matches_game(self) -> None:
+        # patch containers are only registered once their world is imported
+        load_all_worlds()
         for game_name in AutoPatchRegister.patch_types:
             with self.subTest(game=game_name):
                 self.assertIn(game_name, AutoWorldRegister.world_types.keys(),
@@ -0,0 +1,52 @@
+import unittest
+from typing import List, Optional, Set
+from unittest import mock
+
+import Utils
+from BaseClasses import CollectionState, Location, Spoiler
+from Fill import distribute_items_restrictive
+from worlds.AutoWorld import AutoWorldRegister, call_all
+from . import setup_multiworld
+
+
+def cull_one_at_a_time(spoiler: Spoiler, num: int, sphere: Set[Location],
+                       state_cache: List[Optional[CollectionState]], required_locations: Set[Location],
+                       *args: object) -> None:
+    """The playthrough culling from before it was batched, checking locations in the same order."""
+    for location in sorted(sphere):
+        required_locations.remove(location)
+        if spoiler.multiworld.can_beat_game(state_cache[num], required_locations):
+            sphere.remove(location)
+        else:
+            required_locations.add(location)
+
+
+class TestPlaythrough(unittest.TestCase):
+    games = ("DLCQuest", "Timespinner", "Timespinner")
+
+    def test_culling(self) -> None:
+        """Verify that batched and parallel culling give the same playthrough as checking one location at a time."""
+        for seed in (1, 2):
+            with self.subTest(seed=seed):
+                multiworld = setup_multiworld([AutoWorldRegister.world_types[game] for game in self.games], seed=seed)
+                distribute_items_restrictive(multiworld)
+                call_all(multiworld, "post_fill")
+
+                with mock.patch.object(Spoiler, "_cull_sphere", cull_one_at_a_time):
+                    multiworld.spoiler.create_playthrough(create_paths=False)
+                expected = multiworld.spoiler.playthrough
+                self.assertTrue(expected)
+
+                multiworld.spoiler.create_playthrough(create_paths=False)
+                self.assertEqual(expected, multiworld.spoiler.playthrough)
+
+                multiworld.playthrough_processes = 2
+                if Utils.is_linux:
+                    multiworld.spoiler.create_playthrough(create_paths=False)
+                    self.assertEqual(expected, multiworld.spoiler.playthrough)
+
+                # other platforms, like macOS, don't fork even where it's available
+                with mock.patch("Utils.is_linux", False), \
+                        mock.patch("concurrent.futures.ProcessPoolExecutor", side_effect=AssertionError("forked")):
+                    multiworld.spoiler.create_playthrough(create_paths=False)
+                self.assertEqual(expected, multiworld.spoiler.playthrough)
@@ -500,6 +500,85 @@ class TestCaching(CachedRuleBuilderTestCase):
         self.assertTrue(entrance.can_reach(self.state))
 
 
+class TestDependencyIndex(CachedRuleBuilderTestCase):
+    multiworld: MultiWorld  # pyright: ignore[reportUninitializedInstanceVariable]
+    world: World  # pyright: ignore[reportUninitializedInstanceVariable]
+    player: int = 1
+
+    @override
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.multiworld = setup_solo_multiworld(self.world_cls, seed=0)
+        world = self.multiworld.worlds[1]
+        self.world = world
+
+        region1 = Region("Region 1", self.player, self.multiworld)
+        region2 = Region("Region 2", self.player, self.multiworld)
+        self.multiworld.regions.extend([region1, region2])
+
+        region1.add_locations({"Location 1": 1, "Location 2": 2, "Location 3": 3}, RuleBuilderLocation)
+        region2.add_locations({"Location 4": 4, "Location 5": 5}, RuleBuilderLocation)
+
+        world.create_entrance(region1, region2, Has("Item 1"))
+        world.set_rule(world.get_location("Location 2"), Has("Item 2"))
+        world.set_rule(world.get_location("Location 3"), CanReachRegion("Region 2") & Has("Item 3"))
+        world.set_rule(world.get_location("Location 4"), CanReachLocation("Location 2"))
+        world.get_location("Location 5").access_rule = lambda state: state.has("Item 4", self.player)
+
+        # each sphere unlocks exactly one more location
+        for location_number, item_number in ((1, 2), (2, 1), (3, 4), (4, 3), (5, 5)):
+            world.get_location(f"Location {location_number}").place_locked_item(
+                world.create_item(f"Item {item_number}"))
+
+    def test_index(self) -> None:
+        index = self.multiworld.location_dependency_index
+        locations = {location.name: location for location in self.world.get_locations()}
+        index.refresh(locations.values())
+        region1 = self.world.get_region("Region 1")
+        region2 = self.world.get_region("Region 2")
+
+        self.assertEqual(index.always_checked, {locations["Location 4"], locations["Location 5"]})
+        self.assertEqual(index.get_dependents(self.player, (), (region1,)),
+                         {locations["Location 1"], locations["Location 2"], locations["Location 3"]})
+        self.assertEqual(index.get_dependents(self.player, ("Item 3",), (region2,)), {locations["Location 3"]})
+        self.assertEqual(index.get_dependents(self.player, ("Item 1",), ()), set())
+
+        # changing a rule re-indexes the location
+        self.world.set_rule(locations["Location 1"], Has("Item 5"))
+        index.refresh(locations.values())
+        self.assertEqual(index.get_dependents(self.player, ("Item 5",), ()), {locations["Location 1"]})
+
+    def test_overridden_can_reach(self) -> None:
+        class CustomRegion(Region):
+            @override
+            def can_reach(self, state: CollectionState) -> bool:
+                return super().can_reach(state)
+
+        class CustomLocation(RuleBuilderLocation):
+            @override
+            def can_reach(self, state: CollectionState) -> bool:
+                return super().can_reach(state)
+
+        region = CustomRegion("Region 3", self.player, self.multiworld)
+        self.multiworld.regions.append(region)
+        region.add_locations({"Location 6": 6}, RuleBuilderLocation)
+        self.world.get_region("Region 1").add_locations({"Location 7": 7}, CustomLocation)
+        self.world.set_rule(self.world.get_location("Location 7"), Has("Item 1"))
+
+        index = self.multiworld.location_dependency_index
+        index.refresh(self.world.get_locations())
+        self.assertIn(self.world.get_location("Location 6"), index.always_checked)
+        self.assertIn(self.world.get_location("Location 7"), index.always_checked)
+        self.assertNotIn(self.world.get_location("Location 1"), index.always_checked)
+
+    def test_sweep(self) -> None:
+        state = CollectionState(self.multiworld)
+        state.sweep_for_advancements()
+        self.assertEqual(state.advancements, set(self.world.get_locations()))
+        self.assertEqual([len(sphere) for sphere in self.multiworld.get_spheres()], [1, 1, 1, 1, 1])
+
+
 class TestCacheDisabled(RuleBuilderTestCase):
     multiworld: MultiWorld  # pyright: ignore[reportUninitializedInstanceVariable]
     world: World  # pyright: ignore[reportUninitializedInstanceVariable]
@@ -0,0 +1,38 @@
+import unittest
+
+from BaseClasses import CollectionState
+from Fill import distribute_items_restrictive
+from worlds.AutoWorld import AutoWorldRegister, call_all
+from . import setup_multiworld
+
+
+class TestSphereAnalysis(unittest.TestCase):
+    games = ("DLCQuest", "Hollow Knight", "Timespinner")
+
+    def test_consumers_match_sweeps(self) -> None:
+        """Verify that the sphere analysis gives the same results as sweeping for each consumer on its own."""
+        for seed in (1, 2):
+            with self.subTest(seed=seed):
+                multiworld = setup_multiworld([AutoWorldRegister.world_types[game] for game in self.games], seed=seed)
+                distribute_items_restrictive(multiworld)
+                call_all(multiworld, "post_fill")
+                expected_spheres = list(multiworld.get_sendable_spheres())
+                expected_accessibility = multiworld.fulfills_accessibility()
+
+                analysis = multiworld.analyze_spheres()
+                self.assertIs(analysis, multiworld.sphere_analysis)
+                self.assertEqual(expected_spheres, list(multiworld.get_sendable_spheres()))
+                self.assertEqual(expected_accessibility, multiworld.fulfills_accessibility())
+
+                state = CollectionState(multiworld)
+                for step in analysis.steps:
+                    for location in step:
+                        self.assertTrue(location.can_reach(state), location)
+                    for location in step:
+                        state.collect(location.item, True, location)
+                self.assertEqual(
+                    {location for step in analysis.steps for location in step},
+                    {location for location in multiworld.get_filled_locations() if location.can_reach(state)})
+
+                multiworld.spoiler.create_playthrough(create_paths=False)
+                self.assertTrue(multiworld.spoiler.playthrough)
@@ -1,7 +1,9 @@
 import unittest
+from collections import Counter
 
+from BaseClasses import CollectionState, CompactItemCounter, Region
 from worlds.AutoWorld import AutoWorldRegister, call_all
-from . import setup_solo_multiworld
+from . import generate_items, generate_test_multiworld, setup_solo_multiworld
 
 
 class TestBase(unittest.TestCase):
@@ -27,3 +29,140 @@ class TestBase(unittest.TestCase):
                     with self.subTest("Step", step=step):
                         call_all(multiworld, step)
                         self.assertTrue(multiworld.get_all_state(False, allow_partial_entrances=True))
+
+
+class TestCompactCollectionState(unittest.TestCase):
+    def setUp(self) -> None:
+        self.multiworld = generate_test_multiworld()
+        self.multiworld.compact_collection_state = True
+        self.menu = self.multiworld.get_region("Menu", 1)
+        self.other = Region("Other", 1, self.multiworld)
+        self.multiworld.regions.append(self.other)
+        self.menu.connect(self.other, rule=lambda state: state.has("Key", 1, 2))
+
+    def test_item_counter(self) -> None:
+        """Tests that the compact item counter behaves like a Counter"""
+        state = CollectionState(self.multiworld)
+        counter = state.prog_items[1]
+        self.assertIsInstance(counter, CompactItemCounter)
+        self.assertEqual(counter["Key"], 0)
+        self.assertNotIn("Key", counter)
+        counter["Key"] += 2
+        counter.update(["Sword"])
+        self.assertEqual(counter, Counter({"Key": 2, "Sword": 1}))
+        self.assertEqual(counter.most_common(1), [("Key", 2)])
+        self.assertEqual(sorted(counter.elements()), ["Key", "Key", "Sword"])
+        self.assertEqual(counter + Counter({"Sword": 1}), Counter({"Key": 2, "Sword": 2}))
+        self.assertEqual(counter - Counter({"Key": 1}), Counter({"Key": 1, "Sword": 1}))
+        counter.subtract({"Sword": 1})
+        self.assertIn("Sword", counter)
+        self.assertEqual(counter.get("Sword"), 0)
+        self.assertEqual(counter.get("Shield", -1), -1)
+        self.assertEqual(len(counter), 2)
+        self.assertEqual(counter, Counter({"Key": 2}))
+        self.assertEqual(+counter, Counter({"Key": 2}))
+        self.assertNotEqual(counter, Counter({"Key": 2, "Sword": -1}))
+        copy = counter.copy()
+        copy["Key"] -= 1
+        self.assertEqual(counter["Key"], 2)
+        self.assertEqual(copy["Key"], 1)
+        del counter["Key"]
+        self.assertEqual(dict(counter), {"Sword": 0})
+        counter -= Counter()
+        self.assertEqual(dict(counter), {})
+        counter["Key"] = 2 ** 64
+        self.assertEqual(counter.total(), 2 ** 64)
+
+    def test_copy(self) -> None:
+        """Tests that copies of the state are independent and keep the compact item counter"""
+        state = CollectionState(self.multiworld)
+        copy = state.copy()
+        copy.set_item("Key", 1, 2)
+        self.assertIsInstance(copy.prog_items[1], CompactItemCounter)
+        self.assertTrue(copy.can_reach_region("Other", 1))
+        self.assertFalse(state.can_reach_region("Other", 1))
+        self.assertEqual(state.count("Key", 1), 0)
+
+
+class TestCollectionStateCopy(unittest.TestCase):
+    shared_state_copies = True
+
+    def setUp(self) -> None:
+        self.multiworld = generate_test_multiworld(2)
+        self.multiworld.shared_state_copies = self.shared_state_copies
+        self.state = CollectionState(self.multiworld)
+        self.state.add_item("Key", 1)
+        self.state.add_item("Key", 2)
+
+    def test_copies_are_independent(self) -> None:
+        """Tests that modifying a copy or the original after copying doesn't affect the other"""
+        copy = self.state.copy()
+        copy.add_item("Key", 1)
+        copy.add_item("Key", 2, 3)
+        self.state.add_item("Key", 1, 4)
+        self.state.add_item("Key", 2, 2)
+        self.assertEqual(self.state.count("Key", 1), 5)
+        self.assertEqual(self.state.count("Key", 2), 3)
+        self.assertEqual(copy.count("Key", 1), 2)
+        self.assertEqual(copy.count("Key", 2), 4)
+
+        copy_of_copy = copy.copy()
+        copy_of_copy.add_item("Key", 1)
+        copy.remove_item("Key", 2)
+        self.assertEqual(copy.count("Key", 1), 2)
+        self.assertEqual(copy.count("Key", 2), 3)
+        self.assertEqual(copy_of_copy.count("Key", 1), 3)
+        self.assertEqual(copy_of_copy.count("Key", 2), 4)
+        self.assertEqual(copy_of_copy.prog_items, {1: Counter({"Key": 3}), 2: Counter({"Key": 4})})
+        self.assertEqual(self.state.prog_items, {1: Counter({"Key": 5}), 2: Counter({"Key": 3})})
+
+    def test_regions_are_independent(self) -> None:
+        """Tests that searching regions in a copy or the original after copying doesn't affect the other"""
+        copy = self.state.copy()
+        for player in (1, 2):
+            copy.update_reachable_regions(player)
+            self.assertEqual(len(copy.reachable_regions[player]), 1)
+            self.assertEqual(len(self.state.reachable_regions[player]), 0)
+        self.state.update_reachable_regions(2)
+        self.state.make_regions_exclusive(2)[0].clear()
+        self.assertEqual(len(copy.reachable_regions[2]), 1)
+
+    def test_reading_does_not_copy(self) -> None:
+        """Tests that only modifications copy the containers of a player, and that copying leaves the source's alone"""
+        if not self.shared_state_copies:
+            self.skipTest("containers are only shared with shared_state_copies")
+        containers = dict(self.state.prog_items)
+        copy = self.state.copy()
+        self.assertTrue(copy.has("Key", 1))
+        self.assertTrue(self.state.has("Key", 2))
+        self.assertEqual(self.state.prog_items, containers)
+        for player in (1, 2):
+            self.assertIs(self.state.prog_items[player], containers[player])
+            self.assertIs(copy.prog_items[player], containers[player])
+
+        copy.add_item("Key", 1)
+        self.assertIsNot(copy.prog_items[1], containers[1])
+        self.assertIs(copy.prog_items[2], containers[2])
+        self.assertIs(self.state.prog_items[1], containers[1])
+
+        self.state.update_reachable_regions(1)
+        copy.update_reachable_regions(1)
+        regions = self.state.reachable_regions[1]
+        copy_of_copy = self.state.copy()
+        copy_of_copy.update_reachable_regions(1)
+        self.assertIs(copy_of_copy.reachable_regions[1], regions)
+
+
+class TestUnsharedCollectionStateCopy(TestCollectionStateCopy):
+    shared_state_copies = False
+
+    def test_direct_modification(self) -> None:
+        """Tests that without shared_state_copies, containers can still be modified directly"""
+        copy = self.state.copy()
+        copy.prog_items[1]["Key"] += 1
+        copy.update_reachable_regions(1)
+        copy.reachable_regions[1].clear()
+        self.assertEqual(self.state.count("Key", 1), 1)
+        self.assertEqual(copy.count("Key", 1), 2)
+        self.state.update_reachable_regions(1)
+        self.assertEqual(len(self.state.reachable_regions[1]), 1)
@@ -0,0 +1,116 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from Utils import Version
+import worlds
+from worlds.AutoWorld import AutoWorldRegister
+
+
+class TestWorldLoading(unittest.TestCase):
+    games = ("DLCQuest", "Hollow Knight", "Archipelago")
+
+    def test_lazy_lookup(self) -> None:
+        """Verify that importing worlds doesn't import the worlds with a manifest, and looking up a game imports it."""
+        script = ("import sys, worlds\n"
+                  "from worlds.AutoWorld import AutoWorldRegister\n"
+                  "assert 'worlds.dlcquest' not in sys.modules, 'imported before lookup'\n"
+                  "assert AutoWorldRegister.world_types['DLCQuest'].__module__ == 'worlds.dlcquest'\n"
+                  "assert 'worlds.hk' not in sys.modules, 'imported other world'\n")
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        result = subprocess.run([sys.executable, "-c", script], cwd=root, capture_output=True, text=True,
+                                stdin=subprocess.DEVNULL, env={**os.environ, "SKIP_REQUIREMENTS_UPDATE": "1"})
+        self.assertEqual(0, result.returncode, result.stderr)
+
+    def test_lazy_patch_type(self) -> None:
+        """Verify that looking up the patch container of a game imports its world."""
+        script = ("import sys, worlds\n"
+                  "from worlds.Files import AutoPatchRegister\n"
+                  "assert 'worlds.pokemon_emerald' not in sys.modules, 'imported before lookup'\n"
+                  "assert AutoPatchRegister.get_patch_type('Pokemon Emerald').patch_file_ending == '.apemerald'\n"
+                  "assert AutoPatchRegister.get_patch_type('Archipelago') is None\n")
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        result = subprocess.run([sys.executable, "-c", script], cwd=root, capture_output=True, text=True,
+                                stdin=subprocess.DEVNULL, env={**os.environ, "SKIP_REQUIREMENTS_UPDATE": "1"})
+        self.assertEqual(0, result.returncode, result.stderr)
+
+    def test_failed_load(self) -> None:
+        """Verify that a game is dropped from the data package and the caches when its world fails to load."""
+        script = ("import os, worlds\n"
+                  "from worlds.AutoWorld import AutoWorldRegister\n"
+                  "game = 'ChecksFinder'\n"
+                  "assert game in worlds.network_data_package['games'], 'not in data package'\n"
+                  "source = worlds._game_sources[game]\n"
+                  "source.load = lambda: False\n"
+                  "assert game not in AutoWorldRegister.world_types, 'loaded'\n"
+                  "assert game not in worlds.network_data_package['games'], 'still in data package'\n"
+                  "assert not os.path.exists(worlds._world_data_path(source)), 'still cached'\n"
+                  "index = worlds._read_cache(worlds.world_index_path)\n"
+                  "assert source.resolved_path not in index['sources'], 'still indexed'\n")
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        result = subprocess.run([sys.executable, "-c", script], cwd=root, capture_output=True, text=True,
+                                stdin=subprocess.DEVNULL, env={**os.environ, "SKIP_REQUIREMENTS_UPDATE": "1"})
+        self.assertEqual(0, result.returncode, result.stderr)
+
+    def test_data_package(self) -> None:
+        """Verify that data packages, whether computed or read from the cache, match the ones of the world types."""
+        for game in self.games:
+            with self.subTest(game=game):
+                expected = AutoWorldRegister.world_types[game].get_data_package_data()
+                self.assertEqual(expected, worlds.get_data_package(game))
+                worlds._world_data.pop(game)
+                self.assertEqual(expected, worlds.get_data_package(game))
+                self.assertEqual(expected, worlds.network_data_package["games"][game])
+                self.assertEqual(set(AutoWorldRegister.world_types[game].hint_blacklist),
+                                 worlds.get_hint_blacklist(game))
+
+    def test_cache_version(self) -> None:
+        """Verify that cached world data is recomputed when the world version changes."""
+        game = "Timespinner"
+        old_version = AutoWorldRegister.world_versions[game]
+        worlds.get_data_package(game)
+        computed = []
+        compute_world_data = worlds._compute_world_data
+        try:
+            worlds._compute_world_data = lambda source_game: computed.append(source_game) or \
+                compute_world_data(source_game)
+            worlds._world_data.pop(game)
+            worlds.get_data_package(game)
+            self.assertEqual([], computed)
+            worlds._world_data.pop(game)
+            AutoWorldRegister.world_versions[game] = Version(*old_version[:2], old_version[2] + 1)
+            worlds.get_data_package(game)
+            self.assertEqual([game], computed)
+        finally:
+            worlds._compute_world_data = compute_world_data
+            AutoWorldRegister.world_versions[game] = old_version
+            worlds._world_data.pop(game)
+            worlds.get_data_package(game)
+
+    def test_fingerprint(self) -> None:
+        """Verify that the fingerprint of a world source changes with its contents, even if mtimes and sizes don't."""
+        with tempfile.TemporaryDirectory() as world_dir:
+            path = os.path.join(world_dir, "__init__.py")
+            with open(path, "w") as f:
+                f.write("game = 'A'\n")
+            stat = os.stat(path)
+            fingerprint = worlds.WorldSource(world_dir, relative=False).fingerprint
+            self.assertEqual(fingerprint, worlds.WorldSource(world_dir, relative=False).fingerprint)
+            with open(path, "w") as f:
+                f.write("game = 'B'\n")
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            self.assertNotEqual(fingerprint, worlds.WorldSource(world_dir, relative=False).fingerprint)
+
+    def test_load_all(self) -> None:
+        """Verify that loading all worlds registers every indexed game, ordered by world source."""
+        worlds.load_all_worlds()
+        world_types = dict(AutoWorldRegister.world_types.items())
+        for game, world_source in worlds._game_sources.items():
+            if world_source.time_taken >= 0:
+                self.assertIn(game, world_types)
+        source_order = [source.resolved_path for source in worlds._ordered_sources]
+        positions = [source_order.index(worlds._game_sources[game].resolved_path)
+                     for game in world_types if game in worlds._game_sources]
+        self.assertEqual(sorted(positions), positions)
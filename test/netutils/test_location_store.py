@@ -3,7 +3,7 @@ import os
 import typing
 import unittest
 import warnings
-from NetUtils import LocationStore, _LocationStore
+from NetUtils import LocationStore, _LocationStore, location_record, locations_header, pack_locations
 
 State = typing.Dict[typing.Tuple[int, int], typing.Set[int]]
 RawLocations = typing.Dict[int, typing.Dict[int, typing.Tuple[int, int, int]]]
@@ -265,6 +265,61 @@ class TestSpeedupsLocationStore(Base.TestLocationStore):
         super().setUp()
 
 
+class TestPurePythonLocationStoreFromBuffer(Base.TestLocationStore):
+    """Run base method tests for the pure python implementation loaded from packed locations."""
+    def setUp(self) -> None:
+        self.store = _LocationStore.from_buffer(pack_locations(sample_data))
+        super().setUp()
+
+
+@unittest.skipIf(LocationStore is _LocationStore and not ci, "_speedups not available")
+class TestSpeedupsLocationStoreFromBuffer(Base.TestLocationStore):
+    """Run base method tests for the cython implementation using packed locations in place."""
+    def setUp(self) -> None:
+        self.assertFalse(LocationStore is _LocationStore, "Failed to load _speedups")
+        self.store = LocationStore.from_buffer(pack_locations(sample_data))
+        super().setUp()
+
+
+@unittest.skipIf(LocationStore is _LocationStore and not ci, "_speedups not available")
+class TestSpeedupsLocationStoreFromBufferConstructor(unittest.TestCase):
+    """Test the validation of packed locations for the cython implementation."""
+    def test_misaligned(self) -> None:
+        data = bytearray(4) + pack_locations(sample_data)
+        store = LocationStore.from_buffer(memoryview(data)[4:])
+        data[:] = bytes(len(data))  # records are copied, so this does not change the store
+        self.assertEqual(store[1][11], (21, 2, 7))
+        self.assertEqual(len(store[2]), 3)
+
+    def test_no_players(self) -> None:
+        with self.assertRaises(ValueError):
+            LocationStore.from_buffer(pack_locations({}))
+
+    def test_no_locations_for_1(self) -> None:
+        store = LocationStore.from_buffer(pack_locations({1: {}, 2: {1: (1, 2, 3)}}))
+        self.assertEqual(len(store), 2)
+        self.assertEqual(len(store[1]), 0)
+        self.assertEqual(store[2][1], (1, 2, 3))
+
+    def test_invalid(self) -> None:
+        header = locations_header.pack(location_record.size, 2)
+        for records in (
+            [(1, 3, 1, 1, 0)],  # sender above player count
+            [(1, 1, 0, 1, 0)],  # receiver 0
+            [(2, 1, 1, 1, 0), (1, 1, 1, 1, 0)],  # locations out of order
+            [(1, 2, 1, 1, 0), (1, 1, 1, 1, 0)],  # senders out of order
+            [(1, 1, 1, 1, 0), (1, 1, 1, 1, 0)],  # duplicate location
+        ):
+            with self.subTest(records=records), self.assertRaises(ValueError):
+                LocationStore.from_buffer(header + b"".join(location_record.pack(*record) for record in records))
+        with self.assertRaises(ValueError):
+            LocationStore.from_buffer(header[:8])
+        with self.assertRaises(ValueError):
+            LocationStore.from_buffer(header + bytes(location_record.size - 1))
+        with self.assertRaises(ValueError):
+            LocationStore.from_buffer(locations_header.pack(location_record.size + 8, 2))
+
+
 @unittest.skipIf(LocationStore is _LocationStore and not ci, "_speedups not available")
 class TestSpeedupsLocationStoreConstructor(Base.TestLocationStoreConstructor):
     """Run base constructor tests and tests the additional constraints for cython implementation."""
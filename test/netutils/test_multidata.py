@@ -0,0 +1,106 @@
+import io
+import mmap
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from MultiServer import Context
+from NetUtils import LocationStore, MultiDataSections, MultiDataWriter, multidata_format_version
+
+
+class TestMultiDataSections(unittest.TestCase):
+    data: bytes
+
+    def setUp(self) -> None:
+        with (Path(__file__).parents[1] / "webhost" / "data" / "One_Archipelago.archipelago").open("rb") as f:
+            self.original = dict(Context.decompress(f.read()))
+        output = io.BytesIO()
+        writer = MultiDataWriter(output)
+        for key, value in self.original.items():
+            writer.write(key, value)
+        writer.finish()
+        self.data = output.getvalue()
+
+    def test_round_trip(self) -> None:
+        """Tests that writing multidata in sections and reading it back gives the same data"""
+        self.assertEqual(self.data[0], multidata_format_version)
+        multidata = Context.decompress(self.data)
+        self.assertIsInstance(multidata, MultiDataSections)
+        self.assertEqual(list(multidata), list(self.original))
+        for key, value in self.original.items():
+            if key == "slot_data":
+                self.assertEqual(dict(multidata[key]), value)
+            else:
+                self.assertEqual(multidata[key], value)
+
+    def test_lazy(self) -> None:
+        """Tests that sections are only loaded once accessed"""
+        multidata = Context.decompress(self.data)
+        self.assertFalse(multidata.is_loaded("locations"))
+        self.assertEqual(multidata["locations"], self.original["locations"])
+        self.assertTrue(multidata.is_loaded("locations"))
+        slot_data = multidata["slot_data"]
+        slot = next(iter(self.original["slot_data"]))
+        self.assertFalse(slot_data.is_loaded(slot))
+        self.assertEqual(slot_data[slot], self.original["slot_data"][slot])
+
+    def test_rewrite(self) -> None:
+        """Tests that modified sections are written again, while unmodified ones are copied"""
+        multidata = Context.decompress(self.data)
+        multidata["seed_name"] = "modified"
+        del multidata["spheres"]
+        output = io.BytesIO()
+        writer = MultiDataWriter(output)
+        writer.write_all(multidata)
+        writer.finish()
+
+        rewritten = Context.decompress(output.getvalue())
+        self.assertEqual(rewritten["seed_name"], "modified")
+        self.assertNotIn("spheres", rewritten)
+        self.assertEqual(rewritten["locations"], self.original["locations"])
+        self.assertEqual(dict(rewritten["slot_data"]), self.original["slot_data"])
+
+    def test_write_section(self) -> None:
+        """Tests that writing slot data one slot at a time gives the same data as writing it at once"""
+        output = io.BytesIO()
+        writer = MultiDataWriter(output)
+        for slot, value in self.original["slot_data"].items():
+            writer.write_section("slot_data", slot, value)
+        for key, value in self.original.items():
+            if key != "slot_data":
+                writer.write(key, value)
+        writer.finish()
+
+        multidata = Context.decompress(output.getvalue())
+        self.assertEqual(dict(multidata["slot_data"]), self.original["slot_data"])
+        self.assertEqual(multidata["locations"], self.original["locations"])
+
+    def test_memory_map(self) -> None:
+        """Tests that sectioned multidata can be read from a memory mapped file, like the server does"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "test.archipelago")
+            with open(path, "wb") as f:
+                f.write(self.data)
+            with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                multidata = Context.decompress(data)
+                self.assertEqual(multidata["seed_name"], self.original["seed_name"])
+                self.assertEqual(dict(multidata["slot_data"]), self.original["slot_data"])
+                store = LocationStore.from_buffer(multidata.get_raw("locations"))
+                self.assertEqual({player: dict(locations.items()) for player, locations in store.items()},
+                                 self.original["locations"])
+                del store  # the memory map can't be closed while the store uses it
+
+    def test_close(self) -> None:
+        """Tests that the server closes the memory mapped file when shutting down"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "test.archipelago")
+            with open(path, "wb") as f:
+                f.write(self.data)
+            ctx = Context("", 0, "", "", 0, 0, False)
+            ctx.load(path)
+            self.assertIsNotNone(ctx.multidata_map)
+            data_map = ctx.multidata_map
+            ctx.close_multidata()
+            self.assertIsNone(ctx.multidata_map)
+            self.assertTrue(data_map.closed)
@@ -0,0 +1,29 @@
+import unittest
+
+from NetUtils import NameTable, get_name_table
+
+
+class TestNameTable(unittest.TestCase):
+    def test_lookup(self) -> None:
+        """Verify that dense and sparse tables behave like the inverted dict."""
+        for name_to_id in ({"a": 3, "b": 4, "c": 5}, {"a": -2, "b": 10, "c": 1_000_000, "d": 0}, {}):
+            with self.subTest(name_to_id=name_to_id):
+                id_to_name = {code: name for name, code in name_to_id.items()}
+                table = NameTable(name_to_id)
+                self.assertEqual(id_to_name, dict(table))
+                self.assertEqual(sorted(id_to_name), list(table))
+                for code in (-3, -2, 2, 3, 6, 11, 1_000_000, 1_000_001, "a", None):
+                    self.assertEqual(code in id_to_name, code in table, code)
+                    self.assertEqual(id_to_name.get(code), table.get(code), code)
+
+    def test_duplicate_ids(self) -> None:
+        """Verify that the last name of a duplicate id is kept, as when inverting the dict."""
+        self.assertEqual({1: "b", 2: "c"}, dict(NameTable({"a": 1, "b": 1, "c": 2})))
+
+    def test_shared(self) -> None:
+        """Verify that tables are shared by checksum and lookup type."""
+        name_to_id = {"a": 1}
+        items = get_name_table(name_to_id, "0123", "item")
+        self.assertIs(items, get_name_table({"b": 2}, "0123", "item"))
+        self.assertIsNot(items, get_name_table(name_to_id, "0123", "location"))
+        self.assertIsNot(get_name_table(name_to_id, None, "item"), get_name_table(name_to_id, None, "item"))
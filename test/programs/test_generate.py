@@ -4,12 +4,15 @@ import unittest
 import os
 import os.path
 import sys
+import zipfile
 
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
 import Generate
 import Main
+import MultiServer
+import NetUtils
 
 
 class TestGenerateMain(unittest.TestCase):
@@ -63,6 +66,21 @@ class TestGenerateMain(unittest.TestCase):
 
         self.assertOutput(self.output_tempdir.name)
 
+    def test_generate_multidata(self):
+        sys.argv = [sys.argv[0], '--seed', '0',
+                    '--player_files_path', str(self.abs_input_dir),
+                    '--outputpath', self.output_tempdir.name]
+        Main.main(*Generate.main())
+
+        self.assertOutput(self.output_tempdir.name)
+        output_file, = Path(self.output_tempdir.name).glob('*.zip')
+        with zipfile.ZipFile(output_file) as zf:
+            multidata_name, = (name for name in zf.namelist() if name.endswith('.archipelago'))
+            multidata = MultiServer.Context.decompress(zf.read(multidata_name))
+        self.assertEqual(set(multidata), set(NetUtils.MultiData.__annotations__))
+        self.assertEqual(set(multidata["slot_data"]), {1})
+        self.assertEqual(multidata["connect_names"], {multidata["slot_info"][1].name: (0, 1)})
+
     def test_generate_relative(self):
         sys.argv = [sys.argv[0], '--seed', '0',
                     '--player_files_path', str(self.rel_input_dir),
@@ -108,6 +126,7 @@ class TestGenerateWeights(TestGenerateMain):
     # don't need to run these tests
     test_generate_absolute = None
     test_generate_relative = None
+    test_generate_multidata = None
 
     def test_generate_yaml(self):
         from settings import get_settings
@@ -126,8 +145,8 @@ class TestGenerateWeights(TestGenerateMain):
 
         # there's likely a better way to do this, but hardcode the results from seed 1 to ensure they're always this
         expected_results = {
-            "accessibility": [0, 2, 0, 2, 2],
-            "progression_balancing": [0, 50, 99, 0, 50],
+            "accessibility": [0, 0, 0, 2, 2],
+            "progression_balancing": [0, 99, 0, 99, 0],
         }
 
         self.assertEqual(seed, 1)
@@ -137,3 +156,41 @@ class TestGenerateWeights(TestGenerateMain):
                     result, getattr(namespace, option_name)[player].value,
                     "Generated results from weights file did not match expected value."
                 )
+
+    def test_roll_processes(self):
+        """Tests that rolling options gives the same results in the generating process and in pools of any size."""
+        results = []
+        for roll_processes in (1, 2, 3):
+            sys.argv = [sys.argv[0], "--seed", "1", "--multi", "5", "--player_files_path", str(self.abs_input_dir),
+                        "--roll_processes", str(roll_processes)]
+            namespace, seed = Generate.main()
+            # not every option compares equal by value, so compare their values
+            results.append({option_name: {player: getattr(option, "value", option) for player, option in value.items()}
+                            for option_name, value in vars(namespace).items() if isinstance(value, dict)})
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(results[0], results[2])
+
+
+def log_warning(message: str) -> None:
+    import logging
+    logging.warning(message)
+
+
+class TestMapIsolated(unittest.TestCase):
+    def test_logging(self) -> None:
+        """Tests that log records of calls made in other processes reach the logging of the calling process."""
+        with self.assertLogs(level="WARNING") as logs:
+            Generate.map_isolated(log_warning, 2, [("first",), ("second",)])
+        self.assertEqual(sorted(record.getMessage() for record in logs.records), ["first", "second"])
+
+    def test_seeded_roll_keeps_random_state(self) -> None:
+        """Tests that seeded rolls don't change the global random state of the calling process."""
+        import random
+        from BaseClasses import PlandoOptions
+
+        weights = {"game": "Archipelago", "name": "Player", "Archipelago": {}}
+        random.seed(1)
+        expected = random.random()
+        random.seed(1)
+        Generate.roll_settings_seeded(weights, PlandoOptions.bosses, 2)
+        self.assertEqual(expected, random.random())
@@ -1,5 +1,7 @@
+import asyncio
 import unittest
-from MultiServer import Context, ServerCommandProcessor
+from MultiServer import Client, Context, ServerCommandProcessor, send_items_to, send_new_items
+from NetUtils import NetworkItem
 
 
 class TestResolvePlayerName(unittest.TestCase):
@@ -38,3 +40,81 @@ class TestResolvePlayerName(unittest.TestCase):
         assert p.resolve_player("ABC") == (1, 2, "abc"), "case insensitive resolves when 1 match"
         assert p.resolve_player("abcd") == (1, 3, "abCD"), "case insensitive resolves when 1 match"
         assert not p.resolve_player("aB"), "partial name shouldn't resolve to player"
+
+
+class SendQueueContext(Context):
+    def _load_game_data(self) -> None:
+        # worlds' data is not needed to send messages
+        self.gamespackage = {}
+
+
+class TestSendQueue(unittest.IsolatedAsyncioTestCase):
+    class Socket:
+        def __init__(self) -> None:
+            self.open = True
+            self.frames: list[str] = []
+            self.blocked = asyncio.Event()
+            self.blocked.set()
+
+        async def send(self, msg: str) -> None:
+            self.frames.append(msg)
+            await self.blocked.wait()
+
+    async def asyncSetUp(self) -> None:
+        self.ctx = SendQueueContext("", 0, "", "", 0, 0, False)
+        self.ctx.send_coalescing_interval = 0
+        self.socket = self.Socket()
+        self.client = Client(self.socket, self.ctx)
+        self.client.auth = True
+        self.client.team = 0
+        self.client.slot = 1
+        self.ctx.endpoints.append(self.client)
+        self.ctx.clients[0] = {1: [self.client]}
+        self.ctx.player_names[0, 1] = "Player1"
+
+    async def wait_for_queue(self) -> None:
+        while self.ctx.send_queues:
+            await asyncio.sleep(0)
+
+    async def test_coalescing(self) -> None:
+        """Test that messages queued together are sent as one frame, in order."""
+        self.ctx.broadcast_all([{"cmd": "PrintJSON", "data": [{"text": "a"}]}])
+        self.ctx.broadcast_team(0, [{"cmd": "RoomUpdate", "hint_points": 1}])
+        self.ctx.notify_client(self.client, "b")
+        await self.wait_for_queue()
+        self.assertEqual(len(self.socket.frames), 1)
+        self.assertEqual([msg["cmd"] for msg in self.ctx.loader(self.socket.frames[0])],
+                         ["PrintJSON", "RoomUpdate", "PrintJSON"])
+
+    async def test_backpressure(self) -> None:
+        """Test that messages queued while a frame is still being sent are merged into the next frame."""
+        self.socket.blocked.clear()
+        self.ctx.notify_client(self.client, "a")
+        while not self.socket.frames:
+            await asyncio.sleep(0)
+        for text in "bcd":
+            self.ctx.notify_client(self.client, text)
+        self.socket.blocked.set()
+        await self.wait_for_queue()
+        self.assertEqual([[msg["data"][0]["text"] for msg in self.ctx.loader(frame)] for frame in self.socket.frames],
+                         [["a"], ["b", "c", "d"]])
+
+    async def test_send_new_items(self) -> None:
+        """Test that only receivers of new items are sent them, sharing the encoded message between their clients."""
+        tracker = Client(self.Socket(), self.ctx)
+        tracker.team, tracker.slot = 0, 1
+        tracker.items_handling = self.client.items_handling = 0b111
+        other = Client(self.Socket(), self.ctx)
+        other.team, other.slot = 0, 2
+        other.items_handling = 0b111
+        self.ctx.clients[0] = {1: [self.client, tracker], 2: [other]}
+
+        send_items_to(self.ctx, 0, 1, NetworkItem(1, 2, 2, 0))
+        self.assertEqual(self.ctx.pending_item_receivers, {(0, 1)})
+        send_new_items(self.ctx)
+        self.assertFalse(self.ctx.pending_item_receivers)
+        self.assertIs(self.ctx.send_queues[self.client][0], self.ctx.send_queues[tracker][0])
+        self.assertNotIn(other, self.ctx.send_queues)
+        self.assertEqual(self.client.send_index, 1)
+        await self.wait_for_queue()
+        self.assertEqual(self.ctx.loader(self.socket.frames[0])[0]["items"], [NetworkItem(1, 2, 2, 0)])
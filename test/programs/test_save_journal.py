@@ -0,0 +1,136 @@
+import os
+import tempfile
+import unittest
+import zlib
+from types import SimpleNamespace
+
+from MultiServer import Context, SaveJournal
+from NetUtils import NetworkItem
+from Utils import restricted_loads
+
+
+class TestSaveJournal(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "test.apsave.journal")
+        self.ctx = SimpleNamespace(received_items={(0, 1, True): [NetworkItem(1, 2, 2, 0)]},
+                                   location_checks={(0, 2): {2}}, hints={}, stored_data={"a": 1})
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def get_save_state(self) -> dict:
+        return {"hints_used": {(0, 1): len(self.ctx.received_items[0, 1, True])}}
+
+    def get_save(self) -> dict:
+        return {
+            "received_items": {key: list(items) for key, items in self.ctx.received_items.items()},
+            "location_checks": {key: set(checks) for key, checks in self.ctx.location_checks.items()},
+            "hints": dict(self.ctx.hints),
+            "stored_data": dict(self.ctx.stored_data),
+            **self.get_save_state(),
+        }
+
+    def test_replay(self) -> None:
+        """Test that replaying the journal onto its snapshot restores the latest save."""
+        journal = SaveJournal(self.path)
+        snapshot = self.get_save()
+        snapshot["journal_generation"] = 1
+        journal.start(self.ctx, 0)
+
+        self.ctx.received_items[0, 1, True].append(NetworkItem(3, 4, 2, 0))
+        self.ctx.received_items[0, 2, True] = [NetworkItem(5, 6, 1, 0)]
+        self.ctx.location_checks[0, 2].add(4)
+        self.ctx.stored_data["b"] = 2
+        journal.dirty_stored_data.add("b")
+        journal.append(self.ctx, self.get_save_state())
+        self.ctx.received_items[0, 1, True].append(NetworkItem(7, 8, 2, 0))
+        self.ctx.stored_data["a"] = 3
+        journal.dirty_stored_data.add("a")
+        journal.append(self.ctx, self.get_save_state())
+
+        self.assertEqual(SaveJournal(self.path).replay(snapshot), 2)
+        self.assertEqual(snapshot, {**self.get_save(), "journal_generation": 1})
+
+    def test_stale_and_truncated(self) -> None:
+        """Test that journals of other snapshots and partially written entries are ignored."""
+        journal = SaveJournal(self.path)
+        journal.start(self.ctx, 0)
+        self.ctx.location_checks[0, 2].add(4)
+        journal.append(self.ctx, self.get_save_state())
+
+        stale = self.get_save()
+        stale["journal_generation"] = 0
+        self.assertEqual(SaveJournal(self.path).replay(stale), 0)
+
+        with open(self.path, "ab") as f:
+            f.write(b"\xff\x00\x00\x00partial")
+        snapshot = {"received_items": {}, "location_checks": {}, "hints": {}, "stored_data": {},
+                    "journal_generation": 1}
+        self.assertEqual(SaveJournal(self.path).replay(snapshot), 1)
+        self.assertEqual(snapshot["location_checks"], {(0, 2): {2, 4}})
+
+    def test_compaction(self) -> None:
+        """Test that the journal asks to be compacted once it outgrows its snapshot."""
+        journal = SaveJournal(self.path)
+        journal.min_compaction_size = 0
+        journal.start(self.ctx, 100)
+        self.assertFalse(journal.needs_compaction())
+        self.ctx.stored_data["big"] = os.urandom(200)
+        journal.dirty_stored_data.add("big")
+        journal.append(self.ctx, self.get_save_state())
+        self.assertTrue(journal.needs_compaction())
+
+
+class TestJournaledContext(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.save_filename = os.path.join(self.directory.name, "test.apsave")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def read_entries(self) -> list:
+        with open(self.save_filename + ".journal", "rb") as f:
+            data = f.read()
+        entries = []
+        while data:
+            length = int.from_bytes(data[:4], "little")
+            entries.append(restricted_loads(zlib.decompress(data[4:4 + length])))
+            data = data[4 + length:]
+        return entries
+
+    def create_context(self) -> Context:
+        ctx = Context("", 0, "", "", 0, 0, False)
+        ctx.save_filename = self.save_filename
+        ctx.journal_saves = True
+        ctx._start_async_saving = lambda *args, **kwargs: None
+        ctx.init_save()
+        return ctx
+
+    def test_restart(self) -> None:
+        """Test that loading a journaled save starts a new journal on top of a snapshot of the replayed save."""
+        ctx = self.create_context()
+        self.assertTrue(ctx._save())
+        ctx.location_checks[0, 1].add(5)
+        ctx.stored_data["a"] = 1
+        ctx.save_journal.dirty_stored_data.add("a")
+        self.assertTrue(ctx._save())
+        journal_size = ctx.save_journal.size
+
+        restarted = self.create_context()
+        self.assertEqual(restarted.location_checks[0, 1], {5})
+        self.assertEqual(restarted.stored_data, {"a": 1})
+        self.assertEqual(restarted.save_journal.generation, ctx.save_journal.generation + 1)
+        self.assertEqual(restarted.save_journal.size, os.path.getsize(self.save_filename + ".journal"))
+        self.assertLess(restarted.save_journal.size, journal_size)
+
+        # nothing changed since the snapshot, so only the remainder of the save is journaled
+        self.assertTrue(restarted._save())
+        with open(self.save_filename, "rb") as f:
+            snapshot = restricted_loads(zlib.decompress(f.read()))
+        self.assertEqual(SaveJournal(self.save_filename + ".journal").replay(snapshot), 1)
+        self.assertEqual(snapshot, {**restarted.get_save(), "journal_generation": restarted.save_journal.generation})
+        entry = self.read_entries()[-1]
+        self.assertEqual(entry["location_checks"], {})
+        self.assertEqual(entry["stored_data"], {})
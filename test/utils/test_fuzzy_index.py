@@ -0,0 +1,44 @@
+import random
+import unittest
+
+from Utils import FuzzyIndex, get_fuzzy_index, get_fuzzy_results, get_intended_text
+
+
+class TestFuzzyIndex(unittest.TestCase):
+    words = [
+        "Progressive Sword", "Progressive Shield", "Progressive Glove", "Bow", "Silver Arrows", "Hookshot",
+        "Magic Mirror", "Moon Pearl", "Ocarina", "Boss Heart Container", "Piece of Heart", "Sanctuary Heart Container",
+        "Small Key (Eastern Palace)", "Big Key (Eastern Palace)", "Small Key (Desert Palace)", "Map", "Compass",
+        "a", "ab", "", "İstanbul", "Ice Rod", "Fire Rod", "Cane of Somaria", "Cane of Byrna", "bow",
+    ]
+
+    def test_same_results(self) -> None:
+        """Test that the index returns exactly what scoring every word returns, including the order of ties."""
+        index = FuzzyIndex(self.words)
+        inputs = ["", "Bow", "bow", "BOW", "Hokshot", "progresive swrod", "Key", "Heart", "istanbul", "zzz",
+                  "Small Key (Eastern Palace", "Cane of", "İ"]
+        rng = random.Random(0)
+        for word in self.words:
+            if word:
+                letters = list(word)
+                letters[rng.randrange(len(letters))] = rng.choice("abcxyz")
+                inputs.append("".join(letters))
+        for input_word in inputs:
+            for limit in (None, 1, 2, 5):
+                with self.subTest(input_word=input_word, limit=limit):
+                    self.assertEqual(index.get_fuzzy_results(input_word, limit),
+                                     get_fuzzy_results(input_word, self.words, limit))
+
+    def test_intended_text(self) -> None:
+        """Test that get_intended_text accepts an index in place of the possible answers."""
+        index = FuzzyIndex(self.words)
+        self.assertEqual(get_intended_text("hookshot", index), ("Hookshot", True, "Case Insensitive Perfect Match"))
+        self.assertEqual(get_intended_text("Magic Miror", index), ("Magic Mirror", True, "Close Match"))
+
+    def test_shared_index_order(self) -> None:
+        """Test that the shared index breaks ties in the order of the names, like scoring them directly does."""
+        names = {"Small Key (Palace B)": 1, "Small Key (Palace A)": 2}
+        index = get_fuzzy_index(tuple(names))
+        self.assertEqual(index.get_fuzzy_results("Small Key (Palace)", 2),
+                         get_fuzzy_results("Small Key (Palace)", names, 2))
+        self.assertEqual(index.get_fuzzy_results("Small Key (Palace)", 1)[0][0], "Small Key (Palace B)")
@@ -1,10 +1,13 @@
 # Tests that yaml wrappers in Utils.py do what they should
 
+import os
+import tempfile
 import unittest
+from datetime import date
 from typing import cast, Any, ClassVar, Dict
 
 from Utils import dump, Dumper  # type: ignore[attr-defined]
-from Utils import parse_yaml, parse_yamls, unsafe_parse_yaml
+from Utils import cache_path, parse_yaml, parse_yamls, parse_yamls_cached, unsafe_parse_yaml
 
 
 class AClass:
@@ -66,3 +69,31 @@ class TestYaml(unittest.TestCase):
             parse_yaml(s)
         with self.assertRaises(Exception):
             next(parse_yamls(s))
+
+    def test_cached_parse(self) -> None:
+        original_cache_path = getattr(cache_path, "cached_path", None)
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache_path.cached_path = cache_dir
+            try:
+                documents = parse_yamls_cached(self.safe_str)
+                self.assertEqual((self.safe_data,), documents)
+                self.assertEqual(1, len(os.listdir(cache_path("yaml"))))
+                documents[0]["a"].append(4)  # results have to be independent of the cache
+                self.assertEqual((self.safe_data,), parse_yamls_cached(self.safe_str))
+                with self.assertRaises(Exception):
+                    parse_yamls_cached(self.unsafe_str)
+                with self.assertRaises(Exception):
+                    parse_yamls_cached("a: 1\na: 2\n")
+
+                # documents that can't be loaded from the cache aren't cached
+                self.assertEqual(({"a": date(2001, 12, 14)},), parse_yamls_cached("a: 2001-12-14\n"))
+                self.assertEqual(1, len(os.listdir(cache_path("yaml"))))
+
+                # the least recently used entries are evicted once the cache is too big
+                parse_yamls_cached("1\n---\n2\n", max_cache_size=0)
+                self.assertEqual(0, len(os.listdir(cache_path("yaml"))))
+            finally:
+                if original_cache_path is None:
+                    del cache_path.cached_path
+                else:
+                    cache_path.cached_path = original_cache_path
@@ -187,6 +187,23 @@ class TestHostFakeRoom(TestBase):
             commands = select(command for command in Command if command.room.id == self.room_id)  # type: ignore
             self.assertIn("/help", (command.commandtext for command in commands))
 
+    def test_host_room_own_post_notifies(self) -> None:
+        """Verify a command from owner is pushed to the room hosting."""
+        from WebHostLib import roomnotify
+
+        with roomnotify.open_listener("127.0.0.1", 0, 5) as listener:
+            old_port = self.app.config["ROOM_NOTIFY_PORT"]
+            self.app.config["ROOM_NOTIFY_PORT"] = listener.getsockname()[1]
+            try:
+                with self.app.app_context(), self.app.test_request_context():
+                    response = self.client.post(url_for("host_room", room=self.room_id), data={
+                        "cmd": "/help"
+                    })
+                    self.assertEqual(response.status_code, 302, response.text)
+            finally:
+                self.app.config["ROOM_NOTIFY_PORT"] = old_port
+            self.assertEqual((roomnotify.ROOM_COMMAND, self.room_id), roomnotify.receive(listener))
+
     def test_host_room_other_post(self) -> None:
         """Verify command from non-owner does not get queued for the server."""
         from pony.orm import db_session, select
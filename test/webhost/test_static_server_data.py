@@ -0,0 +1,23 @@
+import unittest
+
+
+class TestStaticServerData(unittest.TestCase):
+    def test_round_trip(self) -> None:
+        """Verify that the mapped static server data matches the original and only loads games on access."""
+        from WebHostLib.customserver import (get_static_server_data, get_static_server_data_path,
+                                             load_static_server_data)
+
+        static_server_data = get_static_server_data()
+        mapped = load_static_server_data(get_static_server_data_path())
+        self.assertEqual(set(static_server_data), set(mapped))
+        for key, sections in mapped.items():
+            self.assertFalse(any(sections.is_loaded(game) for game in sections), key)
+            self.assertEqual(set(static_server_data[key]), set(sections), key)
+
+        gamespackage = mapped["gamespackage"]
+        self.assertEqual(static_server_data["gamespackage"]["Archipelago"], gamespackage["Archipelago"])
+        self.assertTrue(gamespackage.is_loaded("Archipelago"))
+        self.assertEqual(1, sum(gamespackage.is_loaded(game) for game in gamespackage))
+        for key, sections in mapped.items():
+            with self.subTest(key=key):
+                self.assertEqual(static_server_data[key], dict(sections))
@@ -103,3 +103,54 @@ class TestTracker(TestBase):
                 self.assertEqual(response.status_code, 200)
             with self.client.open(url_for("api.tracker_slot_data", tracker=self.tracker_uuid)) as response:
                 self.assertEqual(response.status_code, 200)
+
+    def test_tracker_data_cache(self) -> None:
+        """Verify that tracker data shares decoded seed data and only decodes the save again after it changed."""
+        from pony.orm import db_session
+        from WebHostLib.models import Room
+        from WebHostLib.tracker import TrackerData
+
+        with db_session:
+            room: Room = Room.get(id=self.room_id)
+            first = TrackerData(room)
+            second = TrackerData(room)
+            self.assertIs(first._multidata, second._multidata)
+            self.assertIs(first.item_id_to_name, second.item_id_to_name)
+            self.assertEqual({}, second._multisave)
+
+            room.multisave = pickle.dumps({"location_checks": {(0, 1): {1}}})
+            saved = TrackerData(room)
+            self.assertEqual({1}, saved.get_player_checked_locations(0, 1))
+            self.assertIs(saved._multisave, TrackerData(room)._multisave)
+
+            room.multisave = pickle.dumps({"location_checks": {(0, 1): {1, 2}}})
+            self.assertEqual({1, 2}, TrackerData(room).get_player_checked_locations(0, 1))
+
+    def test_tracker_data_cache_size(self) -> None:
+        """Verify that least recently used tracker data is evicted once the cache is over its size in bytes."""
+        from pony.orm import db_session
+        from WebHostLib import tracker
+        from WebHostLib.models import Room
+
+        cache_size = tracker.TRACKER_DATA_CACHE_SIZE
+        tracker._cached_data.clear()
+        tracker._cached_data_size = 0
+        try:
+            with db_session:
+                room: Room = Room.get(id=self.room_id)
+                room.multisave = pickle.dumps({"location_checks": {(0, 1): {1}}})
+                multidata = tracker.TrackerData(room)._multidata
+                seed_size = tracker._cached_data["seed", room.seed.id][1]
+                save_size = tracker._cached_data["save", room.id][1]
+                self.assertEqual(len(self.data), seed_size)
+                self.assertEqual(seed_size + save_size, tracker._cached_data_size)
+
+                # a larger save no longer fits next to the seed, which was used less recently
+                tracker.TRACKER_DATA_CACHE_SIZE = seed_size + save_size - 1
+                room.multisave = pickle.dumps({"location_checks": {(0, 1): {1, 2}}})
+                tracker.TrackerData(room)
+                self.assertNotIn(("seed", room.seed.id), tracker._cached_data)
+                self.assertIsNot(multidata, tracker.TrackerData(room)._multidata)
+                self.assertLessEqual(tracker._cached_data_size, tracker.TRACKER_DATA_CACHE_SIZE)
+        finally:
+            tracker.TRACKER_DATA_CACHE_SIZE = cache_size
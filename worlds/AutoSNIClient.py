@@ -71,6 +71,9 @@ class AutoSNIClientRegister(abc.ABCMeta):
 
     @staticmethod
     async def get_handler(ctx: SNIContext) -> Optional[SNIClient]:
+        from worlds import load_all_worlds
+        # handlers are registered when their world is imported, and which game the rom is for is not known yet
+        load_all_worlds()
         for _game, handler in AutoSNIClientRegister.game_handlers.items():
             try:
                 if await handler.validate_rom(ctx):
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import concurrent.futures
 import hashlib
 import logging
 import pathlib
 import sys
 import time
-from collections.abc import Callable, Iterable, Mapping
+from collections.abc import Callable, Iterable, ItemsView, Iterator, KeysView, Mapping, ValuesView
 from random import Random
 from typing import (Any, ClassVar, Dict, FrozenSet, List, Optional, Self, Set, TextIO, Tuple,
                     TYPE_CHECKING, Type, Union)
@@ -27,8 +28,69 @@ class InvalidItemError(KeyError):
     pass
 
 
+class WorldTypes(Dict[str, Type["World"]]):
+    """
+    World types by game. Looking up a game imports the world source providing it, if that didn't happen yet, while
+    iterating imports all world sources. How they are imported is set up by the worlds package.
+    """
+    load_game: Optional[Callable[[str], None]] = None
+    load_all: Optional[Callable[[], None]] = None
+
+    def _load_game(self, game: Any) -> None:
+        if self.load_game and not super().__contains__(game):
+            self.load_game(game)
+
+    def _load_all(self) -> None:
+        if self.load_all:
+            self.load_all()
+
+    def __getitem__(self, game: str) -> Type[World]:
+        self._load_game(game)
+        return super().__getitem__(game)
+
+    def __contains__(self, game: object) -> bool:
+        self._load_game(game)
+        return super().__contains__(game)
+
+    def get(self, game: str, default: Any = None) -> Any:
+        self._load_game(game)
+        return super().get(game, default)
+
+    def __iter__(self) -> Iterator[str]:
+        self._load_all()
+        return super().__iter__()
+
+    def __len__(self) -> int:
+        self._load_all()
+        return super().__len__()
+
+    def keys(self) -> KeysView[str]:
+        self._load_all()
+        return super().keys()
+
+    def values(self) -> ValuesView[Type[World]]:
+        self._load_all()
+        return super().values()
+
+    def items(self) -> ItemsView[str, Type[World]]:
+        self._load_all()
+        return super().items()
+
+    def copy(self) -> WorldTypes:
+        copy = WorldTypes(self)
+        copy.load_game = self.load_game
+        copy.load_all = self.load_all
+        return copy
+
+    def __repr__(self) -> str:
+        self._load_all()
+        return super().__repr__()
+
+
 class AutoWorldRegister(type):
-    world_types: Dict[str, Type[World]] = {}
+    world_types: Dict[str, Type[World]] = WorldTypes()
+    world_versions: Dict[str, Version] = {}
+    """world versions from the manifests by game, which are set when the world type is registered"""
     __file__: str
     zip_path: Optional[str]
     settings_key: str
@@ -89,11 +151,14 @@ class AutoWorldRegister(type):
         new_class = super().__new__(mcs, name, bases, dct)
         new_class.__file__ = sys.modules[new_class.__module__].__file__
         if "game" in dct:
-            if dct["game"] in AutoWorldRegister.world_types:
+            # only check registered world types, without importing the world source that provides the game
+            if dict.__contains__(AutoWorldRegister.world_types, dct["game"]):
                 raise RuntimeError(f"""Game {dct["game"]} already registered in 
                 {AutoWorldRegister.world_types[dct["game"]].__file__} when attempting to register from
                 {new_class.__file__}.""")
             AutoWorldRegister.world_types[dct["game"]] = new_class
+            if dct["game"] in AutoWorldRegister.world_versions:
+                new_class.world_version = AutoWorldRegister.world_versions[dct["game"]]
         if ".apworld" in new_class.__file__:
             new_class.zip_path = pathlib.Path(new_class.__file__).parents[1]
         if "settings_key" not in dct:
@@ -197,6 +262,35 @@ def call_single(multiworld: "MultiWorld", method_name: str, player: int, *args:
         return ret
 
 
+def uses_isolated_output(world_type: Type[World]) -> bool:
+    """Whether the world type implements World.generate_output_isolated."""
+    return world_type.generate_output_isolated.__func__ is not World.generate_output_isolated.__func__
+
+
+def call_output_isolated(multiworld: "MultiWorld", player: int, output_directory: str,
+                         process_pool: Optional[concurrent.futures.Executor] = None) -> None:
+    """
+    Writes the output of a world that implements World.generate_output_isolated, from the state returned by its
+    World.get_output_state. The output is generated in `process_pool` if one is given, otherwise in the calling thread.
+    """
+    world_type = type(multiworld.worlds[player])
+    output_state = call_single(multiworld, "get_output_state", player)
+    try:
+        if process_pool:
+            process_pool.submit(world_type.generate_output_isolated, output_state, output_directory).result()
+        else:
+            _timed_call(world_type.generate_output_isolated, output_state, output_directory,
+                        multiworld=multiworld, player=player)
+    except Exception as e:
+        message = (f"Exception in {world_type.generate_output_isolated} for player {player}, "
+                   f"named {multiworld.player_name[player]}.")
+        if sys.version_info >= (3, 11, 0):
+            e.add_note(message)  # PEP 678
+        else:
+            logging.error(message)
+        raise e
+
+
 def call_all(multiworld: "MultiWorld", method_name: str, *args: Any) -> None:
     world_types: Set[AutoWorldRegister] = set()
     for player in multiworld.player_ids:
@@ -454,6 +548,22 @@ class World(metaclass=AutoWorldRegister):
         """
         pass
 
+    def get_output_state(self) -> Any:
+        """
+        Returns everything generate_output_isolated needs to write the output of this world, which has to be picklable.
+        Only called for worlds that implement generate_output_isolated, from a threadpool like generate_output.
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def generate_output_isolated(cls, output_state: Any, output_directory: str) -> None:
+        """
+        Alternative to generate_output that only gets the state returned by get_output_state, instead of the world and
+        the multiworld. When the host enables output processes, it runs in another process, so CPU bound output like
+        ROM patching can use multiple cores.
+        """
+        pass
+
     def fill_slot_data(self) -> Mapping[str, Any]:  # json of WebHostLib.models.Slot
         """
         What is returned from this function will be in the `slot_data` field
@@ -479,7 +589,11 @@ class World(metaclass=AutoWorldRegister):
         pass
 
     def modify_multidata(self, multidata: "MultiData") -> None:
-        """For deeper modification of server multidata."""
+        """
+        For deeper modification of server multidata.
+        The slot data, locations, precollected hints, spheres and data package are already written at this point and
+        are not part of `multidata`.
+        """
         pass
 
     # Spoiler writing is optional, these may not get called.
@@ -61,9 +61,19 @@ class AutoPatchRegister(abc.ABCMeta):
 
     @staticmethod
     def get_handler(file: str) -> Optional[AutoPatchRegister]:
+        from worlds import load_all_worlds
+        # patch containers are registered when their world is imported, and the game is not known from the suffix
+        load_all_worlds()
         _, suffix = os.path.splitext(file)
         return AutoPatchRegister.file_endings.get(suffix, None)
 
+    @staticmethod
+    def get_patch_type(game: str) -> Optional[AutoPatchRegister]:
+        from worlds import load_world
+        # patch containers are registered when their world is imported
+        load_world(game)
+        return AutoPatchRegister.patch_types.get(game, None)
+
 
 class AutoPatchExtensionRegister(abc.ABCMeta):
     extension_types: ClassVar[Dict[str, AutoPatchExtensionRegister]] = {}
@@ -80,10 +90,14 @@ class AutoPatchExtensionRegister(abc.ABCMeta):
     def get_handler(game: Optional[str]) -> Union[AutoPatchExtensionRegister, List[AutoPatchExtensionRegister]]:
         if not game:
             return APPatchExtension
+        from worlds import load_world
+        # import the worlds providing the game and its required extensions, which registers their extensions
+        load_world(game)
         handler = AutoPatchExtensionRegister.extension_types.get(game, APPatchExtension)
         if handler.required_extensions:
             handlers = [handler]
             for required in handler.required_extensions:
+                load_world(required)
                 ext = AutoPatchExtensionRegister.extension_types.get(required)
                 if not ext:
                     raise NotImplementedError(f"No handler for {required}.")
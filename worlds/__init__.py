@@ -1,20 +1,25 @@
+import functools
+import hashlib
 import importlib
 import importlib.abc
 import importlib.machinery
 import logging
 import os
+import pickle
 import sys
+import threading
 import zipimport
 import time
 import dataclasses
 import json
 from pathlib import Path
 from types import ModuleType
-from typing import List, Sequence
+from typing import Any, Dict, FrozenSet, List, Sequence, Tuple
 from zipfile import BadZipFile
 
-from NetUtils import DataPackage
-from Utils import local_path, user_path, Version, version_tuple, tuplize_version, messagebox
+from NetUtils import DataPackage, GamesPackage
+from Utils import (__version__, cache_path, local_path, restricted_loads, user_path, Version, version_tuple,
+                   tuplize_version, messagebox)
 
 local_folder = os.path.dirname(__file__)
 user_folder = user_path("worlds") if user_path() != local_path() else user_path("custom_worlds")
@@ -30,6 +35,10 @@ __all__ = [
     "local_folder",
     "user_folder",
     "failed_world_loads",
+    "load_world",
+    "load_all_worlds",
+    "get_data_package",
+    "get_hint_blacklist",
 ]
 
 
@@ -53,6 +62,26 @@ class WorldSource:
             return os.path.join(local_folder, self.path)
         return self.path
 
+    @functools.cached_property
+    def fingerprint(self) -> str:
+        """
+        Hash of the paths and contents of the files of the world source, to tell if cached data about it is still valid.
+        """
+        fingerprint = hashlib.sha256()
+        if self.is_zip:
+            with open(self.resolved_path, "rb") as f:
+                fingerprint.update(f.read())
+            return fingerprint.hexdigest()
+        for dirpath, dirnames, filenames in os.walk(self.resolved_path):
+            dirnames[:] = sorted(dirname for dirname in dirnames if dirname != "__pycache__")
+            for name in sorted(filenames):
+                path = os.path.join(dirpath, name)
+                with open(path, "rb") as f:
+                    content = hashlib.sha256(f.read()).digest()
+                fingerprint.update(os.path.relpath(path, self.resolved_path).encode())
+                fingerprint.update(content)
+        return fingerprint.hexdigest()
+
     def load(self) -> bool:
         try:
             start = time.perf_counter()
@@ -91,20 +120,223 @@ for folder in (folder for folder in (user_folder, local_folder) if folder):
             elif entry.is_file() and entry.name.endswith(".apworld"):
                 world_sources.append(WorldSource(file_name, is_zip=True, relative=relative))
 
-# import all submodules to trigger AutoWorldRegister
 world_sources.sort()
+
+from .AutoWorld import AutoWorldRegister
+
+_lock = threading.RLock()
+_game_sources: Dict[str, WorldSource] = {}
+"""World source providing each game, known from the manifests or the world index without importing the world."""
+_ordered_sources: List[WorldSource] = []
+"""World sources in the order load_all_worlds imports them: loose folders first, then apworlds by version."""
+_loaded_sources: set[str] = set()
+_all_worlds_loaded = False
+_world_data: Dict[str, Tuple[GamesPackage, FrozenSet[str]]] = {}
+"""Data package and hint blacklist by game. They're cached on disk per world source, keyed by version."""
+world_index_path = cache_path("worlds", "index.pickle")
+"""Caches the games of world sources that have no manifest, so they don't have to be imported to find them."""
+
+
+def _read_cache(path: str) -> Any:
+    try:
+        with open(path, "rb") as f:
+            return restricted_loads(f.read())
+    except Exception:
+        return None  # not cached, or cached by something we don't trust to load
+
+
+def _write_cache(path: str, value: Any) -> None:
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as f:
+            pickle.dump(value, f)
+        os.replace(temp_path, path)
+    except Exception as e:
+        logging.debug(f"Could not cache world data: {e}")
+
+
+def _source_games(world_source: WorldSource) -> List[str]:
+    """Returns the games registered by the modules of an imported world source."""
+    module = f"worlds.{Path(world_source.path).stem}"
+    return [game for game, world_type in dict.items(AutoWorldRegister.world_types)
+            if world_type.__module__ == module or world_type.__module__.startswith(f"{module}.")]
+
+
+def _load_source(world_source: WorldSource) -> bool:
+    """Imports a world source, unless that was already attempted. Returns False if importing it failed."""
+    with _lock:
+        if world_source.resolved_path in _loaded_sources:
+            return world_source.time_taken >= 0
+        _loaded_sources.add(world_source.resolved_path)
+        if world_source.load():
+            return True
+        _invalidate_source(world_source)
+        return False
+
+
+def _invalidate_source(world_source: WorldSource) -> None:
+    """
+    Forgets the cached games and data of a world source that failed to load, so they aren't served without it and it
+    is imported again the next time instead.
+    """
+    for game, source in _game_sources.items():
+        if source is world_source:
+            _world_data.pop(game, None)
+            if "network_data_package" in globals():
+                network_data_package["games"].pop(game, None)
+    try:
+        os.remove(_world_data_path(world_source))
+    except OSError:
+        pass  # not cached
+    world_index = _read_cache(world_index_path)
+    if isinstance(world_index, dict) and world_source.resolved_path in world_index.get("sources", ()):
+        del world_index["sources"][world_source.resolved_path]
+        _write_cache(world_index_path, world_index)
+
+
+def _load_game(game: str) -> None:
+    world_source = _game_sources.get(game)
+    if world_source:
+        _load_source(world_source)
+    elif AutoWorldRegister.world_types.load_all:
+        # not listed in a manifest or the index, like additional games registered by a world, so it can be anywhere
+        load_all_worlds()
+
+
+def load_world(game: str) -> None:
+    """
+    Imports the world source providing `game`, if it wasn't imported yet.
+    Looking up the game in AutoWorldRegister.world_types does the same, but this is needed to use the registries that
+    the world adds itself to when imported, like its patch handler.
+    """
+    if not dict.__contains__(AutoWorldRegister.world_types, game):
+        _load_game(game)
+
+
+def load_all_worlds() -> None:
+    """
+    Imports all world sources that weren't imported yet.
+    Iterating AutoWorldRegister.world_types does this, but it is also needed to use the registries that worlds add
+    themselves to when imported, like launcher components or patch handlers.
+    """
+    global _all_worlds_loaded
+    with _lock:
+        if _all_worlds_loaded:
+            return
+        for world_source in _ordered_sources:
+            _load_source(world_source)
+        _all_worlds_loaded = True
+        # order the world types by world source, as if they had all been imported at once
+        world_types = AutoWorldRegister.world_types
+        ordered = {game: dict.__getitem__(world_types, game)
+                   for world_source in _ordered_sources for game in _source_games(world_source)}
+        ordered.update(dict.items(world_types))
+        dict.clear(world_types)
+        dict.update(world_types, ordered)
+
+
+def _world_data_path(world_source: WorldSource) -> str:
+    return cache_path("worlds", f"{hashlib.sha256(world_source.resolved_path.encode()).hexdigest()}.pickle")
+
+
+def _compute_world_data(game: str) -> Tuple[GamesPackage, FrozenSet[str]]:
+    world_type = AutoWorldRegister.world_types[game]
+    return world_type.get_data_package_data(), frozenset(world_type.hint_blacklist)
+
+
+def _get_world_data(game: str) -> Tuple[GamesPackage, FrozenSet[str]]:
+    """
+    Returns the data package and hint blacklist of a game. They're read from the cache while that is valid for the
+    world source providing the game, in which case its world doesn't have to be imported.
+    """
+    with _lock:
+        if game not in _world_data:
+            world_source = _game_sources.get(game)
+            if not world_source:
+                # not listed in a manifest or the index, so there's no world source to cache it for
+                _world_data[game] = _compute_world_data(game)
+                return _world_data[game]
+            versions = sorted((source_game, tuple(AutoWorldRegister.world_versions[source_game]))
+                              for source_game, source in _game_sources.items()
+                              if source is world_source and source_game in AutoWorldRegister.world_versions)
+            key = __version__, world_source.fingerprint, versions
+            cached = _read_cache(_world_data_path(world_source))
+            if cached and cached[0] == key:
+                _world_data.update(cached[1])
+            else:
+                _load_source(world_source)
+                world_data = {source_game: _compute_world_data(source_game)
+                              for source_game in _source_games(world_source)}
+                if world_data:
+                    _write_cache(_world_data_path(world_source), (key, world_data))
+                _world_data.update(world_data)
+        return _world_data[game]
+
+
+def get_data_package(game: str) -> GamesPackage:
+    """Returns the data package of a game, from the cache if possible. See _get_world_data."""
+    return _get_world_data(game)[0]
+
+
+def get_hint_blacklist(game: str) -> FrozenSet[str]:
+    """Returns the names of a game that can't be hinted for, from the cache if possible. See _get_world_data."""
+    return _get_world_data(game)[1]
+
+
+network_data_package: DataPackage
+"""Data packages of all games, built on first use by __getattr__."""
+
+
+def __getattr__(name: str) -> Any:
+    global network_data_package
+    if name == "network_data_package":
+        with _lock:
+            if "network_data_package" not in globals():
+                games: Dict[str, GamesPackage] = {}
+                for game in _game_sources:
+                    try:
+                        games[game] = get_data_package(game)
+                    except KeyError:
+                        pass  # world failed to load
+                network_data_package = {"games": games}
+        return network_data_package
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# world sources that are imported while indexing can already look up the indexed games,
+# while iterating all world types has to wait until the index is complete
+AutoWorldRegister.world_types.load_game = _load_game
+
+world_index = _read_cache(world_index_path)
+cached_index: Dict[str, Tuple[str, List[str]]] = \
+    world_index["sources"] if isinstance(world_index, dict) and world_index.get("version") == __version__ else {}
+index: Dict[str, Tuple[str, List[str]]] = {}
+
+
+def _add_source(world_source: WorldSource, games: List[str] | None) -> None:
+    """Adds the games of a world source to the lookup. If they aren't known, the world source is imported right away."""
+    _ordered_sources.append(world_source)
+    if games is None:
+        fingerprint = world_source.fingerprint
+        cached = cached_index.get(world_source.resolved_path)
+        if cached and cached[0] == fingerprint:
+            games = cached[1]
+        else:
+            if not _load_source(world_source):
+                return  # not cached, so importing it is tried again next time
+            games = _source_games(world_source)
+        index[world_source.resolved_path] = fingerprint, games
+    for game in games:
+        _game_sources.setdefault(game, world_source)
+
+
 apworlds: list[WorldSource] = []
+manifest_games: dict[str, str | None] = {}
 for world_source in world_sources:
-    # load all loose files first:
     if world_source.is_zip:
         apworlds.append(world_source)
     else:
-        world_source.load()
-
-from .AutoWorld import AutoWorldRegister
-
-for world_source in world_sources:
-    if not world_source.is_zip:
         # look for manifest
         manifest = {}
         for dirpath, dirnames, filenames in os.walk(world_source.resolved_path):
@@ -116,8 +348,16 @@ for world_source in world_sources:
             if manifest:
                 break
         game = manifest.get("game")
-        if game in AutoWorldRegister.world_types:
-            AutoWorldRegister.world_types[game].world_version = tuplize_version(manifest.get("world_version", "0.0.0"))
+        manifest_games[world_source.resolved_path] = game
+        if game:
+            AutoWorldRegister.world_versions[game] = tuplize_version(manifest.get("world_version", "0.0.0"))
+
+# add all loose files first:
+for world_source in world_sources:
+    if not world_source.is_zip:
+        game = manifest_games[world_source.resolved_path]
+        _add_source(world_source, [game] if game else None)
+del manifest_games
 
 if apworlds:
     # encapsulation for namespace / gc purposes
@@ -182,7 +422,7 @@ if apworlds:
         sys.meta_path.insert(0, APWorldModuleFinder())
 
         for apworld_source, apworld in core_compatible:
-            if apworld.game and apworld.game in AutoWorldRegister.world_types:
+            if apworld.game and apworld.game in _game_sources:
                 fail_world(apworld.game,
                            f"Did not load {apworld_source.path} "
                            f"as its game {apworld.game} is already loaded.",
@@ -194,18 +434,16 @@ if apworlds:
                 spec = importer.find_spec(f"worlds.{world_name}")
                 apworld_module_specs[f"worlds.{world_name}"] = spec
 
-                apworld_source.load()
-                if apworld.game in AutoWorldRegister.world_types:
-                    # world could fail to load at this point
-                    if apworld.world_version:
-                        AutoWorldRegister.world_types[apworld.game].world_version = apworld.world_version
+                if apworld.game and apworld.world_version:
+                    AutoWorldRegister.world_versions[apworld.game] = apworld.world_version
+                _add_source(apworld_source, [apworld.game] if apworld.game else None)
     load_apworlds()
     del load_apworlds
 
 del apworlds
 
-# Build the data package for each game.
-network_data_package: DataPackage = {
-    "games": {world_name: world.get_data_package_data() for world_name, world in AutoWorldRegister.world_types.items()},
-}
+if index != cached_index:
+    _write_cache(world_index_path, {"version": __version__, "sources": index})
+del world_index, cached_index, index
 
+AutoWorldRegister.world_types.load_all = load_all_worlds
@@ -56,6 +56,9 @@ class AutoBizHawkClientRegister(abc.ABCMeta):
 
     @staticmethod
     async def get_handler(ctx: "BizHawkClientContext", system: str) -> BizHawkClient | None:
+        from worlds import load_all_worlds
+        # handlers are registered when their world is imported, and which game the rom is for is not known yet
+        load_all_worlds()
         for systems, handlers in AutoBizHawkClientRegister.game_handlers.items():
             if system in systems:
                 for handler in handlers.values():
@@ -30,7 +30,7 @@ def fake_pearl_state(state: CollectionState, player: int):
     if state.has('Moon Pearl', player):
         return state
     fake_state = state.copy()
-    fake_state.prog_items[player]['Moon Pearl'] += 1
+    fake_state.add_item('Moon Pearl', player)
     return fake_state
 
 
@@ -30,7 +30,7 @@ class TestSpotsGlitchless(BombRushCyberfunkTestBase):
         self.assertEqual(8, spots_l_glitchless(self.multiworld.state, player, False, access_cache))
 
 
-        self.multiworld.state.prog_items[player]["rep"] = 20
+        self.multiworld.state.set_item("rep", player, 20)
         access_cache = build_access_cache(self.multiworld.state, player, 2, False, False)
 
         # chapter 1 - VH1-2
@@ -40,7 +40,7 @@ class TestSpotsGlitchless(BombRushCyberfunkTestBase):
         self.assertEqual(9, spots_xl_glitchless(self.multiworld.state, player, False, access_cache))
 
 
-        self.multiworld.state.prog_items[player]["rep"] = 65
+        self.multiworld.state.set_item("rep", player, 65)
         access_cache = build_access_cache(self.multiworld.state, player, 2, False, False)
 
         # chapter 1 - VH3
@@ -48,14 +48,14 @@ class TestSpotsGlitchless(BombRushCyberfunkTestBase):
         self.assertEqual(24, spots_l_glitchless(self.multiworld.state, player, False, access_cache))
 
 
-        self.multiworld.state.prog_items[player]["rep"] = 90
+        self.multiworld.state.set_item("rep", player, 90)
         access_cache = build_access_cache(self.multiworld.state, player, 2, False, False)
 
         # chapter 1 - VH4
         self.assertEqual(10, spots_xl_glitchless(self.multiworld.state, player, False, access_cache))
 
 
-        self.multiworld.state.prog_items[player]["Chapter Completed"] = 1
+        self.multiworld.state.set_item("Chapter Completed", player, 1)
         access_cache = build_access_cache(self.multiworld.state, player, 2, False, False)
 
         # chapter 2 - MS + MA1
@@ -65,7 +65,7 @@ class TestSpotsGlitchless(BombRushCyberfunkTestBase):
         self.assertEqual(19, spots_xl_glitchless(self.multiworld.state, player, False, access_cache))
 
 
-        self.multiworld.state.prog_items[player]["rep"] = 120
+        self.multiworld.state.set_item("rep", player, 120)
         access_cache = build_access_cache(self.multiworld.state, player, 2, False, False)
 
         # chapter 2 - VHO
@@ -75,7 +75,7 @@ class TestSpotsGlitchless(BombRushCyberfunkTestBase):
 
 
         self.collect_by_name("Bel")
-        self.multiworld.state.prog_items[player]["rep"] = 180
+        self.multiworld.state.set_item("rep", player, 180)
         access_cache = build_access_cache(self.multiworld.state, player, 2, False, False)
 
         # chapter 2 - BT1
@@ -85,7 +85,7 @@ class TestSpotsGlitchless(BombRushCyberfunkTestBase):
         self.assertEqual(22, spots_xl_glitchless(self.multiworld.state, player, False, access_cache))
 
 
-        self.multiworld.state.prog_items[player]["rep"] = 220
+        self.multiworld.state.set_item("rep", player, 220)
         access_cache = build_access_cache(self.multiworld.state, player, 2, False, False)
 
         # chapter 2 - BT2
@@ -95,7 +95,7 @@ class TestSpotsGlitchless(BombRushCyberfunkTestBase):
         self.assertEqual(23, spots_xl_glitchless(self.multiworld.state, player, False, access_cache))
 
 
-        self.multiworld.state.prog_items[player]["rep"] = 250
+        self.multiworld.state.set_item("rep", player, 250)
         access_cache = build_access_cache(self.multiworld.state, player, 2, False, False)
 
         # chapter 2 - BTO1
@@ -103,7 +103,7 @@ class TestSpotsGlitchless(BombRushCyberfunkTestBase):
         self.assertEqual(24, spots_xl_glitchless(self.multiworld.state, player, False, access_cache))
 
 
-        self.multiworld.state.prog_items[player]["rep"] = 280
+        self.multiworld.state.set_item("rep", player, 280)
         access_cache = build_access_cache(self.multiworld.state, player, 2, False, False)
 
         # chapter 2 - BT3 / chapter 3 - MS
@@ -111,8 +111,8 @@ class TestSpotsGlitchless(BombRushCyberfunkTestBase):
         self.assertEqual(28, spots_xl_glitchless(self.multiworld.state, player, False, access_cache))
 
 
-        self.multiworld.state.prog_items[player]["rep"] = 320
-        self.multiworld.state.prog_items[player]["Chapter Completed"] = 2
+        self.multiworld.state.set_item("rep", player, 320)
+        self.multiworld.state.set_item("Chapter Completed", player, 2)
         access_cache = build_access_cache(self.multiworld.state, player, 2, False, False)
 
         # chapter 2 - BTO2 / chapter 3 - MS
@@ -122,7 +122,7 @@ class TestSpotsGlitchless(BombRushCyberfunkTestBase):
         self.assertEqual(30, spots_xl_glitchless(self.multiworld.state, player, False, access_cache))
 
 
-        self.multiworld.state.prog_items[player]["rep"] = 380
+        self.multiworld.state.set_item("rep", player, 380)
         access_cache = build_access_cache(self.multiworld.state, player, 2, False, False)
 
         # chapter 3 - MM1-2
@@ -132,7 +132,7 @@ class TestSpotsGlitchless(BombRushCyberfunkTestBase):
         self.assertEqual(37, spots_xl_glitchless(self.multiworld.state, player, False, access_cache))
 
 
-        self.multiworld.state.prog_items[player]["rep"] = 491
+        self.multiworld.state.set_item("rep", player, 491)
         access_cache = build_access_cache(self.multiworld.state, player, 2, False, False)
 
         # chapter 3 - MM3
@@ -142,7 +142,7 @@ class TestSpotsGlitchless(BombRushCyberfunkTestBase):
         self.assertEqual(42, spots_xl_glitchless(self.multiworld.state, player, False, access_cache))
 
 
-        self.multiworld.state.prog_items[player]["Chapter Completed"] = 3
+        self.multiworld.state.set_item("Chapter Completed", player, 3)
         access_cache = build_access_cache(self.multiworld.state, player, 2, False, False)
 
         # chapter 4 - MS / BT / MMO1 / PI1
@@ -152,7 +152,7 @@ class TestSpotsGlitchless(BombRushCyberfunkTestBase):
         self.assertEqual(46, spots_xl_glitchless(self.multiworld.state, player, False, access_cache))
 
 
-        self.multiworld.state.prog_items[player]["rep"] = 620
+        self.multiworld.state.set_item("rep", player, 620)
         access_cache = build_access_cache(self.multiworld.state, player, 2, False, False)
 
         # chapter 4 - PI2
@@ -161,7 +161,7 @@ class TestSpotsGlitchless(BombRushCyberfunkTestBase):
         self.assertEqual(89, spots_l_glitchless(self.multiworld.state, player, False, access_cache))
 
 
-        self.multiworld.state.prog_items[player]["rep"] = 660
+        self.multiworld.state.set_item("rep", player, 660)
         access_cache = build_access_cache(self.multiworld.state, player, 2, False, False)
 
         # chapter 4 - PI3
@@ -171,8 +171,8 @@ class TestSpotsGlitchless(BombRushCyberfunkTestBase):
         self.assertEqual(51, spots_xl_glitchless(self.multiworld.state, player, False, access_cache))
 
 
-        self.multiworld.state.prog_items[player]["rep"] = 730
-        self.multiworld.state.prog_items[player]["Chapter Completed"] = 4
+        self.multiworld.state.set_item("rep", player, 730)
+        self.multiworld.state.set_item("Chapter Completed", player, 4)
         access_cache = build_access_cache(self.multiworld.state, player, 2, False, False)
 
         # chapter 5 - PI4
@@ -180,7 +180,7 @@ class TestSpotsGlitchless(BombRushCyberfunkTestBase):
         self.assertEqual(96, spots_l_glitchless(self.multiworld.state, player, False, access_cache))
 
 
-        self.multiworld.state.prog_items[player]["rep"] = 780
+        self.multiworld.state.set_item("rep", player, 780)
         access_cache = build_access_cache(self.multiworld.state, player, 2, False, False)
 
         # chapter 5 - PIO
@@ -190,7 +190,7 @@ class TestSpotsGlitchless(BombRushCyberfunkTestBase):
         self.assertEqual(54, spots_xl_glitchless(self.multiworld.state, player, False, access_cache))
 
 
-        self.multiworld.state.prog_items[player]["rep"] = 850
+        self.multiworld.state.set_item("rep", player, 850)
         access_cache = build_access_cache(self.multiworld.state, player, 2, False, False)
 
         # chapter 5 - MA2
@@ -199,7 +199,7 @@ class TestSpotsGlitchless(BombRushCyberfunkTestBase):
         self.assertEqual(56, spots_xl_glitchless(self.multiworld.state, player, False, access_cache))
 
 
-        self.multiworld.state.prog_items[player]["rep"] = 864
+        self.multiworld.state.set_item("rep", player, 864)
         access_cache = build_access_cache(self.multiworld.state, player, 2, False, False)
 
         # chapter 5 - MA3
@@ -209,7 +209,7 @@ class TestSpotsGlitchless(BombRushCyberfunkTestBase):
         self.assertEqual(58, spots_xl_glitchless(self.multiworld.state, player, False, access_cache))
 
 
-        self.multiworld.state.prog_items[player]["rep"] = 935
+        self.multiworld.state.set_item("rep", player, 935)
         access_cache = build_access_cache(self.multiworld.state, player, 2, False, False)
 
         # chapter 5 - MAO
@@ -219,7 +219,7 @@ class TestSpotsGlitchless(BombRushCyberfunkTestBase):
         self.assertEqual(60, spots_xl_glitchless(self.multiworld.state, player, False, access_cache))
 
 
-        self.multiworld.state.prog_items[player]["rep"] = 960
+        self.multiworld.state.set_item("rep", player, 960)
         access_cache = build_access_cache(self.multiworld.state, player, 2, False, False)
 
         # chapter 5 - MA4-5
@@ -255,8 +255,8 @@ class TestSpotsGlitched(BombRushCyberfunkTestBase):
 
 
         self.collect_by_name("Bel")
-        self.multiworld.state.prog_items[player]["Chapter Completed"] = 1
-        self.multiworld.state.prog_items[player]["rep"] = 180
+        self.multiworld.state.set_item("Chapter Completed", player, 1)
+        self.multiworld.state.set_item("rep", player, 180)
         access_cache = build_access_cache(self.multiworld.state, player, 2, False, True)
 
         # brink terminal
@@ -266,7 +266,7 @@ class TestSpotsGlitched(BombRushCyberfunkTestBase):
         self.assertEqual(58, spots_xl_glitched(self.multiworld.state, player, False, access_cache))
 
 
-        self.multiworld.state.prog_items[player]["Chapter Completed"] = 2
+        self.multiworld.state.set_item("Chapter Completed", player, 2)
         access_cache = build_access_cache(self.multiworld.state, player, 2, False, True)
 
         # chapter 3
@@ -276,7 +276,7 @@ class TestSpotsGlitched(BombRushCyberfunkTestBase):
         self.assertEqual(61, spots_xl_glitched(self.multiworld.state, player, False, access_cache))
 
 
-        self.multiworld.state.prog_items[player]["Chapter Completed"] = 3
+        self.multiworld.state.set_item("Chapter Completed", player, 3)
         access_cache = build_access_cache(self.multiworld.state, player, 2, False, True)
 
         # chapter 4
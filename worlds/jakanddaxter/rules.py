@@ -39,11 +39,12 @@ def recalculate_reachable_orbs(state: CollectionState, player: int, world: "JakA
     for level in level_table:
         accessible_level_orbs = count_reachable_orbs_level(state, world, level)
         accessible_total_orbs += accessible_level_orbs
-        state.prog_items[player][f"{level} Reachable Orbs".lstrip()] = accessible_level_orbs
+        state.make_items_exclusive(player)[f"{level} Reachable Orbs".lstrip()] = accessible_level_orbs
 
     # Also recalculate the global count, still used even when Orbsanity is Off.
-    state.prog_items[player]["Reachable Orbs"] = accessible_total_orbs
-    state.prog_items[player]["Reachable Orbs Fresh"] = True
+    player_prog_items = state.make_items_exclusive(player)
+    player_prog_items["Reachable Orbs"] = accessible_total_orbs
+    player_prog_items["Reachable Orbs Fresh"] = True
 
 
 def count_reachable_orbs_global(state: CollectionState,
@@ -32,8 +32,14 @@ class KH1Container(APPlayerContainer):
 
 
 def generate_json(world, output_directory):
+    write_mod(get_mod_data(world), output_directory)
+
+def get_mod_data(world):
+    """
+    Returns the name and files of the mod along with the player, which is all write_mod needs, so it can run in another
+    process.
+    """
     mod_name = f"AP-{world.multiworld.seed_name}-P{world.player}-{world.multiworld.get_file_safe_player_name(world.player)}"
-    mod_dir = os.path.join(output_directory, mod_name + "_" + Utils.__version__)
     
     item_location_map = get_item_location_map(world)
     settings = get_settings(world)
@@ -44,9 +50,13 @@ def generate_json(world, output_directory):
         "settings.json":           json.dumps(settings),
         "ap_costs.json":           json.dumps(world.get_ap_costs())
     }
+    return mod_name, files, world.player, world.multiworld.get_file_safe_player_name(world.player)
+
+def write_mod(mod_data, output_directory):
+    mod_name, files, player, player_name = mod_data
+    mod_dir = os.path.join(output_directory, mod_name + "_" + Utils.__version__)
 
-    mod = KH1Container(files, mod_dir, output_directory, world.player,
-            world.multiworld.get_file_safe_player_name(world.player))
+    mod = KH1Container(files, mod_dir, output_directory, player, player_name)
     mod.write()
 
 def get_item_location_map(world):
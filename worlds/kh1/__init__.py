@@ -12,7 +12,7 @@ from .Regions import connect_entrances, create_regions
 from .Rules import set_rules
 from .Presets import kh1_option_presets
 from worlds.LauncherComponents import Component, components, Type, launch as launch_component, icon_paths
-from .GenerateJSON import generate_json
+from .GenerateJSON import get_mod_data, write_mod
 from .Data import VANILLA_KEYBLADE_STATS, VANILLA_PUPPY_LOCATIONS, CHAR_TO_KH, VANILLA_ABILITY_AP_COSTS, WORLD_KEY_ITEMS
 from worlds.LauncherComponents import Component, components, Type, launch_subprocess
 
@@ -360,11 +360,15 @@ class KH1World(World):
     def connect_entrances(self):
         connect_entrances(self)
     
-    def generate_output(self, output_directory: str):
+    def get_output_state(self):
+        return get_mod_data(self)
+
+    @classmethod
+    def generate_output_isolated(cls, output_state, output_directory: str):
         """
         Generates the json file for use with mod generator.
         """
-        generate_json(self, output_directory)
+        write_mod(output_state, output_directory)
     
     def generate_early(self):
         self.determine_level_checks()
@@ -0,0 +1,35 @@
+import concurrent.futures
+import multiprocessing
+import os
+import tempfile
+import zipfile
+
+from Fill import distribute_items_restrictive
+from worlds.AutoWorld import call_output_isolated
+from ..GenerateJSON import generate_json
+from . import KH1TestBase
+
+
+class TestOutput(KH1TestBase):
+    options = {}
+
+    def test_isolated_output(self) -> None:
+        """Tests that the mod written in another process is the same as the one written from the world directly"""
+        distribute_items_restrictive(self.multiworld)
+        outputs = []
+        with tempfile.TemporaryDirectory() as world_dir, tempfile.TemporaryDirectory() as process_dir, \
+                concurrent.futures.ProcessPoolExecutor(1, multiprocessing.get_context("spawn")) as process_pool:
+            # keyblade stats are rolled while writing the output
+            self.world.random.seed(0)
+            generate_json(self.world, world_dir)
+            self.world.random.seed(0)
+            call_output_isolated(self.multiworld, self.player, process_dir, process_pool)
+            for output_dir in (world_dir, process_dir):
+                output = {}
+                for name in os.listdir(output_dir):
+                    with zipfile.ZipFile(os.path.join(output_dir, name)) as zf:
+                        output[name] = {info.filename: zf.read(info) for info in zf.infolist()}
+                outputs.append(output)
+        world_output, process_output = outputs
+        self.assertEqual(1, len(world_output))
+        self.assertEqual(world_output, process_output)